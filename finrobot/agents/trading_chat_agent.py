@@ -7,51 +7,22 @@ comprehensive forecasting information.
 """
 
 from finrobot.agents.workflow import SingleAssistant
-from finrobot.functional.quantitative import TradingStrategyAnalyzer
-from finrobot.functional.charting import MplFinanceUtils
 from finrobot.toolkits import register_toolkits
+from autogen.cache import Cache
 from typing import Dict, Any
+import asyncio
+import atexit
+import importlib
+import logging
 import autogen
 
 
-def create_trading_chat_agent(
-    llm_config: Dict[str, Any],
-    ticker: str,
-    analysis_params: Dict[str, Any],
-    last_analysis: str = "",
-    conversation_history: list = None
-) -> SingleAssistant:
-    """
-    Create a trading chat agent with specialized configuration for interactive conversations.
-    
-    Args:
-        llm_config: LLM configuration dictionary
-        ticker: Current stock ticker being analyzed
-        analysis_params: Current analysis parameters (risk_reward, stop_loss_method, etc.)
-        last_analysis: Last comprehensive analysis results
-        conversation_history: Previous conversation messages
-    
-    Returns:
-        Configured SingleAssistant agent
-    """
-    
-    # Build system prompt with context
-    context_info = f"""
-Current Analysis Context:
-- Ticker Symbol: {ticker}
-- Risk-Reward Ratio: {analysis_params.get('risk_reward', 2.0)}
-- Stop Loss Method: {analysis_params.get('stop_loss_method', 'atr')}
-- Analysis Period: {analysis_params.get('period', '6mo')}
-- Account Value: ${analysis_params.get('account_value', 10000):,.2f}
-- Risk per Trade: {analysis_params.get('risk_per_trade', 1.0)}%
-"""
-    
-    if last_analysis:
-        context_info += f"\nLast Analysis Summary:\n{last_analysis[:500]}...\n"
-    
-    system_prompt = f"""You are an expert Trading Analyst Assistant helping users understand stock analysis and make informed trading decisions.
+logger = logging.getLogger(__name__)
+
 
-{context_info}
+# Static portion of the chat agent profile; only {context} changes between agents. The context
+# goes last so every agent's prompt shares the same long prefix for provider-side prompt caching.
+_SYSTEM_PROMPT_TEMPLATE = """You are an expert Trading Analyst Assistant helping users understand stock analysis and make informed trading decisions.
 
 Your capabilities:
 1. Explain technical indicators in detail (RSI, MACD, Bollinger Bands, Moving Averages, etc.)
@@ -81,20 +52,146 @@ When the user asks questions, be thorough but concise. If they want more detail,
 When suggesting improvements, explain the reasoning clearly.
 
 Reply TERMINATE when the conversation is complete or the user indicates they're done.
+{context}"""
+
+# Analysis context block of the system prompt and the defaults for missing params
+_CONTEXT_DEFAULTS = {
+    "risk_reward": 2.0,
+    "stop_loss_method": "atr",
+    "period": "6mo",
+    "account_value": 10000,
+    "risk_per_trade": 1.0,
+}
+_CONTEXT_TEMPLATE = """
+Current Analysis Context:
+- Ticker Symbol: {ticker}
+- Risk-Reward Ratio: {risk_reward}
+- Stop Loss Method: {stop_loss_method}
+- Analysis Period: {period}
+- Account Value: ${account_value:,.2f}
+- Risk per Trade: {risk_per_trade}%
 """
+
+# Process-wide autogen disk cache, opened on first use and closed at exit
+_DISK_CACHE = None
+
+
+def _get_disk_cache():
+    """Return the shared autogen disk cache instead of reopening it every turn."""
+    global _DISK_CACHE
+    if _DISK_CACHE is None:
+        _DISK_CACHE = Cache.disk().__enter__()
+        atexit.register(_DISK_CACHE.__exit__, None, None, None)
+    return _DISK_CACHE
+
+
+# Tool schemas and executor function map captured from the first agent build
+_PREBUILT_TOOLS = None
+_PREBUILT_FMAP = None
+
+# Sliding window of chat messages kept per agent between turns
+_MAX_CHAT_HISTORY = 20
+
+
+def _trim_history(messages: list, max_len: int = _MAX_CHAT_HISTORY) -> None:
+    """Drop all but the last max_len messages in place (the system prompt is stored separately)."""
+    if len(messages) <= max_len:
+        return
+    start = len(messages) - max_len
+    # Never start on a tool result whose originating tool call was trimmed away
+    while start < len(messages) and messages[start].get("role") == "tool":
+        start += 1
+    del messages[:start]
+
+
+def create_trading_chat_agent(
+    llm_config: Dict[str, Any],
+    ticker: str,
+    analysis_params: Dict[str, Any],
+    last_analysis_head: str = "",
+    conversation_history: list = None
+) -> SingleAssistant:
+    """
+    Create a trading chat agent with specialized configuration for interactive conversations.
+    
+    Args:
+        llm_config: LLM configuration dictionary
+        ticker: Current stock ticker being analyzed
+        analysis_params: Current analysis parameters (risk_reward, stop_loss_method, etc.)
+        last_analysis_head: Summary of the last comprehensive analysis, already trimmed
+            by the caller (used verbatim in the system prompt)
+        conversation_history: Previous conversation messages
+    
+    Returns:
+        Configured SingleAssistant agent
+    """
     
-    # Create agent configuration
+    system_prompt = _build_system_prompt(ticker, analysis_params, last_analysis_head)
+    assistant = _build_agent(llm_config, system_prompt)
+
+    # Apply prior conversation turns
+    for msg in conversation_history or []:
+        role = msg.get("role", "user")
+        content = msg.get("content", "")
+        assistant.assistant.chat_messages[assistant.user_proxy].append(
+            {"role": role, "content": content}
+        )
+        assistant.user_proxy.chat_messages[assistant.assistant].append(
+            {"role": "user" if role == "assistant" else "assistant", "content": content}
+        )
+
+    return assistant
+
+
+def _build_system_prompt(
+    ticker: str, analysis_params: Dict[str, Any], last_analysis_head: str
+) -> str:
+    """Render the chat agent profile for the given analysis context."""
+    # Build system prompt with context
+    context_info = _CONTEXT_TEMPLATE.format_map(
+        {**_CONTEXT_DEFAULTS, **analysis_params, "ticker": ticker}
+    )
+    if last_analysis_head:
+        context_info += f"\nLast Analysis Summary:\n{last_analysis_head}\n"
+
+    return _SYSTEM_PROMPT_TEMPLATE.format(context=context_info)
+
+
+def _get_toolkits() -> list:
+    """Import the chat agent's tools on first use (they pull in pandas, yfinance and matplotlib)."""
+    quantitative = importlib.import_module("finrobot.functional.quantitative")
+    charting = importlib.import_module("finrobot.functional.charting")
+    return [
+        quantitative.TradingStrategyAnalyzer.comprehensive_analysis,
+        quantitative.TradingStrategyAnalyzer.analyze_trading_opportunity,
+        quantitative.TradingStrategyAnalyzer.calculate_position_size,
+        charting.MplFinanceUtils.plot_stock_price_chart,
+    ]
+
+
+def _build_agent(llm_config: Dict[str, Any], system_prompt: str) -> SingleAssistant:
+    """Construct a new trading chat agent and register its toolkits."""
+    global _PREBUILT_TOOLS, _PREBUILT_FMAP
+
+    # Create agent configuration (tools are attached below, not via the agent profile)
     agent_config = {
         "name": "Trading_Chat_Assistant",
         "profile": system_prompt,
-        "toolkits": [
-            TradingStrategyAnalyzer.comprehensive_analysis,
-            TradingStrategyAnalyzer.analyze_trading_opportunity,
-            TradingStrategyAnalyzer.calculate_position_size,
-            MplFinanceUtils.plot_stock_price_chart,
-        ]
+        "toolkits": [],
     }
     
+    # The tool set is static: reuse the schemas captured from the first build instead of
+    # re-introspecting every callable's signature and docstring
+    if _PREBUILT_TOOLS is not None:
+        assistant = SingleAssistant(
+            agent_config,
+            llm_config={**llm_config, "tools": _PREBUILT_TOOLS},
+            human_input_mode="NEVER",
+            max_consecutive_auto_reply=15,
+        )
+        assistant.user_proxy.register_function(_PREBUILT_FMAP)
+        return assistant
+    
     # Create and configure agent
     assistant = SingleAssistant(
         agent_config,
@@ -105,11 +202,17 @@ Reply TERMINATE when the conversation is complete or the user indicates they're
     
     # Register toolkits
     register_toolkits(
-        agent_config["toolkits"],
+        _get_toolkits(),
         caller=assistant.assistant,
         executor=assistant.user_proxy,
     )
     
+    _PREBUILT_TOOLS = list(assistant.assistant.llm_config["tools"])
+    _PREBUILT_FMAP = {
+        tool["function"]["name"]: assistant.user_proxy.function_map[tool["function"]["name"]]
+        for tool in _PREBUILT_TOOLS
+    }
+    
     return assistant
 
 
@@ -121,6 +224,31 @@ def process_chat_message(
     """
     Process a chat message through the trading agent.
     
+    Synchronous wrapper around aprocess_chat_message; must not be called from a
+    running event loop (await aprocess_chat_message there instead).
+    
+    Args:
+        agent: The trading chat agent
+        message: User's message
+        use_cache: Whether to use cached responses
+    
+    Returns:
+        Agent's response text
+    """
+    if not message or not message.strip():
+        return "Please enter a question."
+    return asyncio.run(aprocess_chat_message(agent, message, use_cache=use_cache))
+
+
+async def aprocess_chat_message(
+    agent: SingleAssistant,
+    message: str,
+    use_cache: bool = False
+) -> str:
+    """
+    Asynchronously process a chat message through the trading agent, so several
+    chats can be driven concurrently (e.g. with asyncio.gather).
+    
     Args:
         agent: The trading chat agent
         message: User's message
@@ -129,24 +257,28 @@ def process_chat_message(
     Returns:
         Agent's response text
     """
-    from autogen.cache import Cache
+    # Don't spend an LLM round-trip on an empty submit
+    if not message or not message.strip():
+        return "Please enter a question."
     
     result_text = "I'm here to help with your trading analysis questions!"
     
     try:
-        with Cache.disk() as cache:
-            agent.user_proxy.initiate_chat(
-                agent.assistant,
-                message=message,
-                cache=cache if use_cache else None,
-            )
+        await agent.user_proxy.a_initiate_chat(
+            agent.assistant,
+            message=message,
+            cache=_get_disk_cache() if use_cache else None,
+            clear_history=False,
+        )
         
         # Get the last message from the assistant
         if agent.assistant.chat_messages.get(agent.user_proxy):
             messages = agent.assistant.chat_messages[agent.user_proxy]
-            # Get the last message from the assistant
-            for msg in reversed(messages):
-                if msg.get("role") == "assistant" or agent.assistant.name in str(msg.get("name", "")):
+            # Get the last message from the assistant (replies are appended at the tail)
+            name = agent.assistant.name
+            for i in range(len(messages) - 1, -1, -1):
+                msg = messages[i]
+                if msg.get("role") == "assistant" or msg.get("name") == name:
                     result_text = msg.get("content", result_text)
                     break
             # If no assistant message found, get the last message
@@ -154,14 +286,16 @@ def process_chat_message(
                 result_text = messages[-1].get("content", result_text)
         
         # Don't reset here - we want to maintain context across messages
-        # The agent will maintain conversation history in its chat_messages
+        # The agent keeps a bounded window of the conversation in its chat_messages
+        _trim_history(agent.assistant.chat_messages[agent.user_proxy])
+        _trim_history(agent.user_proxy.chat_messages[agent.assistant])
         
     except Exception as e:
         result_text = f"Error processing message: {str(e)}"
         try:
             agent.reset()
-        except:
-            pass
+        except Exception as reset_error:
+            logger.debug("reset failed: %s", reset_error)
     
     return result_text
 
@@ -0,0 +1,237 @@
+"""
+Shared entry point for the Market Analyst demo scripts.
+
+start_demo.py and start_demo_gemini.py only differ in the config file, the model
+and a handful of provider-specific messages, which live in _PROVIDERS below.
+"""
+
+import os
+import sys
+
+from finrobot.utils import get_current_date, register_keys_from_json
+
+
+# Provider-specific wording used by run(); everything else is shared
+_PROVIDERS = {
+    "openai": {
+        "title": "FinRobot Demo - Market Analyst Agent",
+        "label": "OpenAI",
+        "loaded": "✓ LLM configuration loaded",
+        "initializing": "✓ Initializing Market Analyst agent...",
+        "placeholder": "<your",
+        "key_prefix": "sk-",
+        "missing_file_hint": None,
+        "invalid_key_hint": [
+            "  Please update {config_path} with a valid API key",
+        ],
+        "dependency_hint": "  - Missing dependencies",
+        "network_hint": [
+            "  - Check your internet connection",
+            "  - Try: ping api.openai.com",
+        ],
+        "rate_limit_terms": ("rate limit",),
+        "rate_limit_hint": [
+            "  - API rate limit exceeded",
+            "  - Too many requests, please wait and try again",
+        ],
+        "debug_steps": [
+            "  1. Verify API key is valid at https://platform.openai.com/api-keys",
+            "  2. Check network: curl https://api.openai.com/v1/models",
+            "  3. Verify {config_path} has correct format",
+        ],
+    },
+    "gemini": {
+        "title": "FinRobot Demo - Market Analyst Agent (Google Gemini)",
+        "label": "Gemini",
+        "loaded": "✓ Gemini LLM configuration loaded",
+        "initializing": "✓ Initializing Market Analyst agent with Gemini...",
+        "placeholder": "YOUR_",
+        "key_prefix": None,
+        "missing_file_hint": [
+            "\n  Please:",
+            "  1. Get a Gemini API key from: https://makersuite.google.com/app/apikey",
+            "  2. Update {config_path} with your API key",
+            "  3. Or create the file with your Gemini API key",
+        ],
+        "invalid_key_hint": [
+            "  Please get your API key from: https://makersuite.google.com/app/apikey",
+            "  Then update {config_path} with your API key",
+        ],
+        "dependency_hint": "  - Missing dependencies (try: pip install google-generativeai)",
+        "network_hint": [],
+        "rate_limit_terms": ("quota", "rate limit"),
+        "rate_limit_hint": [
+            "  - API rate limit exceeded",
+            "  - Quota exhausted",
+            "  - Too many requests, please wait and try again",
+        ],
+        "debug_steps": [
+            "  1. Verify API key is valid at https://makersuite.google.com/app/apikey",
+            "  2. Check network connectivity",
+            "  3. Verify {config_path} has correct format",
+        ],
+    },
+}
+
+
+# Hint lines for analysis errors, chosen in _print_error_hints
+_NETWORK_HINTS = [
+    "  - Network connectivity issue",
+    "  - API endpoint unreachable",
+    "  - Firewall blocking connection",
+]
+_AUTH_HINTS = [
+    "  - Invalid or expired API key",
+    "  - API key doesn't have required permissions",
+    "  - Check {config_path} file",
+]
+_ERR_FALLBACK = [
+    "  - Check your API keys and network connection",
+    "  - Verify {label} service status",
+    "  - Unexpected error: {error_type}",
+]
+
+
+def _print_lines(lines, config_path: str, **fields) -> None:
+    for line in lines:
+        print(line.format(config_path=config_path, **fields))
+
+
+def _print_error_hints(provider: dict, config_path: str, error_msg: str, error_type: str) -> None:
+    lowered = error_msg.lower()
+    if "Connection" in error_msg or "timeout" in lowered or "APIConnectionError" in error_type:
+        _print_lines(_NETWORK_HINTS + provider["network_hint"], config_path)
+    elif "API key" in error_msg or "authentication" in lowered or "InvalidAPIKey" in error_type:
+        _print_lines(_AUTH_HINTS, config_path)
+    elif any(term in lowered for term in provider["rate_limit_terms"]):
+        _print_lines(provider["rate_limit_hint"], config_path)
+    else:
+        _print_lines(_ERR_FALLBACK, config_path, label=provider["label"], error_type=error_type)
+
+
+def run(config_path: str, model: str, provider_hint: str) -> None:
+    """
+    Run the Market Analyst demo against one LLM provider.
+
+    Args:
+        config_path: Autogen config list file holding the provider's API key
+        model: Model name to select from the config list
+        provider_hint: Key into _PROVIDERS ("openai" or "gemini") for provider-specific messages
+    """
+    provider = _PROVIDERS[provider_hint]
+    today = get_current_date()
+
+    print("=" * 60)
+    print(provider["title"])
+    print("=" * 60)
+    print()
+
+    # Load API keys (for FinnHub, etc.)
+    try:
+        register_keys_from_json("config_api_keys")
+        print("✓ API keys loaded")
+    except Exception as e:
+        print(f"⚠ Warning: Could not load API keys: {e}")
+        print(f"  Continuing with {provider['label']} config only...")
+
+    # Configure LLM
+    try:
+        if provider["missing_file_hint"] and not os.path.exists(config_path):
+            print(f"✗ Error: {config_path} not found")
+            _print_lines(provider["missing_file_hint"], config_path)
+            return
+
+        # autogen pulls in openai, pydantic and tiktoken; only import it once we get this far
+        import autogen
+
+        # Use new LLMConfig API (replaces deprecated config_list_from_json)
+        llm_config_obj = autogen.LLMConfig.from_json(
+            path=config_path,
+            filter_dict={"model": [model]},
+        )
+        llm_config = {
+            "config_list": llm_config_obj.config_list,
+            "timeout": 120,
+            "temperature": 0,
+            # The prompt only changes with the date, so same-day reruns are served
+            # from autogen's on-disk response cache
+            "cache_seed": int(today.replace("-", "")),
+        }
+
+        # Validate API key format
+        if llm_config["config_list"]:
+            api_key = llm_config["config_list"][0].get("api_key", "")
+            if not api_key or api_key.startswith(provider["placeholder"]) or len(api_key) < 20:
+                print(f"✗ Error: Invalid or missing {provider['label']} API key in {config_path}")
+                _print_lines(provider["invalid_key_hint"], config_path)
+                return
+            if provider["key_prefix"] and not api_key.startswith(provider["key_prefix"]):
+                print(
+                    f"⚠ Warning: API key doesn't start with '{provider['key_prefix']}'. "
+                    f"It may not be a valid {provider['label']} key."
+                )
+
+        print(provider["loaded"])
+    except Exception as e:
+        print(f"✗ Error loading LLM config: {e}")
+        print(f"  Please ensure {config_path} file exists and is properly configured.")
+        return
+
+    # Create the agent
+    from finrobot.agents.workflow import SingleAssistant
+    print(provider["initializing"])
+    try:
+        assistant = SingleAssistant(
+            "Market_Analyst",
+            llm_config,
+            human_input_mode="NEVER",  # Set to "ALWAYS" for interactive mode
+            max_consecutive_auto_reply=10,
+        )
+        print("✓ Agent initialized successfully")
+    except Exception as e:
+        print(f"✗ Error initializing agent: {e}")
+        print("  This might be due to:")
+        print("  - Invalid API key format")
+        print(provider["dependency_hint"])
+        print("  - Network connectivity issues")
+        return
+
+    # Run the agent
+    print()
+    print("=" * 60)
+    print("Starting Analysis...")
+    print("=" * 60)
+    print()
+
+    company = "AAPL"  # You can change this to any stock ticker
+
+    message = (
+        f"Use all the tools provided to retrieve information available for {company} "
+        f"upon {today}. Analyze the positive developments and potential "
+        f"concerns of {company} with 2-4 most important factors respectively and keep "
+        f"them concise. Most factors should be inferred from company related news. "
+        f"Then make a rough prediction (e.g. up/down by 2-3%) of the {company} stock "
+        f"price movement for next week. Provide a summary analysis to support your prediction."
+    )
+
+    try:
+        assistant.chat(message)
+        print()
+        print("=" * 60)
+        print("Analysis Complete!")
+        print("=" * 60)
+    except KeyboardInterrupt:
+        print("\n\n⚠ Analysis interrupted by user")
+        sys.exit(0)
+    except Exception as e:
+        error_msg = str(e)
+        error_type = type(e).__name__
+        print(f"\n✗ Error during analysis: {error_msg}")
+        print(f"  Error type: {error_type}")
+        print("\n  Possible causes:")
+        _print_error_hints(provider, config_path, error_msg, error_type)
+
+        # Additional debugging info
+        print("\n  Debugging steps:")
+        _print_lines(provider["debug_steps"], config_path)
+        print(f"\n  Full error details: {error_type}: {error_msg}")
@@ -0,0 +1,293 @@
+"""
+Scalar recurrences behind the TradingStrategyAnalyzer indicators and backtest.
+
+The kernels are compiled with numba when it is installed and fall back to plain
+Python otherwise, so numba stays an optional dependency. Compiled kernels release
+the GIL, so several tickers can be processed from a thread pool.
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+@njit(cache=True, nogil=True)
+def ema_array(x, span):
+    """Exponential moving average, equivalent to pd.Series.ewm(span=span, adjust=False).mean()."""
+    alpha = 2.0 / (span + 1)
+    out = np.empty_like(x)
+    prev = x[0]
+    for i in range(len(x)):
+        prev = prev + alpha * (x[i] - prev)
+        out[i] = prev
+    return out
+
+
+@njit(cache=True, nogil=True)
+def ema_last(x, span):
+    """Last value of ema_array(x, span) without allocating the full series."""
+    alpha = 2.0 / (span + 1)
+    prev = x[0]
+    for i in range(len(x)):
+        prev = prev + alpha * (x[i] - prev)
+    return prev
+
+
+@njit(cache=True, nogil=True)
+def ema_last_two(x, span):
+    """Last two values of ema_array(x, span), as (previous, last), without allocating the full series."""
+    alpha = 2.0 / (span + 1)
+    prev = x[0]
+    last = x[0]
+    for i in range(len(x)):
+        prev = last
+        last = last + alpha * (x[i] - last)
+    return prev, last
+
+
+@njit(cache=True, nogil=True)
+def rolling_mean(x, window):
+    """Trailing simple moving average from a running sum; the first window-1 entries are NaN."""
+    n = len(x)
+    out = np.full(n, np.nan)
+    total = 0.0
+    for i in range(n):
+        total += x[i]
+        if i >= window:
+            total -= x[i - window]
+        if i >= window - 1:
+            out[i] = total / window
+    return out
+
+
+@njit(cache=True, nogil=True)
+def atr_last(high, low, close, period):
+    """Latest ATR: mean true range of the last `period` bars (NaN if there are fewer bars)."""
+    n = len(close)
+    if n < period:
+        return np.nan
+    total = 0.0
+    for i in range(n - period, n):
+        tr = high[i] - low[i]
+        if i > 0:
+            tr = max(tr, abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        total += tr
+    return total / period
+
+
+@njit(cache=True, nogil=True)
+def rolling_mean_std(x, window):
+    """
+    Trailing mean and sample standard deviation over `window` values, using Welford's
+    update with the outgoing value removed. The first window-1 entries are NaN.
+    """
+    n = len(x)
+    mean_out = np.full(n, np.nan)
+    std_out = np.full(n, np.nan)
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        if i < window:
+            delta = x[i] - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x[i] - mean)
+        else:
+            old = x[i - window]
+            old_mean = mean
+            mean += (x[i] - old) / window
+            m2 += (x[i] - old) * (x[i] - mean + old - old_mean)
+        if i >= window - 1:
+            mean_out[i] = mean
+            if window > 1:
+                std_out[i] = math.sqrt(max(m2, 0.0) / (window - 1))
+    return mean_out, std_out
+
+
+@njit(cache=True, nogil=True)
+def bb_last(close, period, num_std):
+    """Latest (upper, middle, lower, %B) Bollinger values from one Welford pass over the last `period` closes."""
+    n = len(close)
+    if n < period or period < 2:
+        return np.nan, np.nan, np.nan, np.nan
+    mean = 0.0
+    m2 = 0.0
+    k = 0
+    for i in range(n - period, n):
+        k += 1
+        delta = close[i] - mean
+        mean += delta / k
+        m2 += delta * (close[i] - mean)
+    dev = math.sqrt(m2 / (period - 1)) * num_std
+    upper = mean + dev
+    lower = mean - dev
+    if upper == lower:
+        return upper, mean, lower, np.nan
+    return upper, mean, lower, (close[-1] - lower) / (upper - lower)
+
+
+@njit(cache=True, nogil=True)
+def _rsi_from_averages(avg_gain, avg_loss):
+    if avg_loss == 0.0:
+        return 100.0 if avg_gain > 0.0 else np.nan
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@njit(cache=True, nogil=True)
+def rsi_wilder(close, period):
+    """
+    Wilder's RSI: gain and loss averages are seeded with the simple mean of the first
+    `period` price changes, then smoothed with alpha = 1/period. The first `period`
+    entries are NaN.
+    """
+    n = len(close)
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        d = close[i] - close[i - 1]
+        if d > 0:
+            avg_gain += d
+        else:
+            avg_loss -= d
+    avg_gain /= period
+    avg_loss /= period
+    out[period] = _rsi_from_averages(avg_gain, avg_loss)
+    for i in range(period + 1, n):
+        d = close[i] - close[i - 1]
+        avg_gain = (avg_gain * (period - 1) + max(d, 0.0)) / period
+        avg_loss = (avg_loss * (period - 1) + max(-d, 0.0)) / period
+        out[i] = _rsi_from_averages(avg_gain, avg_loss)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rsi_last(close, period):
+    """Last value of rsi_wilder(close, period), keeping only the two running averages."""
+    n = len(close)
+    if n <= period:
+        return np.nan
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n):
+        d = close[i] - close[i - 1]
+        gain = max(d, 0.0)
+        loss = max(-d, 0.0)
+        if i <= period:
+            avg_gain += gain / period
+            avg_loss += loss / period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+    return _rsi_from_averages(avg_gain, avg_loss)
+
+
+# Exit reason codes written by simulate_long_strategy
+EXIT_STOP_LOSS = 0
+EXIT_TARGET = 1
+EXIT_TRAILING_STOP = 2
+EXIT_BEARISH_REVERSAL = 3
+EXIT_RSI_OVERBOUGHT = 4
+EXIT_MACD_BEARISH = 5
+EXIT_BB_OVERBOUGHT = 6
+EXIT_END_OF_PERIOD = 7
+
+
+@njit(cache=True, nogil=True)
+def simulate_long_strategy(
+    close, sma_s, sma_l, rsi, macd, signal, lower_bb, upper_bb,
+    entry_price, stop_loss, target_price, use_adv, start,
+):
+    """
+    Bar-by-bar long-only simulation behind backtest_strategy_recommendations.
+
+    Returns (count, entry_idx, exit_idx, entry_prices, exit_prices, reason_codes); only
+    the first `count` entries of each array are filled. macd/signal/lower_bb/upper_bb
+    are only read when use_adv is set.
+    """
+    n = len(close)
+    entry_idx = np.empty(n, np.int64)
+    exit_idx = np.empty(n, np.int64)
+    entry_prices = np.empty(n, np.float64)
+    exit_prices = np.empty(n, np.float64)
+    reasons = np.empty(n, np.int8)
+    count = 0
+
+    in_position = False
+    entered_at = 0
+    entered_price = 0.0
+    peak = 0.0
+    for i in range(start, n):
+        price = close[i]
+        if not in_position:
+            current_rsi = rsi[i] if not np.isnan(rsi[i]) else 50.0
+            enter = (
+                sma_s[i] > sma_l[i]
+                and current_rsi < 70
+                and abs(price - entry_price) / entry_price < 0.02
+            )
+            if enter and use_adv:
+                enter = macd[i] > signal[i] and price >= lower_bb[i]
+            if enter:
+                in_position = True
+                entered_at = i
+                entered_price = price
+                peak = price
+        else:
+            peak = max(peak, price)
+            reason = -1
+            exit_price = price
+            if price <= stop_loss:
+                reason = EXIT_STOP_LOSS
+                exit_price = stop_loss
+            elif price >= target_price:
+                reason = EXIT_TARGET
+                exit_price = target_price
+            elif peak > entered_price * 1.1 and price < peak * 0.95:
+                # Trailing stop 5% below the highest close since entry, once up 10%
+                reason = EXIT_TRAILING_STOP
+                exit_price = peak * 0.95
+
+            # Indicator exits: the first matching condition decides the reason
+            if reason < 0 and use_adv:
+                if sma_s[i] < sma_l[i]:
+                    reason = EXIT_BEARISH_REVERSAL
+                elif rsi[i] > 70:
+                    reason = EXIT_RSI_OVERBOUGHT
+                elif macd[i] < signal[i]:
+                    reason = EXIT_MACD_BEARISH
+                elif price > upper_bb[i]:
+                    reason = EXIT_BB_OVERBOUGHT
+
+            if reason >= 0:
+                entry_idx[count] = entered_at
+                exit_idx[count] = i
+                entry_prices[count] = entered_price
+                exit_prices[count] = exit_price
+                reasons[count] = reason
+                count += 1
+                in_position = False
+
+    # Force exit at end of data
+    if in_position:
+        entry_idx[count] = entered_at
+        exit_idx[count] = n - 1
+        entry_prices[count] = entered_price
+        exit_prices[count] = close[n - 1]
+        reasons[count] = EXIT_END_OF_PERIOD
+        count += 1
+
+    return count, entry_idx, exit_idx, entry_prices, exit_prices, reasons
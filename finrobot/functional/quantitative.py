@@ -1,40 +1,257 @@
 import os
 import json
+import math
+import time
+import threading
 import importlib
-import yfinance as yf
-import backtrader as bt
-from backtrader.strategies import SMA_CrossOver
+import functools
 from typing import Annotated, List, Tuple, Dict
-from matplotlib import pyplot as plt
 from pprint import pformat
-from IPython import get_ipython
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from enum import IntEnum
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from ._indicator_kernels import (
+    atr_last,
+    bb_last,
+    ema_array,
+    ema_last,
+    ema_last_two,
+    rolling_mean,
+    rolling_mean_std,
+    rsi_last,
+    rsi_wilder,
+    simulate_long_strategy,
+)
 
 
-class DeployedCapitalAnalyzer(bt.Analyzer):
-    def start(self):
-        self.deployed_capital = []
-        self.initial_cash = self.strategy.broker.get_cash()  # Initial cash in account
-
-    def notify_order(self, order):
-        if order.status in [order.Completed]:
-            if order.isbuy():
-                self.deployed_capital.append(order.executed.price * order.executed.size)
-            elif order.issell():
-                self.deployed_capital.append(order.executed.price * order.executed.size)
-
-    def stop(self):
-        total_deployed = sum(self.deployed_capital)
-        final_cash = self.strategy.broker.get_value()
-        net_profit = final_cash - self.initial_cash
-        if total_deployed > 0:
-            self.retn = net_profit / total_deployed
+# Price histories keyed by fetch arguments, least recently used first. Histories ending today
+# are fetched again once older than the TTL (in memory or on disk) so recent bars stay current;
+# histories that ended before today never change and are reused indefinitely
+_HISTORY_CACHE_SIZE = 128
+_HISTORY_CACHE_TTL = 15 * 60
+_HISTORY_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "finrobot", "yf")
+_HISTORY_CACHE: "OrderedDict[tuple, Tuple[float, pd.DataFrame]]" = OrderedDict()
+_HISTORY_CACHE_LOCK = threading.Lock()
+# One lock per history key, so concurrent requests for a history (e.g. a prefetch and the
+# analysis it was started for) download and store it once
+_HISTORY_FETCH_LOCKS: "defaultdict[tuple, threading.Lock]" = defaultdict(threading.Lock)
+
+# Ticker.info dictionaries by ticker. They carry live quote fields as well as company
+# details, so they expire sooner than histories and are only kept in memory
+_INFO_CACHE_TTL = 5 * 60
+_INFO_CACHE: Dict[str, Tuple[float, dict]] = {}
+
+# Company long names by ticker, taken from history metadata or Ticker.info when either is
+# fetched anyway, so report headers don't need a request of their own
+_COMPANY_NAMES: Dict[str, str] = {}
+
+# Indicator bundles by id() of the price DataFrame they were computed from, least recently
+# used first. Entries hold their DataFrame, so its id can't be reused by another frame while
+# cached, and a hit is only taken when the held frame is the one passed in. Histories are
+# shared through the history cache, so repeat analyses of a window hit
+_INDICATOR_CACHE: "OrderedDict[int, Tuple[pd.DataFrame, Dict[str, np.ndarray]]]" = OrderedDict()
+_INDICATOR_CACHE_LOCK = threading.Lock()
+
+
+def _fetch_history(
+    ticker_symbol: str,
+    period: str | None = None,
+    start: str | None = None,
+    end: str | None = None,
+    download: bool = False,
+    refresh: bool = False,
+) -> pd.DataFrame:
+    """
+    Fetch OHLCV history through a process-wide LRU cache backed by a parquet store under
+    ~/.cache/finrobot/yf, so repeated analyses skip the Yahoo Finance round-trip.
+    Uses yf.download when download is True, otherwise Ticker.history; refresh ignores
+    cached copies and fetches again. The returned DataFrame is shared between callers
+    and must not be modified.
+    """
+    # Relative periods end today, so their store entry is keyed (and refreshed) per day
+    today = time.strftime("%Y-%m-%d")
+    end_day = end or today
+    max_age = _HISTORY_CACHE_TTL if end_day >= today else float("inf")
+    if refresh:
+        max_age = 0
+
+    key = (ticker_symbol, period, start, end_day, download)
+    now = time.time()
+    cached = _cached_history(key, now, max_age)
+    if cached is not None:
+        return cached
+
+    with _HISTORY_CACHE_LOCK:
+        fetch_lock = _HISTORY_FETCH_LOCKS[key]
+    with fetch_lock:
+        # Another thread may have fetched this history while we waited
+        cached = _cached_history(key, now, max_age)
+        if cached is not None:
+            return cached
+        return _load_history(key, ticker_symbol, period, start, end, download, now, max_age)
+
+
+def _cached_history(key: tuple, now: float, max_age: float) -> pd.DataFrame | None:
+    with _HISTORY_CACHE_LOCK:
+        cached = _HISTORY_CACHE.get(key)
+        if cached is None or now - cached[0] >= max_age:
+            return None
+        _HISTORY_CACHE.move_to_end(key)
+        return cached[1]
+
+
+def _load_history(
+    key: tuple,
+    ticker_symbol: str,
+    period: str | None,
+    start: str | None,
+    end: str | None,
+    download: bool,
+    now: float,
+    max_age: float,
+) -> pd.DataFrame:
+    """Read a history from the parquet store, or fetch it from Yahoo Finance, and remember it."""
+    path = _history_path(key)
+    data = None
+    try:
+        if os.path.exists(path) and now - os.path.getmtime(path) < max_age:
+            data = pd.read_parquet(path, engine="pyarrow", memory_map=True)
+    except Exception:
+        data = None  # Unreadable store file or pyarrow not installed
+
+    if data is None:
+        import yfinance as yf
+
+        if download:
+            data = yf.download(ticker_symbol, start, end, auto_adjust=True)
         else:
-            self.retn = 0
+            kwargs = {k: v for k, v in (("period", period), ("start", start), ("end", end)) if v}
+            ticker = yf.Ticker(ticker_symbol)
+            data = ticker.history(**kwargs)
+            try:
+                # Filled in by the history request itself, so this costs no extra round-trip
+                name = ticker.history_metadata.get("longName")
+                if name:
+                    _COMPANY_NAMES[ticker_symbol] = name
+            except Exception:
+                pass
+        if data is None or data.empty:
+            return data  # Never cache a failed fetch
+        _write_history(path, data)
+
+    _remember_history(key, data, now)
+    return data
+
+
+def _history_path(key: tuple) -> str:
+    """Parquet store file for a history cache key."""
+    return os.path.join(
+        _HISTORY_CACHE_DIR,
+        "_".join(str(part) for part in key[:4] if part) + ("_dl" if key[4] else "") + ".parquet",
+    )
+
+
+def _write_history(path: str, data: pd.DataFrame) -> None:
+    # Written under a unique name and renamed, so concurrent writers and readers of the
+    # same history (e.g. fetch_bulk and a per-ticker fetch) never see a partial file
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(_HISTORY_CACHE_DIR, exist_ok=True)
+        data.to_parquet(tmp_path, engine="pyarrow")
+        os.replace(tmp_path, path)
+    except Exception:
+        # The disk copy is best effort; just don't leave the partial file behind
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _remember_history(key: tuple, data: pd.DataFrame, now: float) -> None:
+    with _HISTORY_CACHE_LOCK:
+        _HISTORY_CACHE[key] = (now, data)
+        _HISTORY_CACHE.move_to_end(key)
+        while len(_HISTORY_CACHE) > _HISTORY_CACHE_SIZE:
+            _HISTORY_CACHE.popitem(last=False)
+
+
+def _fetch_info(ticker_symbol: str, refresh: bool = False) -> dict:
+    """Fetch Ticker.info through a short-lived in-memory cache (empty results are not cached)."""
+    now = time.time()
+    cached = _INFO_CACHE.get(ticker_symbol)
+    if cached is not None and not refresh and now - cached[0] < _INFO_CACHE_TTL:
+        return cached[1]
+
+    import yfinance as yf
+
+    info = yf.Ticker(ticker_symbol).info or {}
+    if info:
+        _INFO_CACHE[ticker_symbol] = (now, info)
+        if info.get("longName"):
+            _COMPANY_NAMES[ticker_symbol] = info["longName"]
+    return info
+
+
+def _company_name(ticker_symbol: str) -> str:
+    """Company long name for report headers, falling back to the ticker symbol."""
+    name = _COMPANY_NAMES.get(ticker_symbol)
+    if name is None:
+        try:
+            name = _fetch_info(ticker_symbol).get('longName')
+        except Exception:
+            name = None  # Info requests are often rate limited (401); the symbol will do
+    return name or ticker_symbol
+
+
+def _ohlc_arrays(data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """High, low and close columns as float64 arrays (views of the frame's data when already float64)."""
+    return (
+        data['High'].to_numpy(dtype=np.float64, copy=False),
+        data['Low'].to_numpy(dtype=np.float64, copy=False),
+        data['Close'].to_numpy(dtype=np.float64, copy=False),
+    )
+
+
+# backtrader, yfinance and matplotlib are imported where they are used, so that importing
+# TradingStrategyAnalyzer doesn't pay for them up front
+@functools.lru_cache(maxsize=None)
+def _deployed_capital_analyzer():
+    """Build the DeployedCapitalAnalyzer class on first use (it subclasses bt.Analyzer)."""
+    import backtrader as bt
 
-    def get_analysis(self):
-        return {"return_on_deployed_capital": self.retn}
+    class DeployedCapitalAnalyzer(bt.Analyzer):
+        def start(self):
+            self.deployed_capital = 0.0
+            self.initial_cash = self.strategy.broker.get_cash()  # Initial cash in account
+
+        def notify_order(self, order):
+            if order.status == order.Completed:
+                # Buys and sells both count toward the capital put to work
+                self.deployed_capital += order.executed.price * order.executed.size
+
+        def stop(self):
+            total_deployed = self.deployed_capital
+            final_cash = self.strategy.broker.get_value()
+            net_profit = final_cash - self.initial_cash
+            if total_deployed > 0:
+                self.retn = net_profit / total_deployed
+            else:
+                self.retn = 0
+
+        def get_analysis(self):
+            return {"return_on_deployed_capital": self.retn}
+
+    return DeployedCapitalAnalyzer
+
+
+def __getattr__(name):
+    if name == "DeployedCapitalAnalyzer":
+        return _deployed_capital_analyzer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class BackTraderUtils:
@@ -83,7 +300,13 @@ class BackTraderUtils:
         """
         Use the Backtrader library to backtest a trading strategy on historical stock data.
         """
-        cerebro = bt.Cerebro()
+        import backtrader as bt
+        from backtrader.strategies import SMA_CrossOver
+
+        # Indicators are precomputed in vectorized once() passes over preloaded data (any
+        # non-zero exactbars would turn that off); the default observers (cash/value,
+        # trades, buy/sell) are only needed for the plot
+        cerebro = bt.Cerebro(runonce=True, preload=True, stdstats=bool(save_fig))
 
         if strategy == "SMA_CrossOver":
             strategy_class = SMA_CrossOver
@@ -98,9 +321,13 @@ class BackTraderUtils:
         strategy_params = json.loads(strategy_params) if strategy_params else {}
         cerebro.addstrategy(strategy_class, **strategy_params)
 
-        # Create a data feed
-        data = bt.feeds.PandasData(
-            dataname=yf.download(ticker_symbol, start_date, end_date, auto_adjust=True)
+        # Create a data feed straight from the row tuples (PandasDirectData reads columns by
+        # position, so flatten yfinance's (Price, Ticker) header and put them in OHLCV order)
+        prices = _fetch_history(ticker_symbol, start=start_date, end=end_date, download=True)
+        if isinstance(prices.columns, pd.MultiIndex):
+            prices = prices.set_axis(prices.columns.get_level_values(0), axis=1)
+        data = bt.feeds.PandasDirectData(
+            dataname=prices[["Open", "High", "Low", "Close", "Volume"]], openinterest=-1
         )
         cerebro.adddata(data)  # Add the data feed
         # Set our desired cash start
@@ -136,7 +363,7 @@ class BackTraderUtils:
         cerebro.addanalyzer(bt.analyzers.DrawDown, _name="draw_down")
         cerebro.addanalyzer(bt.analyzers.Returns, _name="returns")
         cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name="trade_analyzer")
-        # cerebro.addanalyzer(DeployedCapitalAnalyzer, _name="deployed_capital")
+        # cerebro.addanalyzer(_deployed_capital_analyzer(), _name="deployed_capital")
 
         stats_dict = {"Starting Portfolio Value:": cerebro.broker.getvalue()}
 
@@ -161,62 +388,370 @@ class BackTraderUtils:
             directory = os.path.dirname(save_fig)
             if directory:
                 os.makedirs(directory, exist_ok=True)
-            plt.figure(figsize=(12, 8))
-            cerebro.plot()
-            plt.savefig(save_fig)
-            plt.close()
+            # Render off-screen with the non-interactive Agg backend and skip the volume
+            # overlay; the figure is only written to disk
+            import matplotlib
+
+            matplotlib.use("Agg")
+            from matplotlib import pyplot as plt
+
+            figs = cerebro.plot(
+                iplot=False, volume=False, subtxtsize=7, width=12, height=8, dpi=100
+            )
+            figs[0][0].savefig(save_fig)
+            for fig_group in figs:
+                for fig in fig_group:
+                    plt.close(fig)
 
         return "Back Test Finished. Results: \n" + pformat(stats_dict, indent=2)
 
 
+# Backtest exit reason labels, indexed by the EXIT_* codes from simulate_long_strategy
+_REASON_NAMES = (
+    "Stop Loss",
+    "Target Reached",
+    "Trailing Stop",
+    "Bearish Reversal",
+    "RSI Overbought",
+    "MACD Bearish",
+    "Bollinger Overbought",
+    "End of Period",
+)
+
+_BULLISH_BB_SIGNALS = frozenset(("NEUTRAL-BULLISH", "OVERSOLD"))
+
+# Bundle series whose latest values analyze_trading_opportunity_raw reads
+_LATEST_INDICATORS = ('atr', 'rsi', 'sma_short', 'sma_long', 'ema_short', 'ema_long')
+
+
+class DataFetchError(RuntimeError):
+    """No price history could be fetched for a ticker; the message is meant for the user."""
+
+
+@dataclass
+class TradeAnalysis:
+    """Result of TradingStrategyAnalyzer.analyze_trading_opportunity_raw; MACD and Bollinger fields are None when advanced indicators are off."""
+
+    ticker_symbol: str
+    current_price: float
+    trend: str
+    signal_strength: str
+    ma_bullish: bool
+    sma_short: float
+    sma_long: float
+    current_rsi: float
+    entry_price: float
+    entry_recommendation: str
+    stop_loss: float
+    target_price: float
+    risk_reward_ratio: float
+    risk: float
+    support: float
+    resistance: float
+    entry_timing: List[str] = field(default_factory=list)
+    macd: float | None = None
+    macd_signal_line: float | None = None
+    macd_histogram: float | None = None
+    macd_histogram_prev: float | None = None  # None when there is a single bar
+    macd_signal: str | None = None
+    bb_upper: float | None = None
+    bb_middle: float | None = None
+    bb_lower: float | None = None
+    bb_percent_b: float | None = None
+    bb_signal: str | None = None
+    bb_position: str | None = None
+
+    def format(self) -> str:
+        return _format_analysis(self)
+
+
+def _format_analysis(ta: TradeAnalysis) -> str:
+    """Render a TradeAnalysis as the report returned by analyze_trading_opportunity."""
+    optimal_entry_timing = "\n".join(f"  • {timing}" for timing in ta.entry_timing)
+    
+    # Format output with explanations
+    parts = [f"""
+╔══════════════════════════════════════════════════════════════╗
+║          TRADING STRATEGY ANALYSIS - {ta.ticker_symbol:^10}          ║
+╚══════════════════════════════════════════════════════════════╝
+
+📊 CURRENT MARKET DATA:
+   Current Price: ${ta.current_price:.2f}
+   Trend: {ta.trend} ({'Price is generally moving UP' if ta.trend == 'BULLISH' else 'Price is generally moving DOWN'})
+   Signal Strength: {ta.signal_strength} ({'Multiple indicators agree - Higher confidence' if ta.signal_strength == 'STRONG' else 'Mixed signals - Proceed with caution' if ta.signal_strength == 'MODERATE' else 'Indicators disagree - Wait for better setup'})
+   
+   📈 Moving Averages (Shows price trend over time):
+   • Short MA (20 days): ${ta.sma_short:.2f} - Recent average price
+   • Long MA (50 days): ${ta.sma_long:.2f} - Longer-term average price
+   • Interpretation: {'Short MA above Long MA = BULLISH trend (price likely to continue up)' if ta.ma_bullish else 'Short MA below Long MA = BEARISH trend (price likely to continue down)'}
+   
+   📊 RSI (Relative Strength Index): {ta.current_rsi:.2f}
+   • What it means: {'OVERSOLD (below 30) - Stock may bounce back up - Good BUY opportunity' if ta.current_rsi < 30 else 'OVERBOUGHT (above 70) - Stock may pull back - Consider SELLING or waiting' if ta.current_rsi > 70 else 'Neutral (30-70) - Stock moving at healthy pace'}
+   • Simple explanation: Like a speedometer - too fast (overbought) or too slow (oversold)"""]
+    
+    # Add MACD info if available
+    if ta.macd is not None:
+        macd_explanation = "BULLISH - MACD above Signal = Momentum building (like green traffic light)" if ta.macd_signal == "BULLISH" else "BEARISH - MACD below Signal = Momentum slowing (like red traffic light)"
+        hist_trend = ""
+        if ta.macd_histogram_prev is not None:
+            hist_trend = "Increasing = Strong momentum" if ta.macd_histogram > ta.macd_histogram_prev else "Decreasing = Momentum weakening"
+        else:
+            hist_trend = "Initial reading"
+        
+        parts.append(f"""
+   
+📈 MACD INDICATOR (Shows momentum changes):
+   MACD Line: {ta.macd:.4f}
+   Signal Line: {ta.macd_signal_line:.4f}
+   Histogram: {ta.macd_histogram:.4f} ({hist_trend})
+   Signal: {ta.macd_signal} - {macd_explanation}
+   • Simple explanation: Like a traffic light - green (bullish) when MACD crosses above Signal, red (bearish) when it crosses below""")
+    
+    # Add Bollinger Bands info if available
+    if ta.bb_position is not None:
+        bb_explanation = ""
+        if ta.bb_signal == "OVERSOLD":
+            bb_explanation = "Price at LOWER band = OVERSOLD - May bounce up (potential BUY signal)"
+        elif ta.bb_signal == "OVERBOUGHT":
+            bb_explanation = "Price at UPPER band = OVERBOUGHT - May pull back (potential SELL signal)"
+        elif ta.bb_signal == "NEUTRAL-BULLISH":
+            bb_explanation = "Price in upper half of bands - Slightly bullish"
+        else:
+            bb_explanation = "Price in lower half of bands - Slightly bearish"
+        
+        parts.append(f"""
+   
+📊 BOLLINGER BANDS (Shows price boundaries and volatility):
+   Upper Band: ${ta.bb_upper:.2f} (Like a ceiling - price rarely goes above)
+   Middle Band: ${ta.bb_middle:.2f} (Average price - center of the band)
+   Lower Band: ${ta.bb_lower:.2f} (Like a floor - price rarely goes below)
+   %B: {ta.bb_percent_b:.2f} ({'0 = at lower band, 1 = at upper band, 0.5 = at middle'})
+   Position: {ta.bb_position}
+   • Interpretation: {bb_explanation}
+   • Simple explanation: Like a rubber band - when price touches edges, it often bounces back toward middle""")
+    
+    parts.append(f"""
+
+🎯 TRADING RECOMMENDATIONS:
+   Entry Price: ${ta.entry_price:.2f}
+   Entry Strategy: {ta.entry_recommendation}
+   
+   🛡️ Stop Loss: ${ta.stop_loss:.2f} ({((ta.stop_loss/ta.entry_price - 1) * 100):.2f}%)
+   • What it means: Maximum price you're willing to lose per share
+   • Why it matters: Protects you from big losses - automatically sell if price drops to this level
+   • Simple explanation: Like a safety net - if trade goes wrong, you exit here to limit losses
+   
+   🎯 Target Price: ${ta.target_price:.2f} ({((ta.target_price/ta.entry_price - 1) * 100):.2f}%)
+   • What it means: Price level where you should consider taking profit
+   • Why it matters: Helps you know when to sell and lock in gains
+   • Simple explanation: Like a finish line - when price reaches here, consider selling to take profit
+   
+   💰 Risk-Reward: {ta.risk_reward_ratio:.1f}:1
+   • What it means: {f'You risk ${ta.risk:.2f} to potentially make ${(ta.target_price - ta.entry_price):.2f}'}
+   • Why it matters: {'Good ratio - potential reward is greater than risk' if ta.risk_reward_ratio >= 2.0 else 'Consider improving ratio - reward should be at least 2x the risk'}
+   • Simple explanation: Like betting odds - {f'Risk $1 to make ${ta.risk_reward_ratio:.1f}'} - Only take trades where reward > risk
+   
+   Risk per Share: ${ta.risk:.2f} per share
+   Potential Reward: ${(ta.target_price - ta.entry_price):.2f} per share
+
+📈 TECHNICAL LEVELS (Historical price boundaries):
+   Support: ${ta.support:.2f}
+   • What it means: Price level where buyers often step in (like a floor)
+   • How to use: Good place to buy, set stop loss just below this level
+   • Simple explanation: Like a safety net - price often bounces up from here
+   
+   Resistance: ${ta.resistance:.2f}
+   • What it means: Price level where sellers often step in (like a ceiling)
+   • How to use: Good place to sell, set target price near this level
+   • Simple explanation: Like a ceiling - price often bounces down from here
+
+⏰ OPTIMAL ENTRY TIMING:
+{optimal_entry_timing}
+
+⚠️  RISK DISCLAIMER:
+   This analysis is for informational purposes only and should not be
+   considered as financial advice. Always do your own research and
+   consider your risk tolerance before making any trading decisions.
+""")
+    
+    return "".join(parts)
+
+
+class Mode(IntEnum):
+    """Overall recommendation of comprehensive_analysis, from the trend and signal strength."""
+
+    STRONG_BUY = 0
+    BUY = 1
+    WAIT = 2
+    CAUTION = 3
+
+
+def _classify(trend: str, signal_strength: str) -> Mode:
+    if trend == "BULLISH" and signal_strength == "STRONG":
+        return Mode.STRONG_BUY
+    if trend == "BULLISH" and signal_strength == "MODERATE":
+        return Mode.BUY
+    if signal_strength == "WEAK" or trend == "BEARISH":
+        return Mode.WAIT
+    return Mode.CAUTION
+
+
+# comprehensive_analysis report text per Mode: (direction, timeframe, confidence) of the
+# price forecast, (recommendation, best entry) for when to buy, and the kid-friendly
+# explanation and summary templates, filled in with str.format
+_FORECASTS = {
+    Mode.STRONG_BUY: ("UP", "1-3 months", "HIGH"),
+    Mode.BUY: ("UP", "1-3 months", "MODERATE"),
+    Mode.WAIT: ("DOWN or SIDEWAYS", "Wait for better entry", "LOW"),
+    Mode.CAUTION: ("SIDEWAYS", "1-2 months", "MODERATE"),
+}
+
+_BUY_RECOMMENDATIONS = {
+    Mode.STRONG_BUY: ("✅ STRONG BUY - Multiple indicators agree, good time to enter", "Buy now or on any small pullback"),
+    Mode.BUY: ("✅ BUY - Good opportunity, but watch for confirmation", "Buy on pullback to support or moving average"),
+    Mode.WAIT: ("⏸️ WAIT - Weak signals or bearish trend detected", "Wait for trend reversal or stronger bullish signals"),
+    Mode.CAUTION: ("⚠️ CAUTION - Mixed signals, proceed carefully", "Wait for clearer signals or better entry point"),
+}
+
+_KID_EXPLANATION_GOOD = """
+   🎉 GOOD NEWS! This stock looks like a good opportunity right now!
+   
+   • What's happening: The stock is in an UPTREND (going up) and multiple indicators agree
+   • What to do: This is a good time to BUY, but remember:
+     - Only invest money you can afford to lose
+     - Buy {num_shares} shares at ${entry_price:.2f} each
+     - Set a stop loss at ${stop_loss:.2f} (like a safety net)
+     - Target price is ${target_price:.2f} (where you might want to sell)
+   
+   • Think of it like: You're buying a toy that might increase in value. You set a safety 
+     net (stop loss) so if it goes wrong, you don't lose too much. And you have a goal 
+     price (target) where you might want to sell and take your profit.
+   
+   • Next steps: 
+     1. Make sure you have ${total_cost:,.2f} available
+     2. Buy {num_shares} shares at ${entry_price:.2f} or better
+     3. Set your stop loss at ${stop_loss:.2f}
+     4. Watch the stock and consider selling at ${target_price:.2f}
+"""
+
+_KID_EXPLANATION_WAIT = """
+   ⚠️ WAIT! This stock is not a good buy right now.
+   
+   • What's happening: The stock is in a DOWNTREND (going down) or signals are weak
+   • What to do: WAIT and watch. Don't buy yet!
+   
+   • Think of it like: You're at a store and the item you want is on sale, but it might 
+     go on an even better sale later. It's better to wait for a clearer sign that it's 
+     the right time to buy.
+   
+   • What to watch for:
+     - Stock price stops falling and starts rising
+     - Multiple indicators turn bullish (positive)
+     - Price moves above key moving averages
+   
+   • Next steps:
+     1. Don't buy right now - wait for better signals
+     2. Check back in a few days or weeks
+     3. Look for the stock to show signs of recovery
+     4. Consider looking at other stocks with stronger buy signals
+"""
+
+_KID_EXPLANATION_MIXED = """
+   🤔 MIXED SIGNALS - Be careful!
+   
+   • What's happening: Some indicators say buy, others say wait - they don't all agree
+   • What to do: PROCEED WITH CAUTION or wait for clearer signals
+   
+   • Think of it like: You're trying to decide if you should buy something, but half 
+     your friends say yes and half say no. It's better to wait until more people agree 
+     or you get more information.
+   
+   • Next steps:
+     1. Wait for stronger confirmation (2+ indicators agreeing)
+     2. Or if you do buy, use a smaller position size
+     3. Be extra careful with your stop loss
+     4. Consider waiting a few days for clearer signals
+"""
+
+_KID_EXPLANATIONS = {
+    Mode.STRONG_BUY: _KID_EXPLANATION_GOOD,
+    Mode.BUY: _KID_EXPLANATION_MIXED,
+    Mode.WAIT: _KID_EXPLANATION_WAIT,
+    Mode.CAUTION: _KID_EXPLANATION_MIXED,
+}
+
+_SUMMARY_BUY = """   1. ✅ This is a STRONG BUY opportunity
+   2. 💰 Prepare ${total_cost:,.2f} to buy {num_shares} shares
+   3. 📈 Buy at ${entry_price:.2f} or better
+   4. 🛡️ Set stop loss at ${stop_loss:.2f} (protects you from big losses)
+   5. 🎯 Target price: ${target_price:.2f} (consider selling here)
+   6. ⏰ Timeframe: {forecast_timeframe}
+   7. 📊 Expected move: {expected_move:.2f}% up
+"""
+
+_SUMMARY_WAIT = """   1. ⏸️ WAIT - Not a good time to buy
+   2. 👀 Watch for trend reversal or stronger signals
+   3. 📊 Check back in a few days/weeks
+   4. 🔍 Look for other stocks with better opportunities
+   5. 📚 Use this time to learn more about the company
+"""
+
+_SUMMARY_CAUTION = """   1. ⚠️ CAUTION - Mixed signals
+   2. 🤔 Wait for stronger confirmation
+   3. 💡 If buying, use smaller position size
+   4. 🛡️ Be extra careful with stop loss
+   5. 📊 Monitor closely for clearer signals
+"""
+
+_SUMMARIES = {
+    Mode.STRONG_BUY: _SUMMARY_BUY,
+    Mode.BUY: _SUMMARY_CAUTION,
+    Mode.WAIT: _SUMMARY_WAIT,
+    Mode.CAUTION: _SUMMARY_CAUTION,
+}
+
+
 class TradingStrategyAnalyzer:
     """
     Analyzes trading opportunities and calculates entry price, stop loss, target price, and optimal entry timing.
     """
 
     @staticmethod
-    def calculate_atr(data: pd.DataFrame, period: int = 14) -> pd.Series:
+    def calculate_atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
         """Calculate Average True Range (ATR) for volatility-based stop loss."""
-        high = data['High']
-        low = data['Low']
-        close = data['Close']
-        
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
+        prev_close = np.empty_like(close)
+        prev_close[0] = np.nan
+        prev_close[1:] = close[:-1]
         
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(window=period).mean()
+        # fmax ignores the missing previous close on the first bar (TR = high - low there)
+        tr = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+        atr = rolling_mean(tr, period)
         
         return atr
 
     @staticmethod
-    def calculate_support_resistance(data: pd.DataFrame, window: int = 20) -> Dict[str, float]:
+    def calculate_support_resistance(high: np.ndarray, low: np.ndarray, close: np.ndarray, window: int = 20) -> Dict[str, float]:
         """Calculate support and resistance levels using local minima and maxima."""
-        close = data['Close']
-        high = data['High']
-        low = data['Low']
+        # Find local minima (support) and maxima (resistance) over a centered window;
+        # the first and last `window` bars have incomplete windows and are never pivots
+        win = 2 * window + 1
+        is_support = np.zeros(len(low), dtype=bool)
+        is_resistance = np.zeros(len(high), dtype=bool)
+        if len(close) >= win:
+            centre = slice(window, len(close) - window)
+            is_support[centre] = low[centre] == sliding_window_view(low, win).min(axis=1)
+            is_resistance[centre] = high[centre] == sliding_window_view(high, win).max(axis=1)
+        support_levels = low[is_support]
+        resistance_levels = high[is_resistance]
         
-        # Find local minima (support) and maxima (resistance)
-        support_levels = []
-        resistance_levels = []
-        
-        for i in range(window, len(data) - window):
-            # Support: local minimum
-            if low.iloc[i] == low.iloc[i-window:i+window+1].min():
-                support_levels.append(low.iloc[i])
-            # Resistance: local maximum
-            if high.iloc[i] == high.iloc[i-window:i+window+1].max():
-                resistance_levels.append(high.iloc[i])
-        
-        current_price = close.iloc[-1]
+        current_price = close[-1]
         
         # Find nearest support and resistance
-        support_below = [s for s in support_levels if s < current_price]
-        resistance_above = [r for r in resistance_levels if r > current_price]
+        support_below = support_levels[support_levels < current_price]
+        resistance_above = resistance_levels[resistance_levels > current_price]
         
-        nearest_support = max(support_below) if support_below else current_price * 0.95
-        nearest_resistance = min(resistance_above) if resistance_above else current_price * 1.05
+        nearest_support = support_below.max() if support_below.size else current_price * 0.95
+        nearest_resistance = resistance_above.min() if resistance_above.size else current_price * 1.05
         
         return {
             'support': nearest_support,
@@ -225,38 +760,27 @@ class TradingStrategyAnalyzer:
         }
 
     @staticmethod
-    def calculate_rsi(data: pd.DataFrame, period: int = 14) -> pd.Series:
-        """Calculate Relative Strength Index (RSI) for entry timing."""
-        close = data['Close']
-        delta = close.diff()
-        
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return rsi
+    def calculate_rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+        """Calculate Relative Strength Index (RSI) with Wilder's smoothing for entry timing."""
+        return rsi_wilder(close, period)
 
     @staticmethod
-    def calculate_moving_averages(data: pd.DataFrame, short_period: int = 20, long_period: int = 50) -> Dict[str, pd.Series]:
+    def calculate_moving_averages(close: np.ndarray, short_period: int = 20, long_period: int = 50) -> Dict[str, np.ndarray]:
         """Calculate short and long term moving averages."""
-        close = data['Close']
         return {
-            'sma_short': close.rolling(window=short_period).mean(),
-            'sma_long': close.rolling(window=long_period).mean(),
-            'ema_short': close.ewm(span=short_period, adjust=False).mean(),
-            'ema_long': close.ewm(span=long_period, adjust=False).mean()
+            'sma_short': rolling_mean(close, short_period),
+            'sma_long': rolling_mean(close, long_period),
+            'ema_short': ema_array(close, short_period),
+            'ema_long': ema_array(close, long_period)
         }
 
     @staticmethod
-    def calculate_macd(data: pd.DataFrame, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> Dict[str, pd.Series]:
+    def calculate_macd(close: np.ndarray, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> Dict[str, np.ndarray]:
         """Calculate MACD (Moving Average Convergence Divergence) indicator."""
-        close = data['Close']
-        ema_fast = close.ewm(span=fast_period, adjust=False).mean()
-        ema_slow = close.ewm(span=slow_period, adjust=False).mean()
+        ema_fast = ema_array(close, fast_period)
+        ema_slow = ema_array(close, slow_period)
         macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
+        signal_line = ema_array(macd_line, signal_period)
         histogram = macd_line - signal_line
         
         return {
@@ -266,26 +790,395 @@ class TradingStrategyAnalyzer:
         }
 
     @staticmethod
-    def calculate_bollinger_bands(data: pd.DataFrame, period: int = 20, num_std: float = 2.0) -> Dict[str, pd.Series]:
+    def calculate_bollinger_bands(close: np.ndarray, period: int = 20, num_std: float = 2.0) -> Dict[str, np.ndarray]:
         """Calculate Bollinger Bands indicator."""
-        close = data['Close']
-        sma = close.rolling(window=period).mean()
-        std = close.rolling(window=period).std()
+        sma, std = rolling_mean_std(close, period)
+        
+        upper_band = sma + (std * num_std)
+        lower_band = sma - (std * num_std)
+        middle_band = sma
+        
+        # Calculate %B (position within bands)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percent_b = (close - lower_band) / (upper_band - lower_band)
+            bandwidth = (upper_band - lower_band) / middle_band
+        
+        return {
+            'upper': upper_band,
+            'middle': middle_band,
+            'lower': lower_band,
+            'percent_b': percent_b,
+            'bandwidth': bandwidth
+        }
+
+    @staticmethod
+    def compute_indicator_bundle(data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Compute every indicator series used by analyze_trading_opportunity_raw and
+        backtest_strategy_recommendations once, for passing to both as indicators=.
+        
+        Args:
+            data: OHLC history (e.g. from the history cache); must not be modified afterwards,
+                since bundles are memoized per DataFrame
+        
+        Returns:
+            Dictionary of float64 arrays aligned with data: atr, rsi, sma_short, sma_long,
+            ema_short, ema_long, macd, signal, histogram, bb_upper, bb_middle, bb_lower
+            and bb_percent_b
+        """
+        with _INDICATOR_CACHE_LOCK:
+            cached = _INDICATOR_CACHE.get(id(data))
+            if cached is not None and cached[0] is data:
+                _INDICATOR_CACHE.move_to_end(id(data))
+                return cached[1]
+        
+        high, low, close = _ohlc_arrays(data)
+        macd = TradingStrategyAnalyzer.calculate_macd(close)
+        bb = TradingStrategyAnalyzer.calculate_bollinger_bands(close)
+        bundle = {
+            'atr': TradingStrategyAnalyzer.calculate_atr(high, low, close),
+            'rsi': TradingStrategyAnalyzer.calculate_rsi(close),
+            **TradingStrategyAnalyzer.calculate_moving_averages(close),
+            'macd': macd['macd'],
+            'signal': macd['signal'],
+            'histogram': macd['histogram'],
+            'bb_upper': bb['upper'],
+            'bb_middle': bb['middle'],
+            'bb_lower': bb['lower'],
+            'bb_percent_b': bb['percent_b'],
+        }
+        
+        with _INDICATOR_CACHE_LOCK:
+            _INDICATOR_CACHE[id(data)] = (data, bundle)
+            _INDICATOR_CACHE.move_to_end(id(data))
+            while len(_INDICATOR_CACHE) > _HISTORY_CACHE_SIZE:
+                _INDICATOR_CACHE.popitem(last=False)
+        return bundle
+
+    @staticmethod
+    def _compute_indicators(
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        atr_period: int = 14,
+        rsi_period: int = 14,
+        short_period: int = 20,
+        long_period: int = 50,
+    ) -> Dict[str, float]:
+        """
+        Compute the latest ATR, RSI and moving averages used by analyze_trading_opportunity
+        in one pass over contiguous float64 arrays (same definitions as the calculate_* methods).
+        """
+        n = len(close)
+        
+        # Simple moving averages from one cumulative sum
+        cs = np.concatenate(([0.0], np.cumsum(close)))
+        
+        def sma_last(w):
+            return (cs[-1] - cs[-1 - w]) / w if n >= w else np.nan
+        
+        return {
+            'atr': atr_last(high, low, close, atr_period),
+            'rsi': rsi_last(close, rsi_period),
+            'sma_short': sma_last(short_period),
+            'sma_long': sma_last(long_period),
+            'ema_short': ema_last(close, short_period),
+            'ema_long': ema_last(close, long_period),
+        }
+
+    @staticmethod
+    def _macd_last(
+        close: np.ndarray, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9
+    ) -> Tuple[float, float, float, float]:
+        """Latest (macd, signal, histogram, previous histogram) without building the full series."""
+        # Only the MACD line is needed in full (it feeds the signal line EMA)
+        macd_line = ema_array(close, fast_period) - ema_array(close, slow_period)
+        signal_prev, signal_last = ema_last_two(macd_line, signal_period)
+        hist_prev = macd_line[-2] - signal_prev if len(close) > 1 else np.nan
+        return macd_line[-1], signal_last, macd_line[-1] - signal_last, hist_prev
+
+    @staticmethod
+    def _bollinger_last(
+        close: np.ndarray, period: int = 20, num_std: float = 2.0
+    ) -> Tuple[float, float, float, float]:
+        """Latest (upper, middle, lower, %B) Bollinger values."""
+        return bb_last(close, period, num_std)
+
+    @staticmethod
+    def analyze_trading_opportunity_raw(
+        ticker_symbol: Annotated[
+            str, "Ticker symbol of the stock (e.g., 'AAPL' for Apple)"
+        ],
+        period: Annotated[
+            str, "Time period for analysis: '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max'"
+        ] = "6mo",
+        risk_reward_ratio: Annotated[
+            float, "Risk-reward ratio for target price calculation (e.g., 2.0 means target is 2x the risk). Default is 2.0"
+        ] = 2.0,
+        stop_loss_method: Annotated[
+            str, "Method for stop loss: 'atr' (Average True Range), 'percentage' (fixed %), 'support' (nearest support level). Default is 'atr'"
+        ] = "atr",
+        stop_loss_percentage: Annotated[
+            float, "Percentage for stop loss if method is 'percentage' (e.g., 2.0 for 2%). Default is 2.0"
+        ] = 2.0,
+        atr_multiplier: Annotated[
+            float, "Multiplier for ATR-based stop loss (e.g., 2.0 means stop loss is 2x ATR). Default is 2.0"
+        ] = 2.0,
+        use_advanced_indicators: Annotated[
+            bool, "Whether to use MACD and Bollinger Bands for enhanced analysis. Default is True"
+        ] = True,
+        refresh: Annotated[
+            bool, "Fetch prices again instead of using cached data. Default is False"
+        ] = False,
+        indicators: Dict[str, np.ndarray] | None = None,
+    ) -> "TradeAnalysis":
+        """
+        Compute the trading recommendation for a stock (entry price, stop loss, target price
+        and entry timing) without formatting it. Pass indicators (from
+        compute_indicator_bundle on the same history) to reuse already computed series.
+        
+        Raises DataFetchError when no price history could be fetched.
+        """
+        # Fetch stock data with error handling and retry
+        # Try to fetch data with retry logic
+        max_retries = 3
+        data = None
+        last_error = None
+        
+        for attempt in range(max_retries):
+            try:
+                data = _fetch_history(ticker_symbol, period=period, refresh=refresh)
+                if data is not None and not data.empty:
+                    break
+            except Exception as e:
+                last_error = str(e)
+                if attempt < max_retries - 1:
+                    time.sleep(2 ** attempt)  # Exponential backoff: 1s, 2s, 4s
+                continue
+        
+        if data is None or data.empty:
+            error_msg = f"Error: Unable to fetch data for {ticker_symbol}"
+            if last_error:
+                if "401" in last_error or "Unauthorized" in last_error:
+                    error_msg += "\n\n⚠️ Yahoo Finance API Error: Access denied. This may be due to:\n"
+                    error_msg += "  • Rate limiting (too many requests)\n"
+                    error_msg += "  • Yahoo Finance API restrictions\n"
+                    error_msg += "  • Network/authentication issues\n\n"
+                    error_msg += "💡 Solutions:\n"
+                    error_msg += "  • Wait a few minutes and try again\n"
+                    error_msg += "  • Check your internet connection\n"
+                    error_msg += "  • Try a different ticker symbol\n"
+                    error_msg += "  • Consider using an alternative data source"
+                else:
+                    error_msg += f"\n\nTechnical error: {last_error}"
+            raise DataFetchError(error_msg)
+        
+        # Calculate technical indicators in a single pass over the OHLC arrays
+        high, low, close = _ohlc_arrays(data)
+        if indicators is None:
+            latest = TradingStrategyAnalyzer._compute_indicators(high, low, close)
+        else:
+            latest = {name: indicators[name][-1] for name in _LATEST_INDICATORS}
+        
+        current_price = close[-1]
+        current_atr = latest['atr'] if not math.isnan(latest['atr']) else current_price * 0.02
+        
+        support_resistance = TradingStrategyAnalyzer.calculate_support_resistance(high, low, close)
+        current_rsi = latest['rsi'] if not math.isnan(latest['rsi']) else 50
+        
+        sma_short = latest['sma_short']
+        sma_long = latest['sma_long']
+        ema_short = latest['ema_short']
+        ema_long = latest['ema_long']
+        
+        # Determine trend with multiple confirmations
+        ma_bullish = sma_short > sma_long and ema_short > ema_long
+        trend = "BULLISH" if ma_bullish else "BEARISH"
+        
+        # MACD confirmation
+        macd_signal = None
+        current_macd = current_signal = current_histogram = prev_histogram = None
+        if use_advanced_indicators:
+            if indicators is None:
+                current_macd, current_signal, current_histogram, prev_histogram = (
+                    TradingStrategyAnalyzer._macd_last(close)
+                )
+            else:
+                current_macd = indicators['macd'][-1]
+                current_signal = indicators['signal'][-1]
+                current_histogram = indicators['histogram'][-1]
+                prev_histogram = indicators['histogram'][-2] if len(close) > 1 else None
+            if len(close) <= 1:
+                prev_histogram = None
+            
+            # MACD bullish: MACD line above signal line and histogram increasing
+            macd_bullish = current_macd > current_signal and current_histogram > (prev_histogram or 0)
+            macd_signal = "BULLISH" if macd_bullish else "BEARISH"
+        
+        # Bollinger Bands analysis
+        bb_signal = None
+        bb_position = None
+        upper_bb = middle_bb = lower_bb = percent_b = None
+        if use_advanced_indicators:
+            if indicators is None:
+                upper_bb, middle_bb, lower_bb, percent_b = TradingStrategyAnalyzer._bollinger_last(close)
+            else:
+                upper_bb = indicators['bb_upper'][-1]
+                middle_bb = indicators['bb_middle'][-1]
+                lower_bb = indicators['bb_lower'][-1]
+                percent_b = indicators['bb_percent_b'][-1]
+            
+            if current_price < lower_bb:
+                bb_signal = "OVERSOLD"
+                bb_position = "Below Lower Band"
+            elif current_price > upper_bb:
+                bb_signal = "OVERBOUGHT"
+                bb_position = "Above Upper Band"
+            elif current_price > middle_bb:
+                bb_signal = "NEUTRAL-BULLISH"
+                bb_position = "Upper Half"
+            else:
+                bb_signal = "NEUTRAL-BEARISH"
+                bb_position = "Lower Half"
+        
+        # Calculate entry price with advanced indicator confirmation: one bit per
+        # indicator (MA, MACD, BB) in separate bullish and bearish masks, since a
+        # disabled or neutral indicator votes for neither side
+        bullish_bits = (
+            (int(ma_bullish) << 2)
+            | ((macd_signal == "BULLISH") << 1)
+            | (bb_signal in _BULLISH_BB_SIGNALS)
+        )
+        bearish_bits = (
+            (int(not ma_bullish) << 2)
+            | ((macd_signal == "BEARISH") << 1)
+            | (bb_signal == "OVERBOUGHT")
+        )
+        bullish_signals = bullish_bits.bit_count()
+        bearish_signals = bearish_bits.bit_count()
+        
+        # Enhanced entry logic
+        if bullish_signals >= 2:
+            # Strong bullish setup
+            if bb_signal == "OVERSOLD":
+                entry_price = lower_bb if use_advanced_indicators else support_resistance['support']
+                entry_recommendation = "BUY: Oversold condition with bullish momentum"
+            else:
+                entry_price = min(current_price, max(support_resistance['support'], sma_short))
+                entry_recommendation = "BUY: Multiple bullish signals confirmed"
+        elif bearish_signals >= 2:
+            entry_price = current_price
+            entry_recommendation = "CAUTION: Multiple bearish signals. Wait for reversal or avoid."
+        elif trend == "BULLISH":
+            entry_price = min(current_price, max(support_resistance['support'], sma_short))
+            entry_recommendation = "BUY on pullback to support or moving average"
+        else:
+            entry_price = current_price
+            entry_recommendation = "CAUTION: Bearish trend detected. Consider waiting for trend reversal."
+        
+        # Calculate stop loss
+        if stop_loss_method == "atr":
+            stop_loss = entry_price - (atr_multiplier * current_atr)
+        elif stop_loss_method == "percentage":
+            stop_loss = entry_price * (1 - stop_loss_percentage / 100)
+        elif stop_loss_method == "support":
+            stop_loss = support_resistance['support'] * 0.98  # Slightly below support
+        else:
+            stop_loss = entry_price * 0.98  # Default 2% stop loss
+        
+        # Ensure stop loss is reasonable
+        if stop_loss > entry_price * 0.95:  # Not more than 5% below entry
+            stop_loss = entry_price * 0.97
+        
+        # Calculate target price based on risk-reward ratio
+        risk = entry_price - stop_loss
+        target_price = entry_price + (risk * risk_reward_ratio)
+        
+        # Also consider resistance level
+        if target_price > support_resistance['resistance']:
+            target_price = support_resistance['resistance'] * 0.99  # Slightly below resistance
+        
+        # Determine optimal entry timing with advanced indicators
+        entry_timing = []
+        signal_strength = "MODERATE"
+        
+        # RSI-based timing
+        if current_rsi < 30:
+            entry_timing.append("RSI indicates OVERSOLD - Good entry opportunity")
+            signal_strength = "STRONG" if bullish_signals >= 2 else signal_strength
+        elif current_rsi > 70:
+            entry_timing.append("RSI indicates OVERBOUGHT - Wait for pullback")
+        elif 30 <= current_rsi <= 50:
+            entry_timing.append("RSI in neutral zone - Good entry zone")
+        
+        # Moving average crossover
+        if ema_short > ema_long and sma_short > sma_long:
+            entry_timing.append("Moving averages show BULLISH momentum")
+        elif ema_short < ema_long and sma_short < sma_long:
+            entry_timing.append("Moving averages show BEARISH momentum - Wait for reversal")
+        
+        # MACD signals
+        if use_advanced_indicators:
+            if macd_signal == "BULLISH":
+                entry_timing.append("MACD shows BULLISH crossover - Momentum building")
+                signal_strength = "STRONG" if bullish_signals >= 2 else signal_strength
+            elif macd_signal == "BEARISH":
+                entry_timing.append("MACD shows BEARISH signal - Wait for reversal")
+        
+        # Bollinger Bands signals
+        if use_advanced_indicators:
+            if bb_signal == "OVERSOLD":
+                entry_timing.append(f"Bollinger Bands: OVERSOLD ({bb_position}) - Potential bounce")
+                signal_strength = "STRONG"
+            elif bb_signal == "OVERBOUGHT":
+                entry_timing.append(f"Bollinger Bands: OVERBOUGHT ({bb_position}) - Wait for pullback")
+            else:
+                entry_timing.append(f"Bollinger Bands: {bb_position} - {bb_signal}")
         
-        upper_band = sma + (std * num_std)
-        lower_band = sma - (std * num_std)
-        middle_band = sma
+        # Price position
+        if current_price < sma_short:
+            entry_timing.append("Price below short MA - Potential pullback entry")
+        elif current_price > sma_short:
+            entry_timing.append("Price above short MA - Momentum entry")
         
-        # Calculate %B (position within bands)
-        percent_b = (close - lower_band) / (upper_band - lower_band)
+        # Overall signal strength
+        if bullish_signals >= 2:
+            signal_strength = "STRONG"
+            entry_timing.append(f"✅ STRONG BUY SIGNAL: {bullish_signals} bullish confirmations")
+        elif bearish_signals >= 2:
+            signal_strength = "WEAK"
+            entry_timing.append(f"⚠️ WEAK SIGNAL: {bearish_signals} bearish signals detected")
         
-        return {
-            'upper': upper_band,
-            'middle': middle_band,
-            'lower': lower_band,
-            'percent_b': percent_b,
-            'bandwidth': (upper_band - lower_band) / middle_band
-        }
+        return TradeAnalysis(
+            ticker_symbol=ticker_symbol,
+            current_price=current_price,
+            trend=trend,
+            signal_strength=signal_strength,
+            ma_bullish=ma_bullish,
+            sma_short=sma_short,
+            sma_long=sma_long,
+            current_rsi=current_rsi,
+            entry_price=entry_price,
+            entry_recommendation=entry_recommendation,
+            stop_loss=stop_loss,
+            target_price=target_price,
+            risk_reward_ratio=risk_reward_ratio,
+            risk=risk,
+            support=support_resistance['support'],
+            resistance=support_resistance['resistance'],
+            entry_timing=entry_timing,
+            macd=current_macd,
+            macd_signal_line=current_signal,
+            macd_histogram=current_histogram,
+            macd_histogram_prev=prev_histogram,
+            macd_signal=macd_signal,
+            bb_upper=upper_bb,
+            bb_middle=middle_bb,
+            bb_lower=lower_bb,
+            bb_percent_b=percent_b,
+            bb_signal=bb_signal,
+            bb_position=bb_position,
+        )
 
     @staticmethod
     def analyze_trading_opportunity(
@@ -319,361 +1212,154 @@ class TradingStrategyAnalyzer:
         - Optimal entry timing based on technical indicators
         """
         try:
-            # Fetch stock data with error handling and retry
-            ticker = yf.Ticker(ticker_symbol)
-            
-            # Try to fetch data with retry logic
-            max_retries = 3
-            data = None
-            last_error = None
-            
-            for attempt in range(max_retries):
-                try:
-                    data = ticker.history(period=period)
-                    if not data.empty:
-                        break
-                except Exception as e:
-                    last_error = str(e)
-                    if attempt < max_retries - 1:
-                        import time
-                        time.sleep(2 ** attempt)  # Exponential backoff: 1s, 2s, 4s
-                    continue
-            
-            if data is None or data.empty:
-                error_msg = f"Error: Unable to fetch data for {ticker_symbol}"
-                if last_error:
-                    if "401" in last_error or "Unauthorized" in last_error:
-                        error_msg += "\n\n⚠️ Yahoo Finance API Error: Access denied. This may be due to:\n"
-                        error_msg += "  • Rate limiting (too many requests)\n"
-                        error_msg += "  • Yahoo Finance API restrictions\n"
-                        error_msg += "  • Network/authentication issues\n\n"
-                        error_msg += "💡 Solutions:\n"
-                        error_msg += "  • Wait a few minutes and try again\n"
-                        error_msg += "  • Check your internet connection\n"
-                        error_msg += "  • Try a different ticker symbol\n"
-                        error_msg += "  • Consider using an alternative data source"
-                    else:
-                        error_msg += f"\n\nTechnical error: {last_error}"
-                return error_msg
-            
-            # Calculate technical indicators
-            current_price = data['Close'].iloc[-1]
-            atr = TradingStrategyAnalyzer.calculate_atr(data)
-            current_atr = atr.iloc[-1] if not pd.isna(atr.iloc[-1]) else current_price * 0.02
-            
-            support_resistance = TradingStrategyAnalyzer.calculate_support_resistance(data)
-            rsi = TradingStrategyAnalyzer.calculate_rsi(data)
-            current_rsi = rsi.iloc[-1] if not pd.isna(rsi.iloc[-1]) else 50
-            
-            ma = TradingStrategyAnalyzer.calculate_moving_averages(data)
-            sma_short = ma['sma_short'].iloc[-1]
-            sma_long = ma['sma_long'].iloc[-1]
-            ema_short = ma['ema_short'].iloc[-1]
-            ema_long = ma['ema_long'].iloc[-1]
-            
-            # Calculate advanced indicators if enabled
-            macd_data = None
-            bb_data = None
-            if use_advanced_indicators:
-                macd_data = TradingStrategyAnalyzer.calculate_macd(data)
-                bb_data = TradingStrategyAnalyzer.calculate_bollinger_bands(data)
-            
-            # Determine trend with multiple confirmations
-            ma_bullish = sma_short > sma_long and ema_short > ema_long
-            trend = "BULLISH" if ma_bullish else "BEARISH"
-            
-            # MACD confirmation
-            macd_signal = None
-            if macd_data is not None:
-                current_macd = macd_data['macd'].iloc[-1]
-                current_signal = macd_data['signal'].iloc[-1]
-                current_histogram = macd_data['histogram'].iloc[-1]
-                prev_histogram = macd_data['histogram'].iloc[-2] if len(macd_data['histogram']) > 1 else 0
-                
-                # MACD bullish: MACD line above signal line and histogram increasing
-                macd_bullish = current_macd > current_signal and current_histogram > prev_histogram
-                macd_signal = "BULLISH" if macd_bullish else "BEARISH"
-            
-            # Bollinger Bands analysis
-            bb_signal = None
-            bb_position = None
-            if bb_data is not None:
-                current_price = data['Close'].iloc[-1]
-                upper_bb = bb_data['upper'].iloc[-1]
-                lower_bb = bb_data['lower'].iloc[-1]
-                middle_bb = bb_data['middle'].iloc[-1]
-                percent_b = bb_data['percent_b'].iloc[-1]
-                
-                if current_price < lower_bb:
-                    bb_signal = "OVERSOLD"
-                    bb_position = "Below Lower Band"
-                elif current_price > upper_bb:
-                    bb_signal = "OVERBOUGHT"
-                    bb_position = "Above Upper Band"
-                elif current_price > middle_bb:
-                    bb_signal = "NEUTRAL-BULLISH"
-                    bb_position = "Upper Half"
-                else:
-                    bb_signal = "NEUTRAL-BEARISH"
-                    bb_position = "Lower Half"
-            
-            # Calculate entry price with advanced indicator confirmation
-            bullish_signals = 0
-            bearish_signals = 0
-            
-            if ma_bullish:
-                bullish_signals += 1
-            else:
-                bearish_signals += 1
-            
-            if macd_signal == "BULLISH":
-                bullish_signals += 1
-            elif macd_signal == "BEARISH":
-                bearish_signals += 1
-            
-            if bb_signal in ["NEUTRAL-BULLISH", "OVERSOLD"]:
-                bullish_signals += 1
-            elif bb_signal == "OVERBOUGHT":
-                bearish_signals += 1
-            
-            # Enhanced entry logic
-            if bullish_signals >= 2:
-                # Strong bullish setup
-                if bb_signal == "OVERSOLD":
-                    entry_price = lower_bb if bb_data is not None else support_resistance['support']
-                    entry_recommendation = "BUY: Oversold condition with bullish momentum"
-                else:
-                    entry_price = min(current_price, max(support_resistance['support'], sma_short))
-                    entry_recommendation = "BUY: Multiple bullish signals confirmed"
-            elif bearish_signals >= 2:
-                entry_price = current_price
-                entry_recommendation = "CAUTION: Multiple bearish signals. Wait for reversal or avoid."
-            elif trend == "BULLISH":
-                entry_price = min(current_price, max(support_resistance['support'], sma_short))
-                entry_recommendation = "BUY on pullback to support or moving average"
-            else:
-                entry_price = current_price
-                entry_recommendation = "CAUTION: Bearish trend detected. Consider waiting for trend reversal."
-            
-            # Calculate stop loss
-            if stop_loss_method == "atr":
-                stop_loss = entry_price - (atr_multiplier * current_atr)
-            elif stop_loss_method == "percentage":
-                stop_loss = entry_price * (1 - stop_loss_percentage / 100)
-            elif stop_loss_method == "support":
-                stop_loss = support_resistance['support'] * 0.98  # Slightly below support
-            else:
-                stop_loss = entry_price * 0.98  # Default 2% stop loss
-            
-            # Ensure stop loss is reasonable
-            if stop_loss > entry_price * 0.95:  # Not more than 5% below entry
-                stop_loss = entry_price * 0.97
-            
-            # Calculate target price based on risk-reward ratio
-            risk = entry_price - stop_loss
-            target_price = entry_price + (risk * risk_reward_ratio)
-            
-            # Also consider resistance level
-            if target_price > support_resistance['resistance']:
-                target_price = support_resistance['resistance'] * 0.99  # Slightly below resistance
-            
-            # Determine optimal entry timing with advanced indicators
-            entry_timing = []
-            signal_strength = "MODERATE"
-            
-            # RSI-based timing
-            if current_rsi < 30:
-                entry_timing.append("RSI indicates OVERSOLD - Good entry opportunity")
-                signal_strength = "STRONG" if bullish_signals >= 2 else signal_strength
-            elif current_rsi > 70:
-                entry_timing.append("RSI indicates OVERBOUGHT - Wait for pullback")
-            elif 30 <= current_rsi <= 50:
-                entry_timing.append("RSI in neutral zone - Good entry zone")
-            
-            # Moving average crossover
-            if ema_short > ema_long and sma_short > sma_long:
-                entry_timing.append("Moving averages show BULLISH momentum")
-            elif ema_short < ema_long and sma_short < sma_long:
-                entry_timing.append("Moving averages show BEARISH momentum - Wait for reversal")
-            
-            # MACD signals
-            if macd_data is not None:
-                if macd_signal == "BULLISH":
-                    entry_timing.append("MACD shows BULLISH crossover - Momentum building")
-                    signal_strength = "STRONG" if bullish_signals >= 2 else signal_strength
-                elif macd_signal == "BEARISH":
-                    entry_timing.append("MACD shows BEARISH signal - Wait for reversal")
-            
-            # Bollinger Bands signals
-            if bb_data is not None:
-                if bb_signal == "OVERSOLD":
-                    entry_timing.append(f"Bollinger Bands: OVERSOLD ({bb_position}) - Potential bounce")
-                    signal_strength = "STRONG"
-                elif bb_signal == "OVERBOUGHT":
-                    entry_timing.append(f"Bollinger Bands: OVERBOUGHT ({bb_position}) - Wait for pullback")
-                else:
-                    entry_timing.append(f"Bollinger Bands: {bb_position} - {bb_signal}")
-            
-            # Price position
-            if current_price < sma_short:
-                entry_timing.append("Price below short MA - Potential pullback entry")
-            elif current_price > sma_short:
-                entry_timing.append("Price above short MA - Momentum entry")
-            
-            # Overall signal strength
-            if bullish_signals >= 2:
-                signal_strength = "STRONG"
-                entry_timing.append(f"✅ STRONG BUY SIGNAL: {bullish_signals} bullish confirmations")
-            elif bearish_signals >= 2:
-                signal_strength = "WEAK"
-                entry_timing.append(f"⚠️ WEAK SIGNAL: {bearish_signals} bearish signals detected")
-            
-            # Compile results
-            result = {
-                "Ticker": ticker_symbol,
-                "Current Price": f"${current_price:.2f}",
-                "Trend": trend,
-                "Signal Strength": signal_strength,
-                "Entry Price": f"${entry_price:.2f}",
-                "Entry Recommendation": entry_recommendation,
-                "Stop Loss": f"${stop_loss:.2f} ({((stop_loss/entry_price - 1) * 100):.2f}%)",
-                "Target Price": f"${target_price:.2f} ({((target_price/entry_price - 1) * 100):.2f}%)",
-                "Risk-Reward Ratio": f"{risk_reward_ratio:.1f}:1",
-                "Risk Amount": f"${risk:.2f} per share",
-                "Potential Reward": f"${(target_price - entry_price):.2f} per share",
-                "Support Level": f"${support_resistance['support']:.2f}",
-                "Resistance Level": f"${support_resistance['resistance']:.2f}",
-                "Current RSI": f"{current_rsi:.2f}",
-                "Short MA (20)": f"${sma_short:.2f}",
-                "Long MA (50)": f"${sma_long:.2f}",
-            }
-            
-            # Add advanced indicators if enabled
-            if macd_data is not None:
-                result["MACD"] = f"{macd_data['macd'].iloc[-1]:.4f}"
-                result["MACD Signal"] = f"{macd_data['signal'].iloc[-1]:.4f}"
-                result["MACD Histogram"] = f"{macd_data['histogram'].iloc[-1]:.4f}"
-                result["MACD Signal Type"] = macd_signal
-            
-            if bb_data is not None:
-                result["Bollinger Upper"] = f"${bb_data['upper'].iloc[-1]:.2f}"
-                result["Bollinger Middle"] = f"${bb_data['middle'].iloc[-1]:.2f}"
-                result["Bollinger Lower"] = f"${bb_data['lower'].iloc[-1]:.2f}"
-                result["Bollinger %B"] = f"{bb_data['percent_b'].iloc[-1]:.2f}"
-                result["Bollinger Position"] = bb_position
-            
-            result["Optimal Entry Timing"] = "\n".join(f"  • {timing}" for timing in entry_timing)
-            
-            # Format output with explanations
-            output = f"""
-╔══════════════════════════════════════════════════════════════╗
-║          TRADING STRATEGY ANALYSIS - {ticker_symbol:^10}          ║
-╚══════════════════════════════════════════════════════════════╝
-
-📊 CURRENT MARKET DATA:
-   Current Price: {result['Current Price']}
-   Trend: {result['Trend']} ({'Price is generally moving UP' if trend == 'BULLISH' else 'Price is generally moving DOWN'})
-   Signal Strength: {result['Signal Strength']} ({'Multiple indicators agree - Higher confidence' if signal_strength == 'STRONG' else 'Mixed signals - Proceed with caution' if signal_strength == 'MODERATE' else 'Indicators disagree - Wait for better setup'})
-   
-   📈 Moving Averages (Shows price trend over time):
-   • Short MA (20 days): {result['Short MA (20)']} - Recent average price
-   • Long MA (50 days): {result['Long MA (50)']} - Longer-term average price
-   • Interpretation: {'Short MA above Long MA = BULLISH trend (price likely to continue up)' if ma_bullish else 'Short MA below Long MA = BEARISH trend (price likely to continue down)'}
-   
-   📊 RSI (Relative Strength Index): {result['Current RSI']}
-   • What it means: {'OVERSOLD (below 30) - Stock may bounce back up - Good BUY opportunity' if current_rsi < 30 else 'OVERBOUGHT (above 70) - Stock may pull back - Consider SELLING or waiting' if current_rsi > 70 else 'Neutral (30-70) - Stock moving at healthy pace'}
-   • Simple explanation: Like a speedometer - too fast (overbought) or too slow (oversold)"""
-            
-            # Add MACD info if available
-            if macd_data is not None:
-                macd_explanation = "BULLISH - MACD above Signal = Momentum building (like green traffic light)" if macd_signal == "BULLISH" else "BEARISH - MACD below Signal = Momentum slowing (like red traffic light)"
-                hist_trend = ""
-                if len(macd_data['histogram']) > 1:
-                    prev_hist = macd_data['histogram'].iloc[-2]
-                    hist_trend = "Increasing = Strong momentum" if current_histogram > prev_hist else "Decreasing = Momentum weakening"
-                else:
-                    hist_trend = "Initial reading"
-                
-                output += f"""
-   
-📈 MACD INDICATOR (Shows momentum changes):
-   MACD Line: {result['MACD']}
-   Signal Line: {result['MACD Signal']}
-   Histogram: {result['MACD Histogram']} ({hist_trend})
-   Signal: {result['MACD Signal Type']} - {macd_explanation}
-   • Simple explanation: Like a traffic light - green (bullish) when MACD crosses above Signal, red (bearish) when it crosses below"""
-            
-            # Add Bollinger Bands info if available
-            if bb_data is not None:
-                bb_explanation = ""
-                if bb_signal == "OVERSOLD":
-                    bb_explanation = "Price at LOWER band = OVERSOLD - May bounce up (potential BUY signal)"
-                elif bb_signal == "OVERBOUGHT":
-                    bb_explanation = "Price at UPPER band = OVERBOUGHT - May pull back (potential SELL signal)"
-                elif bb_signal == "NEUTRAL-BULLISH":
-                    bb_explanation = "Price in upper half of bands - Slightly bullish"
-                else:
-                    bb_explanation = "Price in lower half of bands - Slightly bearish"
-                
-                output += f"""
-   
-📊 BOLLINGER BANDS (Shows price boundaries and volatility):
-   Upper Band: {result['Bollinger Upper']} (Like a ceiling - price rarely goes above)
-   Middle Band: {result['Bollinger Middle']} (Average price - center of the band)
-   Lower Band: {result['Bollinger Lower']} (Like a floor - price rarely goes below)
-   %B: {result['Bollinger %B']} ({'0 = at lower band, 1 = at upper band, 0.5 = at middle'})
-   Position: {result['Bollinger Position']}
-   • Interpretation: {bb_explanation}
-   • Simple explanation: Like a rubber band - when price touches edges, it often bounces back toward middle"""
-            
-            output += f"""
-
-🎯 TRADING RECOMMENDATIONS:
-   Entry Price: {result['Entry Price']}
-   Entry Strategy: {result['Entry Recommendation']}
-   
-   🛡️ Stop Loss: {result['Stop Loss']}
-   • What it means: Maximum price you're willing to lose per share
-   • Why it matters: Protects you from big losses - automatically sell if price drops to this level
-   • Simple explanation: Like a safety net - if trade goes wrong, you exit here to limit losses
-   
-   🎯 Target Price: {result['Target Price']}
-   • What it means: Price level where you should consider taking profit
-   • Why it matters: Helps you know when to sell and lock in gains
-   • Simple explanation: Like a finish line - when price reaches here, consider selling to take profit
-   
-   💰 Risk-Reward: {result['Risk-Reward Ratio']}
-   • What it means: {f'You risk ${risk:.2f} to potentially make ${(target_price - entry_price):.2f}'}
-   • Why it matters: {'Good ratio - potential reward is greater than risk' if risk_reward_ratio >= 2.0 else 'Consider improving ratio - reward should be at least 2x the risk'}
-   • Simple explanation: Like betting odds - {f'Risk $1 to make ${risk_reward_ratio:.1f}'} - Only take trades where reward > risk
-   
-   Risk per Share: {result['Risk Amount']}
-   Potential Reward: {result['Potential Reward']}
+            return _format_analysis(
+                TradingStrategyAnalyzer.analyze_trading_opportunity_raw(
+                    ticker_symbol,
+                    period=period,
+                    risk_reward_ratio=risk_reward_ratio,
+                    stop_loss_method=stop_loss_method,
+                    stop_loss_percentage=stop_loss_percentage,
+                    atr_multiplier=atr_multiplier,
+                    use_advanced_indicators=use_advanced_indicators,
+                )
+            )
+        except DataFetchError as e:
+            return str(e)
+        except Exception as e:
+            return f"Error analyzing {ticker_symbol}: {str(e)}"
 
-📈 TECHNICAL LEVELS (Historical price boundaries):
-   Support: {result['Support Level']}
-   • What it means: Price level where buyers often step in (like a floor)
-   • How to use: Good place to buy, set stop loss just below this level
-   • Simple explanation: Like a safety net - price often bounces up from here
-   
-   Resistance: {result['Resistance Level']}
-   • What it means: Price level where sellers often step in (like a ceiling)
-   • How to use: Good place to sell, set target price near this level
-   • Simple explanation: Like a ceiling - price often bounces down from here
+    @staticmethod
+    def fetch_bulk(
+        tickers: List[str],
+        period: str | None = None,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch the histories of several tickers with one batched yf.download call and add
+        them to the history cache, so later per-ticker fetches for the same period or
+        dates (including those in analyze_many worker processes) are served locally.
+        
+        Returns:
+            Dictionary mapping each ticker with data to its history DataFrame
+        """
+        import yfinance as yf
+        
+        frames = yf.download(
+            list(tickers), period=period, start=start, end=end,
+            group_by="ticker", threads=True, auto_adjust=True, progress=False,
+        )
+        
+        key_end = end or time.strftime("%Y-%m-%d")
+        now = time.time()
+        histories = {}
+        for ticker_symbol in tickers:
+            try:
+                data = frames[ticker_symbol].dropna(how="all")
+            except KeyError:
+                continue
+            if data.empty:
+                continue
+            key = (ticker_symbol, period, start, key_end, False)
+            _write_history(_history_path(key), data)
+            _remember_history(key, data, now)
+            histories[ticker_symbol] = data
+        return histories
 
-⏰ OPTIMAL ENTRY TIMING:
-{result['Optimal Entry Timing']}
+    @staticmethod
+    def analyze_trading_opportunities(
+        tickers: List[str],
+        period: str = "6mo",
+        max_workers: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Scan a watchlist: fetch all tickers with a single yf.download call and compute
+        the latest indicators for each ticker in parallel.
+        
+        Args:
+            tickers: Ticker symbols to analyze
+            period: Time period for analysis (same values as analyze_trading_opportunity)
+            max_workers: Thread pool size (defaults to one thread per ticker, capped at 8)
+        
+        Returns:
+            DataFrame indexed by ticker with one row of indicator values per ticker;
+            tickers without data are left out
+        """
+        histories = TradingStrategyAnalyzer.fetch_bulk(tickers, period=period)
+        
+        def analyze_one(ticker_symbol):
+            data = histories.get(ticker_symbol)
+            if data is None:
+                return None
+            high, low, close = _ohlc_arrays(data)
+            row = TradingStrategyAnalyzer._compute_indicators(high, low, close)
+            levels = TradingStrategyAnalyzer.calculate_support_resistance(high, low, close)
+            row['current_price'] = close[-1]
+            row['support'] = levels['support']
+            row['resistance'] = levels['resistance']
+            ma_bullish = row['sma_short'] > row['sma_long'] and row['ema_short'] > row['ema_long']
+            row['trend'] = "BULLISH" if ma_bullish else "BEARISH"
+            return ticker_symbol, row
+        
+        with ThreadPoolExecutor(max_workers=max_workers or min(8, len(tickers))) as executor:
+            rows = [r for r in executor.map(analyze_one, tickers) if r is not None]
+        
+        return pd.DataFrame.from_dict(dict(rows), orient="index")
 
-⚠️  RISK DISCLAIMER:
-   This analysis is for informational purposes only and should not be
-   considered as financial advice. Always do your own research and
-   consider your risk tolerance before making any trading decisions.
-"""
-            
-            return output
-            
-        except Exception as e:
-            return f"Error analyzing {ticker_symbol}: {str(e)}"
+    @staticmethod
+    def analyze_many(
+        tickers: List[str],
+        period: str = "6mo",
+        risk_reward_ratio: float = 2.0,
+        stop_loss_method: str = "atr",
+        stop_loss_percentage: float = 2.0,
+        atr_multiplier: float = 2.0,
+        use_advanced_indicators: bool = True,
+        use_parallel: bool = True,
+        max_workers: int | None = None,
+        prefetch: bool = True,
+    ) -> Dict[str, "TradeAnalysis | str"]:
+        """
+        Run analyze_trading_opportunity_raw for several tickers, one worker process per
+        ticker (each ticker's fetch and indicator work is independent).
+        
+        Args:
+            tickers: Ticker symbols to analyze; duplicates are analyzed once
+            prefetch: Download all histories with one fetch_bulk call first, so workers
+                read them from the history cache instead of each making a request
+            use_parallel: Dispatch to a ProcessPoolExecutor (otherwise run in this process)
+            max_workers: Process pool size (defaults to the CPU count, capped at the number of tickers)
+            Remaining arguments are passed through to analyze_trading_opportunity_raw.
+        
+        Returns:
+            Dictionary mapping each ticker, in input order, to its TradeAnalysis or to
+            an error message
+        """
+        tickers = list(dict.fromkeys(tickers))
+        params = (
+            period, risk_reward_ratio, stop_loss_method, stop_loss_percentage,
+            atr_multiplier, use_advanced_indicators,
+        )
+        jobs = [(ticker_symbol, *params) for ticker_symbol in tickers]
+        
+        if prefetch and len(tickers) > 1:
+            try:
+                TradingStrategyAnalyzer.fetch_bulk(tickers, period=period)
+            except Exception:
+                pass  # Workers fall back to fetching their own ticker
+        
+        if not use_parallel or len(jobs) <= 1:
+            results = dict(_analyze_one(job) for job in jobs)
+        else:
+            workers = max_workers or min(os.cpu_count() or 1, len(jobs))
+            results = {}
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(_analyze_one, job): job[0] for job in jobs}
+                for future in as_completed(futures):
+                    ticker_symbol, result = future.result()
+                    results[ticker_symbol] = result
+        
+        return {ticker_symbol: results[ticker_symbol] for ticker_symbol in tickers}
 
     @staticmethod
     def backtest_strategy_recommendations(
@@ -698,15 +1384,15 @@ class TradingStrategyAnalyzer:
         use_advanced_indicators: Annotated[
             bool, "Whether to use MACD and Bollinger Bands for entry/exit signals"
         ] = True,
+        indicators: Dict[str, np.ndarray] | None = None,
     ) -> str:
         """
         Backtest a trading strategy based on the recommended entry, stop loss, and target prices.
-        Returns performance metrics and trade statistics.
+        Returns performance metrics and trade statistics. Pass indicators (from
+        compute_indicator_bundle on the same history) to reuse already computed series.
         """
         try:
             # Fetch historical data with error handling and retry
-            ticker = yf.Ticker(ticker_symbol)
-            
             # Try to fetch data with retry logic
             max_retries = 3
             data = None
@@ -714,13 +1400,12 @@ class TradingStrategyAnalyzer:
             
             for attempt in range(max_retries):
                 try:
-                    data = ticker.history(start=start_date, end=end_date)
-                    if not data.empty:
+                    data = _fetch_history(ticker_symbol, start=start_date, end=end_date)
+                    if data is not None and not data.empty:
                         break
                 except Exception as e:
                     last_error = str(e)
                     if attempt < max_retries - 1:
-                        import time
                         time.sleep(2 ** attempt)  # Exponential backoff
                     continue
             
@@ -733,168 +1418,41 @@ class TradingStrategyAnalyzer:
                         error_msg += f"\n\nTechnical error: {last_error}"
                 return error_msg
             
-            # Initialize tracking variables
-            position = None  # None, 'long', or 'short'
-            entry_date = None
-            entry_price_actual = None
-            trades = []
-            wins = 0
-            losses = 0
-            total_profit = 0.0
-            
-            # Calculate indicators
-            if use_advanced_indicators:
-                macd_data = TradingStrategyAnalyzer.calculate_macd(data)
-                bb_data = TradingStrategyAnalyzer.calculate_bollinger_bands(data)
-            
-            ma = TradingStrategyAnalyzer.calculate_moving_averages(data)
-            rsi = TradingStrategyAnalyzer.calculate_rsi(data)
+            # Calculate indicators on the raw close array
+            close = data['Close'].to_numpy(dtype=np.float64, copy=False)
+            if indicators is None:
+                indicators = TradingStrategyAnalyzer.compute_indicator_bundle(data)
+            
+            # Simulate trading (start after enough data for indicators)
+            count, entry_idx, exit_idx, entry_prices, exit_prices, reasons = simulate_long_strategy(
+                close, indicators['sma_short'], indicators['sma_long'], indicators['rsi'],
+                indicators['macd'], indicators['signal'], indicators['bb_lower'], indicators['bb_upper'],
+                float(entry_price), float(stop_loss), float(target_price),
+                bool(use_advanced_indicators), 50,
+            )
             
-            # Simulate trading
-            for i in range(50, len(data)):  # Start after enough data for indicators
-                current_price = data['Close'].iloc[i]
-                current_date = data.index[i]
-                
-                # Check if we have a position
-                if position is None:
-                    # Look for entry signal
-                    sma_short = ma['sma_short'].iloc[i]
-                    sma_long = ma['sma_long'].iloc[i]
-                    current_rsi = rsi.iloc[i] if not pd.isna(rsi.iloc[i]) else 50
-                    
-                    # Entry conditions
-                    ma_bullish = sma_short > sma_long
-                    rsi_ok = current_rsi < 70  # Not overbought
-                    price_near_entry = abs(current_price - entry_price) / entry_price < 0.02  # Within 2%
-                    
-                    # Advanced indicator confirmation
-                    macd_ok = True
-                    bb_ok = True
-                    if use_advanced_indicators:
-                        if macd_data is not None:
-                            current_macd = macd_data['macd'].iloc[i]
-                            current_signal = macd_data['signal'].iloc[i]
-                            macd_ok = current_macd > current_signal
-                        
-                        if bb_data is not None:
-                            lower_bb = bb_data['lower'].iloc[i]
-                            bb_ok = current_price >= lower_bb  # Not too oversold
-                    
-                    # Enter long position
-                    if ma_bullish and rsi_ok and price_near_entry and macd_ok and bb_ok:
-                        position = 'long'
-                        entry_date = current_date
-                        entry_price_actual = current_price
-                
-                elif position == 'long':
-                    # Check exit conditions
-                    exit_reason = None
-                    exit_price = None
-                    
-                    # Stop loss hit
-                    if current_price <= stop_loss:
-                        exit_reason = "Stop Loss"
-                        exit_price = stop_loss
-                    # Target hit
-                    elif current_price >= target_price:
-                        exit_reason = "Target Reached"
-                        exit_price = target_price
-                    # Trailing stop (if price moves significantly above entry)
-                    elif current_price > entry_price_actual * 1.1:  # 10% profit
-                        # Trailing stop at 5% below peak
-                        trailing_stop = current_price * 0.95
-                        if current_price < trailing_stop:
-                            exit_reason = "Trailing Stop"
-                            exit_price = trailing_stop
-                    
-                    # Exit signal from indicators
-                    if exit_reason is None and use_advanced_indicators:
-                        sma_short = ma['sma_short'].iloc[i]
-                        sma_long = ma['sma_long'].iloc[i]
-                        current_rsi = rsi.iloc[i] if not pd.isna(rsi.iloc[i]) else 50
-                        
-                        # Bearish reversal
-                        if sma_short < sma_long:
-                            exit_reason = "Bearish Reversal"
-                            exit_price = current_price
-                        
-                        # RSI overbought
-                        if current_rsi > 70:
-                            exit_reason = "RSI Overbought"
-                            exit_price = current_price
-                        
-                        # MACD bearish
-                        if macd_data is not None:
-                            current_macd = macd_data['macd'].iloc[i]
-                            current_signal = macd_data['signal'].iloc[i]
-                            if current_macd < current_signal:
-                                exit_reason = "MACD Bearish"
-                                exit_price = current_price
-                        
-                        # Bollinger Bands overbought
-                        if bb_data is not None:
-                            upper_bb = bb_data['upper'].iloc[i]
-                            if current_price > upper_bb:
-                                exit_reason = "Bollinger Overbought"
-                                exit_price = current_price
-                    
-                    # Execute exit
-                    if exit_reason:
-                        profit = exit_price - entry_price_actual
-                        profit_pct = (profit / entry_price_actual) * 100
-                        
-                        trades.append({
-                            'entry_date': entry_date,
-                            'exit_date': current_date,
-                            'entry_price': entry_price_actual,
-                            'exit_price': exit_price,
-                            'profit': profit,
-                            'profit_pct': profit_pct,
-                            'exit_reason': exit_reason
-                        })
-                        
-                        if profit > 0:
-                            wins += 1
-                        else:
-                            losses += 1
-                        
-                        total_profit += profit
-                        position = None
-                        entry_date = None
-                        entry_price_actual = None
-                
-                # Force exit at end of data
-                if i == len(data) - 1 and position == 'long':
-                    exit_price = current_price
-                    profit = exit_price - entry_price_actual
-                    profit_pct = (profit / entry_price_actual) * 100
-                    
-                    trades.append({
-                        'entry_date': entry_date,
-                        'exit_date': current_date,
-                        'entry_price': entry_price_actual,
-                        'exit_price': exit_price,
-                        'profit': profit,
-                        'profit_pct': profit_pct,
-                        'exit_reason': "End of Period"
-                    })
-                    
-                    if profit > 0:
-                        wins += 1
-                    else:
-                        losses += 1
-                    
-                    total_profit += profit
+            # Trades stay in the simulator's parallel arrays (one slot per closed trade)
+            entry_prices = entry_prices[:count]
+            exit_prices = exit_prices[:count]
+            profits = exit_prices - entry_prices
+            profit_pcts = profits / entry_prices * 100
+            win_mask = profits > 0
+            entry_dates = data.index[entry_idx[:count]].strftime('%Y-%m-%d')
+            exit_dates = data.index[exit_idx[:count]].strftime('%Y-%m-%d')
             
             # Calculate statistics
-            total_trades = len(trades)
+            total_trades = count
+            wins = int(np.count_nonzero(win_mask))
+            losses = total_trades - wins
+            total_profit = profits.sum()
             win_rate = (wins / total_trades * 100) if total_trades > 0 else 0
             avg_profit = total_profit / total_trades if total_trades > 0 else 0
-            avg_win = sum(t['profit'] for t in trades if t['profit'] > 0) / wins if wins > 0 else 0
-            avg_loss = sum(t['profit'] for t in trades if t['profit'] < 0) / losses if losses > 0 else 0
+            avg_win = profits[win_mask].mean() if wins > 0 else 0
+            # Break-even trades count as losses but add nothing to the loss total
+            avg_loss = profits[profits < 0].sum() / losses if losses > 0 else 0
             
             # Format results
-            result = f"""
+            parts = [f"""
 ╔══════════════════════════════════════════════════════════════╗
 ║        BACKTEST RESULTS - {ticker_symbol:^10}                    ║
 ╚══════════════════════════════════════════════════════════════╝
@@ -920,20 +1478,20 @@ class TradingStrategyAnalyzer:
    Average Loss: ${avg_loss:.2f}
 
 📋 TRADE DETAILS:
-"""
-            for i, trade in enumerate(trades, 1):
-                result += f"""
-   Trade #{i}:
-   • Entry: {trade['entry_date'].strftime('%Y-%m-%d')} @ ${trade['entry_price']:.2f}
-   • Exit: {trade['exit_date'].strftime('%Y-%m-%d')} @ ${trade['exit_price']:.2f}
-   • P/L: ${trade['profit']:.2f} ({trade['profit_pct']:.2f}%)
-   • Reason: {trade['exit_reason']}
-"""
+"""]
+            for k in range(count):
+                parts.append(f"""
+   Trade #{k + 1}:
+   • Entry: {entry_dates[k]} @ ${entry_prices[k]:.2f}
+   • Exit: {exit_dates[k]} @ ${exit_prices[k]:.2f}
+   • P/L: ${profits[k]:.2f} ({profit_pcts[k]:.2f}%)
+   • Reason: {_REASON_NAMES[reasons[k]]}
+""")
             
             if total_trades == 0:
-                result += "\n   No trades executed during this period.\n"
+                parts.append("\n   No trades executed during this period.\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
             return f"Error backtesting {ticker_symbol}: {str(e)}"
@@ -1001,6 +1559,9 @@ class TradingStrategyAnalyzer:
         company_research: Annotated[
             str | None, "Company research text from AI analysis. If None, will be skipped."
         ] = None,
+        company_name: Annotated[
+            str | None, "Company name for the report header. If None, it is looked up from the ticker symbol."
+        ] = None,
     ) -> str:
         """
         Comprehensive analysis combining technical analysis, position sizing, and company research.
@@ -1008,40 +1569,26 @@ class TradingStrategyAnalyzer:
         """
         try:
             # Get technical analysis
-            technical_result = TradingStrategyAnalyzer.analyze_trading_opportunity(
-                ticker_symbol=ticker_symbol,
-                period=period,
-                risk_reward_ratio=risk_reward_ratio,
-                stop_loss_method=stop_loss_method,
-                stop_loss_percentage=stop_loss_percentage,
-                atr_multiplier=2.0,
-                use_advanced_indicators=True
-            )
-            
-            # Extract key values from technical analysis
-            import re
-            entry_match = re.search(r'Entry Price: \$([\d.]+)', technical_result)
-            stop_match = re.search(r'Stop Loss: \$([\d.]+)', technical_result)
-            target_match = re.search(r'Target Price: \$([\d.]+)', technical_result)
-            current_price_match = re.search(r'Current Price: \$([\d.]+)', technical_result)
-            trend_match = re.search(r'Trend: (\w+)', technical_result)
-            signal_strength_match = re.search(r'Signal Strength: (\w+)', technical_result)
-            
-            if not all([entry_match, stop_match, target_match, current_price_match]):
-                return f"Error: Could not parse technical analysis results.\n\n{technical_result}"
-            
-            entry_price = float(entry_match.group(1))
-            stop_loss = float(stop_match.group(1))
-            target_price = float(target_match.group(1))
-            current_price = float(current_price_match.group(1))
-            trend = trend_match.group(1) if trend_match else "UNKNOWN"
-            signal_strength = signal_strength_match.group(1) if signal_strength_match else "MODERATE"
-            
-            # Ensure trend and signal_strength are strings, not None
-            if trend is None:
-                trend = "UNKNOWN"
-            if signal_strength is None:
-                signal_strength = "MODERATE"
+            try:
+                analysis = TradingStrategyAnalyzer.analyze_trading_opportunity_raw(
+                    ticker_symbol=ticker_symbol,
+                    period=period,
+                    risk_reward_ratio=risk_reward_ratio,
+                    stop_loss_method=stop_loss_method,
+                    stop_loss_percentage=stop_loss_percentage,
+                    atr_multiplier=2.0,
+                    use_advanced_indicators=True
+                )
+            except DataFetchError as e:
+                return str(e)
+            technical_result = _format_analysis(analysis)
+            
+            entry_price = analysis.entry_price
+            stop_loss = analysis.stop_loss
+            target_price = analysis.target_price
+            current_price = analysis.current_price
+            trend = analysis.trend
+            signal_strength = analysis.signal_strength
             
             # Calculate position size
             position_info = TradingStrategyAnalyzer.calculate_position_size(
@@ -1051,17 +1598,9 @@ class TradingStrategyAnalyzer:
                 risk_per_trade_pct=risk_per_trade_pct
             )
             
-            # Get stock info for forecasts with error handling
-            try:
-                ticker = yf.Ticker(ticker_symbol)
-                info = ticker.info
-                company_name = info.get('longName', ticker_symbol) if info else ticker_symbol
-            except Exception as e:
-                # If we can't get company info, just use ticker symbol
-                company_name = ticker_symbol
-                # Log error but don't fail the analysis
-                if "401" in str(e) or "Unauthorized" in str(e):
-                    pass  # Silent fail for 401 errors on info fetch
+            # Company name for the header (history metadata usually has it already)
+            if not company_name:
+                company_name = _company_name(ticker_symbol)
             
             # Calculate price forecast
             risk = entry_price - stop_loss
@@ -1073,21 +1612,11 @@ class TradingStrategyAnalyzer:
             trend_str = str(trend).upper() if trend else "UNKNOWN"
             signal_str = str(signal_strength).upper() if signal_strength else "MODERATE"
             
-            if trend_str == "BULLISH" and signal_str in ["STRONG", "MODERATE"]:
-                forecast_direction = "UP"
-                forecast_timeframe = "1-3 months"
-                forecast_confidence = "HIGH" if signal_str == "STRONG" else "MODERATE"
-            elif trend_str == "BEARISH" or signal_str == "WEAK":
-                forecast_direction = "DOWN or SIDEWAYS"
-                forecast_timeframe = "Wait for better entry"
-                forecast_confidence = "LOW"
-            else:
-                forecast_direction = "SIDEWAYS"
-                forecast_timeframe = "1-2 months"
-                forecast_confidence = "MODERATE"
+            mode = _classify(trend_str, signal_str)
+            forecast_direction, forecast_timeframe, forecast_confidence = _FORECASTS[mode]
             
             # Build comprehensive output
-            output = f"""
+            parts = [f"""
 ╔══════════════════════════════════════════════════════════════╗
 ║     COMPREHENSIVE STOCK ANALYSIS - {ticker_symbol:^10}          ║
 ╚══════════════════════════════════════════════════════════════╝
@@ -1095,21 +1624,21 @@ class TradingStrategyAnalyzer:
 📊 COMPANY: {company_name} ({ticker_symbol})
    Current Trend: {trend_str}
    Signal Strength: {signal_str}
-"""
+"""]
             
             # Add company research if available
             if company_research:
-                output += f"""
+                parts.append(f"""
 🔍 COMPANY RESEARCH & HEALTH ANALYSIS:
 {company_research}
 
-"""
+""")
             
             # Add technical analysis
-            output += technical_result
+            parts.append(technical_result)
             
             # Add position sizing
-            output += f"""
+            parts.append(f"""
 
 💰 POSITION SIZING RECOMMENDATIONS:
    Account Value: ${account_value:,.2f}
@@ -1139,126 +1668,39 @@ class TradingStrategyAnalyzer:
      guarantees - the stock market is unpredictable!
 
 🎯 WHEN TO BUY:
-"""
+""")
             
-            # Determine buy recommendation (use string versions)
-            if signal_str == "STRONG" and trend_str == "BULLISH":
-                buy_recommendation = "✅ STRONG BUY - Multiple indicators agree, good time to enter"
-                buy_timing = "Buy now or on any small pullback"
-            elif signal_str == "MODERATE" and trend_str == "BULLISH":
-                buy_recommendation = "✅ BUY - Good opportunity, but watch for confirmation"
-                buy_timing = "Buy on pullback to support or moving average"
-            elif signal_str == "WEAK" or trend_str == "BEARISH":
-                buy_recommendation = "⏸️ WAIT - Weak signals or bearish trend detected"
-                buy_timing = "Wait for trend reversal or stronger bullish signals"
-            else:
-                buy_recommendation = "⚠️ CAUTION - Mixed signals, proceed carefully"
-                buy_timing = "Wait for clearer signals or better entry point"
+            buy_recommendation, buy_timing = _BUY_RECOMMENDATIONS[mode]
             
-            output += f"""   Recommendation: {buy_recommendation}
+            parts.append(f"""   Recommendation: {buy_recommendation}
    Best Entry: {buy_timing}
    Entry Price: ${entry_price:.2f}
    Stop Loss: ${stop_loss:.2f} (safety net - exit here if wrong)
    Target Price: ${target_price:.2f} (take profit here)
 
 👶 KID-FRIENDLY EXPLANATION:
-"""
-            
-            # Kid-friendly explanation (use string versions)
-            if signal_str == "STRONG" and trend_str == "BULLISH":
-                kid_explanation = f"""
-   🎉 GOOD NEWS! This stock looks like a good opportunity right now!
-   
-   • What's happening: The stock is in an UPTREND (going up) and multiple indicators agree
-   • What to do: This is a good time to BUY, but remember:
-     - Only invest money you can afford to lose
-     - Buy {position_info['num_shares']} shares at ${entry_price:.2f} each
-     - Set a stop loss at ${stop_loss:.2f} (like a safety net)
-     - Target price is ${target_price:.2f} (where you might want to sell)
-   
-   • Think of it like: You're buying a toy that might increase in value. You set a safety 
-     net (stop loss) so if it goes wrong, you don't lose too much. And you have a goal 
-     price (target) where you might want to sell and take your profit.
-   
-   • Next steps: 
-     1. Make sure you have ${position_info['total_cost']:,.2f} available
-     2. Buy {position_info['num_shares']} shares at ${entry_price:.2f} or better
-     3. Set your stop loss at ${stop_loss:.2f}
-     4. Watch the stock and consider selling at ${target_price:.2f}
-"""
-            elif signal_str == "WEAK" or trend_str == "BEARISH":
-                kid_explanation = f"""
-   ⚠️ WAIT! This stock is not a good buy right now.
-   
-   • What's happening: The stock is in a DOWNTREND (going down) or signals are weak
-   • What to do: WAIT and watch. Don't buy yet!
-   
-   • Think of it like: You're at a store and the item you want is on sale, but it might 
-     go on an even better sale later. It's better to wait for a clearer sign that it's 
-     the right time to buy.
-   
-   • What to watch for:
-     - Stock price stops falling and starts rising
-     - Multiple indicators turn bullish (positive)
-     - Price moves above key moving averages
-   
-   • Next steps:
-     1. Don't buy right now - wait for better signals
-     2. Check back in a few days or weeks
-     3. Look for the stock to show signs of recovery
-     4. Consider looking at other stocks with stronger buy signals
-"""
-            else:
-                kid_explanation = f"""
-   🤔 MIXED SIGNALS - Be careful!
-   
-   • What's happening: Some indicators say buy, others say wait - they don't all agree
-   • What to do: PROCEED WITH CAUTION or wait for clearer signals
-   
-   • Think of it like: You're trying to decide if you should buy something, but half 
-     your friends say yes and half say no. It's better to wait until more people agree 
-     or you get more information.
-   
-   • Next steps:
-     1. Wait for stronger confirmation (2+ indicators agreeing)
-     2. Or if you do buy, use a smaller position size
-     3. Be extra careful with your stop loss
-     4. Consider waiting a few days for clearer signals
-"""
-            
-            output += kid_explanation
+""")
+            
+            # Kid-friendly explanation and summary action items for the recommendation mode
+            template_fields = {
+                'num_shares': position_info['num_shares'],
+                'total_cost': position_info['total_cost'],
+                'entry_price': entry_price,
+                'stop_loss': stop_loss,
+                'target_price': target_price,
+                'forecast_timeframe': forecast_timeframe,
+                'expected_move': abs(forecast_pct),
+            }
+            parts.append(_KID_EXPLANATIONS[mode].format(**template_fields))
             
-            output += f"""
+            parts.append(f"""
 
 📋 SUMMARY - WHAT TO DO NEXT:
-"""
+""")
             
-            # Action items (use string versions)
-            if signal_str == "STRONG" and trend_str == "BULLISH":
-                output += f"""   1. ✅ This is a STRONG BUY opportunity
-   2. 💰 Prepare ${position_info['total_cost']:,.2f} to buy {position_info['num_shares']} shares
-   3. 📈 Buy at ${entry_price:.2f} or better
-   4. 🛡️ Set stop loss at ${stop_loss:.2f} (protects you from big losses)
-   5. 🎯 Target price: ${target_price:.2f} (consider selling here)
-   6. ⏰ Timeframe: {forecast_timeframe}
-   7. 📊 Expected move: {abs(forecast_pct):.2f}% {'up' if forecast_direction == 'UP' else ''}
-"""
-            elif signal_str == "WEAK" or trend_str == "BEARISH":
-                output += f"""   1. ⏸️ WAIT - Not a good time to buy
-   2. 👀 Watch for trend reversal or stronger signals
-   3. 📊 Check back in a few days/weeks
-   4. 🔍 Look for other stocks with better opportunities
-   5. 📚 Use this time to learn more about the company
-"""
-            else:
-                output += f"""   1. ⚠️ CAUTION - Mixed signals
-   2. 🤔 Wait for stronger confirmation
-   3. 💡 If buying, use smaller position size
-   4. 🛡️ Be extra careful with stop loss
-   5. 📊 Monitor closely for clearer signals
-"""
+            parts.append(_SUMMARIES[mode].format(**template_fields))
             
-            output += f"""
+            parts.append(f"""
 ⚠️  IMPORTANT REMINDERS:
    • Never invest more than you can afford to lose
    • Always use stop losses (safety nets)
@@ -1267,14 +1709,36 @@ class TradingStrategyAnalyzer:
    • Consider your risk tolerance
    • This is not financial advice - just analysis!
 
-"""
+""")
             
-            return output
+            return "".join(parts)
             
         except Exception as e:
             return f"Error in comprehensive analysis for {ticker_symbol}: {str(e)}"
 
 
+# Worker for TradingStrategyAnalyzer.analyze_many; module level so that it can be pickled
+# into a process pool. Histories fetched by one worker are shared with the others (and with
+# later calls) through the on-disk history cache
+def _analyze_one(job: tuple) -> Tuple[str, "TradeAnalysis | str"]:
+    (ticker_symbol, period, risk_reward_ratio, stop_loss_method, stop_loss_percentage,
+     atr_multiplier, use_advanced_indicators) = job
+    try:
+        return ticker_symbol, TradingStrategyAnalyzer.analyze_trading_opportunity_raw(
+            ticker_symbol,
+            period=period,
+            risk_reward_ratio=risk_reward_ratio,
+            stop_loss_method=stop_loss_method,
+            stop_loss_percentage=stop_loss_percentage,
+            atr_multiplier=atr_multiplier,
+            use_advanced_indicators=use_advanced_indicators,
+        )
+    except DataFetchError as e:
+        return ticker_symbol, str(e)
+    except Exception as e:
+        return ticker_symbol, f"Error analyzing {ticker_symbol}: {str(e)}"
+
+
 if __name__ == "__main__":
     # Example usage:
     start_date = "2011-01-01"
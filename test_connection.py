@@ -2,8 +2,11 @@
 """
 Simple test script to diagnose connection issues
 """
+import hashlib
 import json
+import os
 import sys
+import time
 import warnings
 warnings.filterwarnings("ignore")
 
@@ -27,24 +30,32 @@ if not api_key or api_key.startswith('<'):
 
 print(f"✓ API key found (length: {len(api_key)})")
 
+# Successful validations are remembered for a few minutes (failures are never cached)
+KEY_CACHE_PATH = os.path.expanduser("~/.finrobot/key_cache.json")
+KEY_CACHE_TTL = 600
+key_hash = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+try:
+    with open(KEY_CACHE_PATH) as f:
+        key_cache = json.load(f)
+except (OSError, ValueError):
+    key_cache = {}
+
+now = time.time()
+key_cache = {h: entry for h, entry in key_cache.items() if entry.get("expires_at", 0) > now}
+if key_hash in key_cache:
+    print("✓ API key validated (cached)")
+    sys.exit(0)
+
 # Test with autogen
 try:
     import autogen
-    llm_config = {
-        "config_list": autogen.config_list_from_json("OAI_CONFIG_LIST"),
-        "timeout": 30,
-    }
-    print("✓ LLM config created")
     
-    # Try a simple test
+    # Try a simple test (reuses the config list parsed above)
     print("\nTesting API connection...")
-    test_config = {
-        "config_list": [config_list[0]],
-        "timeout": 30,
-    }
     
     # Create wrapper
-    wrapper = autogen.oai.OpenAIWrapper(**test_config)
+    wrapper = autogen.oai.OpenAIWrapper(config_list=[config_list[0]], timeout=30)
     print("✓ OpenAIWrapper created")
     
     # Try a minimal API call
@@ -57,6 +68,14 @@ try:
     print("✓ API call successful!")
     print(f"Response: {response.choices[0].message.content}")
     
+    key_cache[key_hash] = {"expires_at": time.time() + KEY_CACHE_TTL}
+    try:
+        os.makedirs(os.path.dirname(KEY_CACHE_PATH), exist_ok=True)
+        with open(KEY_CACHE_PATH, "w") as f:
+            json.dump(key_cache, f)
+    except OSError:
+        pass  # Caching is best effort
+    
 except Exception as e:
     error_type = type(e).__name__
     error_msg = str(e)
@@ -2,14 +2,36 @@
 """
 Test script to verify web interface endpoints work correctly
 """
+import asyncio
 import requests
 import json
+import threading
 import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE_URL = "http://localhost:8250"
 
-def test_comprehensive_analysis():
+# requests.Session is not thread-safe, so each worker thread gets its own keep-alive session
+_LOCAL = threading.local()
+
+def _session():
+    """Return the calling thread's pooled session, creating it on first use."""
+    session = getattr(_LOCAL, "session", None)
+    if session is None:
+        session = _LOCAL.session = requests.Session()
+        session.mount(
+            "http://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=Retry(total=2, backoff_factor=0.3)),
+        )
+    return session
+
+def _post(url, **kwargs):
+    return _session().post(url, **kwargs)
+
+async def test_comprehensive_analysis():
     """Test the comprehensive analysis endpoint"""
+    outcome = {"endpoint": "/comprehensive-analysis", "ok": False}
     print("Testing Comprehensive Analysis Endpoint...")
     print("=" * 60)
     
@@ -30,7 +52,9 @@ def test_comprehensive_analysis():
         print(f"Sending request to {BASE_URL}/comprehensive-analysis...")
         print(f"Data: {json.dumps(test_data, indent=2)}")
         
-        response = requests.post(
+        # Blocking calls run in a worker thread so other endpoint tests proceed meanwhile
+        response = await asyncio.to_thread(
+            _post,
             f"{BASE_URL}/comprehensive-analysis",
             json=test_data,
             timeout=180  # 3 minutes timeout
@@ -43,6 +67,8 @@ def test_comprehensive_analysis():
             print(f"Success: {data.get('success', False)}")
             
             if data.get('success'):
+                outcome["ok"] = True
+                outcome["session_id"] = data.get('session_id')
                 print(f"✓ Analysis completed successfully!")
                 print(f"✓ Session ID: {data.get('session_id', 'Not provided')}")
                 result = data.get('result', '')
@@ -69,6 +95,58 @@ def test_comprehensive_analysis():
         print("✗ Connection error - Is the server running on port 8250?")
     except Exception as e:
         print(f"✗ Error: {str(e)}")
+    
+    return outcome
+
+async def test_trading_strategy():
+    """Test the trading strategy endpoint (technical analysis only, no LLM call)"""
+    print("Testing Trading Strategy Endpoint...")
+    print("=" * 60)
+    result = {"endpoint": "/trading-strategy", "ok": False}
+    
+    test_data = {
+        "ticker": "AAPL",
+        "riskReward": 2.0,
+        "stopLossMethod": "atr",
+        "period": "6mo",
+        "stopLossPct": 2.0,
+        "runBacktest": False
+    }
+    
+    try:
+        response = await asyncio.to_thread(
+            _post,
+            f"{BASE_URL}/trading-strategy",
+            json=test_data,
+            timeout=60
+        )
+        
+        if response.status_code == 200:
+            data = response.json()
+            if data.get('success'):
+                result["ok"] = True
+                print(f"✓ Trading strategy returned {len(data.get('result', ''))} characters")
+            else:
+                print(f"✗ Trading strategy error: {data.get('error', 'Unknown error')}")
+        else:
+            print(f"✗ Trading strategy HTTP Error {response.status_code}")
+            
+    except requests.exceptions.Timeout:
+        print("✗ Trading strategy request timed out")
+    except requests.exceptions.ConnectionError:
+        print("✗ Connection error - Is the server running on port 8250?")
+    except Exception as e:
+        print(f"✗ Trading strategy error: {str(e)}")
+    
+    return result
+
+async def run_endpoint_tests():
+    """Run the independent endpoint tests concurrently; comprehensive analysis is the long pole."""
+    return await asyncio.gather(
+        test_comprehensive_analysis(),
+        test_trading_strategy(),
+        return_exceptions=True,
+    )
 
 def test_chat_endpoint():
     """Test the chat endpoint (requires a session)"""
@@ -82,12 +160,19 @@ if __name__ == "__main__":
     print("=" * 60)
     print(f"Testing against: {BASE_URL}\n")
     
-    # Test comprehensive analysis
-    test_comprehensive_analysis()
+    # Test the independent endpoints concurrently
+    results = asyncio.run(run_endpoint_tests())
     
     # Note about chat
     test_chat_endpoint()
     
+    print("\nSummary:")
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"  ✗ {type(result).__name__}: {result}")
+        else:
+            print(f"  {'✓' if result['ok'] else '✗'} {result['endpoint']}")
+    
     print("\n" + "=" * 60)
     print("Test completed!")
 
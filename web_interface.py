@@ -4,26 +4,533 @@ Simple Web Interface for FinRobot
 
 Run this script and open http://localhost:8250 in your browser
 (Default port is 8250, or specify a custom port as argument)
+
+Set WEB_PRODUCTION=1 to serve through gunicorn (one gthread worker, WEB_THREADS threads)
+instead of the Werkzeug development server. Chat sessions and in-flight analyses are
+kept in process memory, so WEB_WORKERS above 1 needs sticky sessions in front of it.
+
+With asgiref and uvicorn installed, the app can also be served by an ASGI server:
+    uvicorn web_interface:asgi_app --port 8250 --workers 1
 """
 
 import warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="pydantic")
 
-from flask import Flask, render_template_string, request, jsonify, send_from_directory, make_response
-import autogen
-from finrobot.agents.workflow import SingleAssistant
+from flask import Flask, Response, request, jsonify, send_from_directory
+from jinja2 import FileSystemBytecodeCache
+import httpx
 from finrobot.utils import get_current_date, register_keys_from_json
-from finrobot.functional.quantitative import TradingStrategyAnalyzer
-from finrobot.agents.trading_chat_agent import create_trading_chat_agent, process_chat_message
-from finrobot.functional.charting import MplFinanceUtils
 import os
+import gzip
+import hashlib
+import json
+import multiprocessing
+import queue
+import threading
+import time
 import uuid
 import re
+import sqlite3
+import tempfile
+from collections import OrderedDict, defaultdict
+from contextlib import closing, contextmanager
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
 
 app = Flask(__name__)
 app.secret_key = os.urandom(24)  # For session management
 
+# ASGI entry point for uvicorn; the long LLM-bound views run in its thread pool
+try:
+    from asgiref.wsgi import WsgiToAsgi
+    asgi_app = WsgiToAsgi(app)
+except ImportError:
+    asgi_app = None
+
+# Accepted analysis form values; anything else gets a 400 before any data or LLM work starts
+_TICKER_RE = re.compile(r'^[A-Z0-9.^=-]{1,15}$')
+_MODELS = ("gemini", "openai")
+_PERIODS = ("1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max")
+_STOP_LOSS_METHODS = ("atr", "percentage", "support")
+_MAX_QUERY_LENGTH = 4000
+
+def _bad_request(message):
+    return jsonify({"success": False, "error": message}), 400
+
+def _ticker_field(data):
+    ticker = str(data.get('ticker', 'AAPL')).strip().upper()
+    if not _TICKER_RE.match(ticker):
+        raise ValueError(f"Invalid ticker symbol: {ticker[:20]!r}")
+    return ticker
+
+def _choice_field(data, name, default, allowed):
+    value = data.get(name, default)
+    if value not in allowed:
+        raise ValueError(f"{name} must be one of: {', '.join(allowed)}")
+    return value
+
+def _number_field(data, name, default, low, high):
+    try:
+        value = float(data.get(name, default))
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a number")
+    if not low <= value <= high:  # Also rejects NaN
+        raise ValueError(f"{name} must be between {low:g} and {high:g}")
+    return value
+
+# Default chat prompts. The instructions are the same for every request and come before the ticker
+# and date, so providers that cache prompt prefixes (e.g. OpenAI) can reuse them across tickers.
+_MARKET_ANALYSIS_PROMPT = (
+    "Use all the tools provided to retrieve information available for the company below "
+    "upon the date below. Analyze the positive developments and potential "
+    "concerns of the company with 2-4 most important factors respectively and keep "
+    "them concise. Most factors should be inferred from company related news. "
+    "Then make a rough prediction (e.g. up/down by 2-3%) of the stock "
+    "price movement for next week. Provide a summary analysis to support your prediction.\n\n"
+    "Company: {ticker}\n"
+    "Date: {date}"
+)
+_RESEARCH_PROMPT = (
+    "Use all the tools provided to retrieve information available for the company below "
+    "upon the date below. Analyze and explain:\n"
+    "1. Why is the stock price rising or falling? (Based on recent news, earnings, and market conditions)\n"
+    "2. Is the company healthy? (Analyze financial health, growth prospects, competitive position)\n"
+    "3. What are the main positive developments? (2-3 key factors)\n"
+    "4. What are the main concerns or risks? (2-3 key factors)\n"
+    "Keep the analysis concise and focused on actionable insights. Most factors should be inferred from company-related news and financial data.\n\n"
+    "Company: {ticker}\n"
+    "Date: {date}"
+)
+
+# Completed analysis reports keyed by a hash of (endpoint, request params), least recently used first
+_RESULT_CACHE_TTL = 300  # seconds
+_RESULT_CACHE_SIZE = 128
+_RESULT_CACHE = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
+
+def _result_key(endpoint, params):
+    """Stable cache key for an analysis request."""
+    payload = json.dumps([endpoint, params], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+def _get_cached_result(key):
+    """Return a cached analysis report, or None if missing or expired."""
+    with _RESULT_CACHE_LOCK:
+        entry = _RESULT_CACHE.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del _RESULT_CACHE[key]
+            return None
+        _RESULT_CACHE.move_to_end(key)
+        return entry[1]
+
+def _store_result(key, result):
+    """Remember a successful analysis report for _RESULT_CACHE_TTL seconds."""
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE[key] = (time.monotonic() + _RESULT_CACHE_TTL, result)
+        _RESULT_CACHE.move_to_end(key)
+        while len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+
+# /analyze reports also persist on disk for the rest of the day (the date is part of their key),
+# so restarts and other worker processes reuse a Market_Analyst run instead of repeating it
+_ANALYZE_STORE_PATH = os.path.expanduser("~/.cache/finrobot/web_analyze.sqlite3")
+
+def _analyze_store():
+    os.makedirs(os.path.dirname(_ANALYZE_STORE_PATH), exist_ok=True)
+    conn = sqlite3.connect(_ANALYZE_STORE_PATH, timeout=5)
+    conn.execute("CREATE TABLE IF NOT EXISTS reports (key TEXT PRIMARY KEY, day TEXT, result TEXT)")
+    return conn
+
+def _load_report(key):
+    try:
+        with closing(_analyze_store()) as conn:
+            row = conn.execute("SELECT result FROM reports WHERE key = ?", (key,)).fetchone()
+    except (OSError, sqlite3.Error):
+        return None
+    return row[0] if row else None
+
+def _save_report(key, day, result):
+    try:
+        with closing(_analyze_store()) as conn, conn:
+            conn.execute("DELETE FROM reports WHERE day < ?", (day,))
+            conn.execute("INSERT OR REPLACE INTO reports VALUES (?, ?, ?)", (key, day, result))
+    except (OSError, sqlite3.Error):
+        pass  # The disk copy is best effort
+
+# Analyses currently being computed, by result key; identical concurrent requests wait on
+# the first one's Future instead of running the pipeline again
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+def _shared_result(key, compute, refresh=False):
+    """
+    Return the cached report for key, or compute it once for all concurrent callers.
+    compute() returns (report, cacheable); only cacheable reports are stored afterwards.
+    With refresh, the cached report is ignored (but a computation already running is shared).
+    """
+    cached = None if refresh else _get_cached_result(key)
+    if cached is not None:
+        return cached
+    
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        owner = future is None
+        if owner:
+            # The previous owner may have stored its report since the check above
+            cached = None if refresh else _get_cached_result(key)
+            if cached is not None:
+                return cached
+            future = _INFLIGHT[key] = Future()
+    if not owner:
+        return future.result()
+    
+    try:
+        result, cacheable = compute()
+        if cacheable:
+            _store_result(key, result)
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[key]
+
+# Analysis endpoints answer with Server-Sent Events when the client asks for text/event-stream:
+# "progress" events while the pipeline runs ("delta" events for LLM tokens as they are generated),
+# then one "result" event with the usual JSON payload
+_SSE_KEEPALIVE = 15  # seconds between comment lines while nothing else is sent
+
+def _wants_event_stream():
+    return request.accept_mimetypes.best == "text/event-stream"
+
+def _ignore_progress(message):
+    pass
+
+class _TokenStream:
+    """
+    autogen IOStream for one streamed request: streamed LLM tokens go to delta(), every
+    other event is printed to the console as usual.
+    """
+    
+    def __init__(self, delta):
+        self.delta = delta
+    
+    def print(self, *objects, sep=" ", end="\n", flush=False):
+        print(*objects, sep=sep, end=end, flush=flush)
+    
+    def send(self, message):
+        from autogen.events.client_events import StreamEvent
+        if isinstance(message, StreamEvent):
+            self.delta(message.content.content)
+        else:
+            message.print()
+    
+    def input(self, prompt="", *, password=False):
+        return ""  # The agents here never ask for human input
+
+def _streaming_tokens():
+    """Whether the current thread runs under _event_stream(..., tokens=True)."""
+    from autogen.io import IOStream
+    return isinstance(IOStream.get_default(), _TokenStream)
+
+def _event_stream(compute, finish=None, tokens=False):
+    """
+    Run compute(progress) in a worker thread and stream what it reports as Server-Sent Events.
+    finish(result), if given, returns extra fields for the final "result" event. With tokens,
+    the LLM chats in compute also stream their replies as "delta" events.
+    """
+    events = queue.Queue()
+    
+    def progress(message):
+        events.put(("progress", {"message": message}))
+    
+    def delta(text):
+        events.put(("delta", {"delta": text}))
+    
+    def worker():
+        try:
+            if tokens:
+                from autogen.io import IOStream
+                # IOStream defaults are per thread, so only this request's chats stream here
+                with IOStream.set_default(_TokenStream(delta)):
+                    result = compute(progress)
+            else:
+                result = compute(progress)
+            payload = {"success": True, "result": result}
+            if finish is not None:
+                payload.update(finish(result))
+        except Exception as e:
+            payload = {"success": False, "error": str(e)}
+        events.put(("result", payload))
+        events.put(None)
+    
+    def generate():
+        while True:
+            try:
+                item = events.get(timeout=_SSE_KEEPALIVE)
+            except queue.Empty:
+                yield ": keepalive\n\n"
+                continue
+            if item is None:
+                return
+            event, data = item
+            yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+    
+    threading.Thread(target=worker, daemon=True).start()
+    response = Response(generate(), mimetype="text/event-stream")
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # Don't let nginx hold the events back
+    return response
+
+# Background price-history fetches and analyses that overlap the Yahoo round-trip with other request work
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="prefetch")
+
+# autogen, the agents and the analyzer (pandas, yfinance, openai, ...) take seconds to import,
+# so they are imported inside the functions that use them rather than at startup
+
+def _prefetch_history(ticker, period=None, start=None, end=None):
+    try:
+        from finrobot.functional.quantitative import TradingStrategyAnalyzer
+        TradingStrategyAnalyzer.fetch_bulk([ticker], period=period, start=start, end=end)
+    except Exception:
+        pass  # The analysis fetches (and reports errors) itself
+
+def _warm_cache(ticker, period=None, start=None, end=None):
+    """Start loading a price history into the shared history cache; returns the Future."""
+    return _PREFETCH_POOL.submit(_prefetch_history, ticker, period, start, end)
+
+# Worker processes for backtests, so their pandas and formatting work doesn't hold this process's
+# GIL. Workers read the history the request prefetched from the analyzer's on-disk store. Spawned
+# rather than forked, since forking a threaded server can copy locks held by other threads.
+_CPU_POOL = None
+_CPU_POOL_LOCK = threading.Lock()
+
+def _cpu_pool():
+    global _CPU_POOL
+    with _CPU_POOL_LOCK:
+        if _CPU_POOL is None:
+            _CPU_POOL = ProcessPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _CPU_POOL
+
+def _run_backtest(ticker, start_date, end_date, entry_price, stop_loss, target_price):
+    from finrobot.functional.quantitative import TradingStrategyAnalyzer
+    return TradingStrategyAnalyzer.backtest_strategy_recommendations(
+        ticker_symbol=ticker,
+        start_date=start_date,
+        end_date=end_date,
+        entry_price=entry_price,
+        stop_loss=stop_loss,
+        target_price=target_price,
+        use_advanced_indicators=True
+    )
+
+def _backtest_in_worker(*args):
+    """Run _run_backtest(*args) in the CPU pool, or in this process if the pool has died."""
+    global _CPU_POOL
+    pool = _cpu_pool()
+    try:
+        return pool.submit(_run_backtest, *args).result()
+    except BrokenProcessPool:
+        with _CPU_POOL_LOCK:
+            if _CPU_POOL is pool:
+                _CPU_POOL = None  # Start a fresh pool next time
+        return _run_backtest(*args)
+
+class _SharedHTTPClient(httpx.Client):
+    """httpx client that agents share instead of deep-copying it out of their llm_config."""
+    
+    def __deepcopy__(self, memo):
+        return self
+
+# One keep-alive connection pool for every OpenAI-compatible LLM client, so agents created
+# per request reuse open TLS connections instead of handshaking again
+_LLM_HTTP_CLIENT = _SharedHTTPClient(
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=60),
+    timeout=120,
+)
+
+# Config lists parsed from LLM config files, by (file, model filter), with the file's mtime when parsed
+_LLM_CONFIG_CACHE = {}
+
+def _build_llm_config(config_file, model_filter, temperature=0, stream=False):
+    """
+    Load the LLM config for model_filter from config_file, wired to the shared HTTP client.
+    With stream, OpenAI-compatible entries stream their replies token by token.
+    """
+    key = (config_file, tuple(model_filter))
+    mtime = os.stat(config_file).st_mtime_ns
+    cached = _LLM_CONFIG_CACHE.get(key)
+    if cached is None or cached[0] != mtime:
+        import autogen
+        
+        llm_config_obj = autogen.LLMConfig.from_json(
+            path=config_file,
+            filter_dict={"model": model_filter},
+        )
+        config_list = [
+            # Other providers (e.g. Gemini) use their own SDK clients
+            entry.model_copy(update={"http_client": _LLM_HTTP_CLIENT})
+            if getattr(entry, "api_type", None) == "openai" else entry
+            for entry in llm_config_obj.config_list
+        ]
+        cached = _LLM_CONFIG_CACHE[key] = (mtime, config_list)
+    config_list = list(cached[1])
+    if stream:
+        # Gemini entries have no token streaming in autogen; their event streams only carry
+        # the per-message progress events
+        config_list = [
+            entry.model_copy(update={"stream": True})
+            if getattr(entry, "api_type", None) == "openai" else entry
+            for entry in config_list
+        ]
+    return {
+        "config_list": config_list,
+        "timeout": 120,
+        "temperature": temperature,
+    }
+
+# Once the server starts, a background thread opens a connection to each OpenAI-compatible endpoint
+# in OAI_CONFIG_LIST and pings it within keepalive_expiry, so the next analysis finds a warm socket.
+# It pauses while no request has come in for _LLM_WARMUP_IDLE seconds and resumes with the next one.
+_LLM_WARMUP_INTERVAL = 30  # seconds
+_LLM_WARMUP_IDLE = 600  # seconds
+_LAST_REQUEST = time.monotonic()
+
+@app.before_request
+def _note_request():
+    global _LAST_REQUEST
+    _LAST_REQUEST = time.monotonic()
+
+def _llm_endpoints(config_file="OAI_CONFIG_LIST"):
+    """(base URL, API key) pairs of the OpenAI-compatible entries in config_file."""
+    try:
+        with open(config_file) as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return []
+    endpoints = set()
+    for entry in entries:
+        if entry.get("api_type", "openai") == "openai" and entry.get("api_key"):
+            endpoints.add((entry.get("base_url") or "https://api.openai.com/v1", entry["api_key"]))
+    return sorted(endpoints)
+
+def _keep_llm_connections_warm():
+    rejected = set()
+    while True:
+        if time.monotonic() - _LAST_REQUEST > _LLM_WARMUP_IDLE:
+            time.sleep(_LLM_WARMUP_INTERVAL)
+            continue
+        for base_url, api_key in _llm_endpoints():
+            if (base_url, api_key) in rejected:
+                continue
+            try:
+                # Listing models is free and proves the TLS connection works end to end
+                response = _LLM_HTTP_CLIENT.get(
+                    base_url.rstrip("/") + "/models",
+                    headers={"Authorization": f"Bearer {api_key}"},
+                    timeout=10,
+                )
+                if response.status_code in (401, 403):
+                    rejected.add((base_url, api_key))  # Don't keep pinging with a bad key
+            except httpx.HTTPError:
+                pass  # Offline or endpoint down: try again next round
+        time.sleep(_LLM_WARMUP_INTERVAL)
+
+def _start_llm_warmup():
+    threading.Thread(target=_keep_llm_connections_warm, name="llm-warmup", daemon=True).start()
+
+def production_app():
+    """gunicorn entry point: the app, plus the background warmup that __main__ starts for the dev server."""
+    _start_llm_warmup()
+    _start_agent_prewarm()
+    return app
+
+# Idle SingleAssistant agents by (name, config file and its mtime, models, reply limit, token
+# streaming). Agents are reset before they go back, so requests skip re-registering tools and
+# re-creating LLM clients.
+_AGENT_POOL = defaultdict(queue.LifoQueue)
+_AGENT_POOL_LOCK = threading.Lock()
+
+def _agent_pool(name, config_file, model_filter, max_consecutive_auto_reply, stream):
+    key = (name, config_file, os.stat(config_file).st_mtime_ns, tuple(model_filter), max_consecutive_auto_reply,
+           stream)
+    with _AGENT_POOL_LOCK:
+        return _AGENT_POOL[key]
+
+def _new_assistant(name, config_file, model_filter, max_consecutive_auto_reply, stream):
+    from finrobot.agents.workflow import SingleAssistant
+    
+    return SingleAssistant(
+        name,
+        _build_llm_config(config_file, model_filter, stream=stream),
+        human_input_mode="NEVER",
+        max_consecutive_auto_reply=max_consecutive_auto_reply,
+    )
+
+@contextmanager
+def _pooled_assistant(name, config_file, model_filter, max_consecutive_auto_reply, progress=_ignore_progress):
+    """
+    Borrow a SingleAssistant for one chat, creating it if none is idle. Every message the
+    assistant agent sends during the chat is passed on to progress(), and the LLM streams
+    tokens only when the chat runs under _event_stream(..., tokens=True).
+    """
+    stream = _streaming_tokens()
+    pool = _agent_pool(name, config_file, model_filter, max_consecutive_auto_reply, stream)
+    try:
+        assistant = pool.get_nowait()
+    except queue.Empty:
+        assistant = _new_assistant(name, config_file, model_filter, max_consecutive_auto_reply, stream)
+    
+    def forward(sender, message, recipient, silent):
+        content = message.get("content") if isinstance(message, dict) else message
+        if content:
+            progress(str(content))
+        return message
+    
+    hooks = assistant.assistant.hook_lists["process_message_before_send"]
+    if progress is not _ignore_progress:
+        hooks.append(forward)
+    try:
+        yield assistant
+    finally:
+        if forward in hooks:
+            hooks.remove(forward)
+        try:
+            assistant.reset()
+        except Exception:
+            pass  # Don't pool an agent that could not be reset
+        else:
+            pool.put(assistant)
+
+# Agents built for each configured provider when the server starts, so the first requests don't
+# pay for importing autogen, registering tools and creating the LLM clients
+_AGENT_PREWARM = 2  # Market_Analyst agents per provider, with and without token streaming
+_PROVIDER_CONFIGS = (("GEMINI_CONFIG_LIST", ["gemini-2.5-flash"]), ("OAI_CONFIG_LIST", ["gpt-4o"]))
+
+def _prewarm_agents():
+    for config_file, model_filter in _PROVIDER_CONFIGS:
+        if not os.path.exists(config_file):
+            continue
+        try:
+            for stream in (False, True):
+                pool = _agent_pool("Market_Analyst", config_file, model_filter, 10, stream)
+                for _ in range(_AGENT_PREWARM - pool.qsize()):
+                    pool.put(_new_assistant("Market_Analyst", config_file, model_filter, 10, stream))
+        except Exception as e:
+            # Requests build their own agent and report the error themselves
+            print(f"Could not pre-warm Market_Analyst for {config_file}: {e}")
+
+def _start_agent_prewarm():
+    threading.Thread(target=_prewarm_agents, name="agent-prewarm", daemon=True).start()
+
 # Session storage (in-memory dict for simplicity)
 # In production, consider using Redis or database
 sessions = {}
@@ -49,6 +556,7 @@ def get_or_create_session(session_id=None):
         "ticker": None,
         "analysis_params": {},
         "last_analysis": "",
+        "last_analysis_head": "",
         "conversation_history": [],
         "agent_context": {},
         "created_at": datetime.now()
@@ -67,6 +575,7 @@ def generate_chart(ticker, period="6mo", chart_type="candle", mav=None):
     """Generate a trading chart and return the URL."""
     try:
         from finrobot.data_source.yfinance_utils import YFinanceUtils
+        from finrobot.functional.charting import MplFinanceUtils
         import yfinance as yf
         import time
         
@@ -114,914 +623,225 @@ def generate_chart(ticker, period="6mo", chart_type="candle", mav=None):
         print(f"Chart generation error: {str(e)}")
         return None
 
-# HTML Template
-HTML_TEMPLATE = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>FinRobot - Market Analyst</title>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }
-        .main-wrapper {
-            display: flex;
-            gap: 20px;
-            align-items: flex-start;
-        }
-        .container {
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            flex: 1;
-            min-width: 0;
-        }
-        .container.full-width {
-            flex: 1 1 100%;
-        }
-        h1 {
-            color: #2c3e50;
-            text-align: center;
-        }
-        .form-group {
-            margin: 20px 0;
-        }
-        label {
-            display: block;
-            margin-bottom: 5px;
-            font-weight: bold;
-            color: #34495e;
-        }
-        input, select, textarea {
-            width: 100%;
-            padding: 10px;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-            font-size: 14px;
-        }
-        button {
-            background: #3498db;
-            color: white;
-            padding: 12px 30px;
-            border: none;
-            border-radius: 5px;
-            cursor: pointer;
-            font-size: 16px;
-            width: 100%;
-        }
-        button:hover {
-            background: #2980b9;
-        }
-        button:disabled {
-            background: #95a5a6;
-            cursor: not-allowed;
-        }
-        .result {
-            margin-top: 30px;
-            padding: 20px;
-            background: #ecf0f1;
-            border-radius: 5px;
-            white-space: pre-wrap;
-            font-family: monospace;
-            display: block !important;
-            visibility: visible !important;
-            min-height: 50px;
-        }
-        #result {
-            display: block !important;
-            visibility: visible !important;
-        }
-        .loading {
-            text-align: center;
-            color: #7f8c8d;
-        }
-        .error {
-            color: #e74c3c;
-            background: #fadbd8;
-            padding: 15px;
-            border-radius: 5px;
-            margin-top: 20px;
-        }
-        .info-panel {
-            background: #e8f4f8;
-            border-left: 4px solid #3498db;
-            padding: 15px;
-            margin: 20px 0;
-            border-radius: 5px;
-        }
-        .info-panel h3 {
-            margin-top: 0;
-            color: #2c3e50;
-        }
-        .info-panel ul {
-            margin: 10px 0;
-            padding-left: 20px;
-        }
-        .info-panel li {
-            margin: 8px 0;
-        }
-        small {
-            font-size: 12px;
-            line-height: 1.4;
-        }
-        /* Chat Panel Styles */
-        .chat-toggle-btn {
-            position: fixed;
-            bottom: 20px;
-            right: 20px;
-            background: #27ae60;
-            color: white;
-            border: none;
-            padding: 15px 20px;
-            border-radius: 50px;
-            cursor: pointer;
-            font-size: 16px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-            z-index: 1000;
-            display: block;
-            transition: all 0.3s ease;
-        }
-        .chat-toggle-btn:hover {
-            background: #229954;
-            transform: scale(1.05);
-        }
-        .chat-toggle-btn:active {
-            transform: scale(0.95);
-        }
-        .chat-toggle-btn.has-session {
-            background: #3498db;
-            animation: pulse 2s infinite;
-        }
-        @keyframes pulse {
-            0%, 100% { box-shadow: 0 4px 6px rgba(0,0,0,0.1); }
-            50% { box-shadow: 0 4px 12px rgba(52, 152, 219, 0.5); }
-        }
-        .chat-panel {
-            background: white;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            width: 400px;
-            display: none;
-            flex-direction: column;
-            height: 600px;
-            position: fixed;
-            bottom: 80px;
-            right: 20px;
-            z-index: 999;
-            transition: opacity 0.3s ease;
-        }
-        .chat-panel.active {
-            display: flex !important;
-            opacity: 1;
-        }
-        .chat-header {
-            background: #3498db;
-            color: white;
-            padding: 15px;
-            border-radius: 10px 10px 0 0;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        .chat-header h3 {
-            margin: 0;
-            font-size: 18px;
-        }
-        .chat-close-btn {
-            background: transparent;
-            border: none;
-            color: white;
-            font-size: 24px;
-            cursor: pointer;
-            padding: 0;
-            width: 30px;
-            height: 30px;
-            line-height: 30px;
-        }
-        .chat-messages {
-            flex: 1;
-            overflow-y: auto;
-            padding: 15px;
-            background: #f8f9fa;
-        }
-        .chat-message {
-            margin-bottom: 15px;
-            padding: 12px 15px;
-            border-radius: 12px;
-            max-width: 85%;
-            word-wrap: break-word;
-            box-shadow: 0 1px 2px rgba(0,0,0,0.1);
-            line-height: 1.5;
-        }
-        .chat-message.user {
-            background: linear-gradient(135deg, #3498db 0%, #2980b9 100%);
-            color: white;
-            margin-left: auto;
-            text-align: left;
-            border-bottom-right-radius: 4px;
-        }
-        .chat-message.assistant {
-            background: #ffffff;
-            color: #2c3e50;
-            border: 1px solid #e0e0e0;
-            border-bottom-left-radius: 4px;
-        }
-        .chat-message.error {
-            background: #fee;
-            color: #c33;
-            border: 1px solid #fcc;
-            border-bottom-left-radius: 4px;
-        }
-        .chat-message.loading {
-            background: #f8f9fa;
-            color: #7f8c8d;
-            font-style: italic;
-            border: 1px solid #e0e0e0;
-        }
-        .chat-message img {
-            max-width: 100%;
-            border-radius: 8px;
-            margin-top: 10px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.15);
-            display: block;
-        }
-        .chat-message .chart-container {
-            margin-top: 10px;
-            text-align: center;
-        }
-        .chat-message .chart-container img {
-            max-width: 100%;
-            height: auto;
-        }
-        .chat-input-area {
-            padding: 15px;
-            border-top: 1px solid #ddd;
-            display: flex;
-            gap: 10px;
-        }
-        .chat-input {
-            flex: 1;
-            padding: 10px;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-            font-size: 14px;
-        }
-        .chat-send-btn {
-            background: #3498db;
-            color: white;
-            border: none;
-            padding: 10px 20px;
-            border-radius: 5px;
-            cursor: pointer;
-        }
-        .chat-send-btn:hover {
-            background: #2980b9;
-        }
-        .chat-send-btn:disabled {
-            background: #95a5a6;
-            cursor: not-allowed;
-        }
-        .param-confirmation {
-            background: #fff3cd;
-            border: 2px solid #ffc107;
-            border-radius: 8px;
-            padding: 15px;
-            margin: 10px 0;
-        }
-        .param-confirmation h4 {
-            margin-top: 0;
-            color: #856404;
-        }
-        .param-confirmation-buttons {
-            display: flex;
-            gap: 10px;
-            margin-top: 10px;
-        }
-        .param-confirm-btn {
-            background: #28a745;
-            color: white;
-            border: none;
-            padding: 8px 15px;
-            border-radius: 5px;
-            cursor: pointer;
-        }
-        .param-reject-btn {
-            background: #dc3545;
-            color: white;
-            border: none;
-            padding: 8px 15px;
-            border-radius: 5px;
-            cursor: pointer;
-        }
-        .toggle-info {
-            background: #16a085;
-            color: white;
-            padding: 8px 15px;
-            border: none;
-            border-radius: 5px;
-            cursor: pointer;
-            font-size: 14px;
-            margin: 10px 0;
-        }
-        .toggle-info:hover {
-            background: #138d75;
-        }
-        #indicatorInfo {
-            display: none;
-        }
-    </style>
-</head>
-<body>
-    <div class="main-wrapper">
-    <div class="container" id="mainContainer">
-        <h1>🤖 FinRobot - Market Analyst</h1>
-        
-        <button type="button" class="toggle-info" onclick="toggleInfo()">
-            📚 Learn About Technical Indicators (Click to Expand)
-        </button>
-        
-        <div id="indicatorInfo" class="info-panel">
-            <h3>📊 Understanding Technical Indicators - A Beginner's Guide</h3>
-            
-            <h4>🎯 What Are Technical Indicators?</h4>
-            <p>Technical indicators are mathematical calculations based on a stock's price and volume. Think of them as tools that help you understand market sentiment and predict potential price movements. They're like a weather forecast for stocks - not 100% accurate, but helpful for making informed decisions.</p>
-            
-            <h4>1. 📈 Moving Averages (MA)</h4>
-            <p><strong>What it is:</strong> A moving average smooths out price data to show the average price over a specific period (like 20 or 50 days).</p>
-            <p><strong>Simple Explanation:</strong> Imagine you're tracking your daily spending. A 7-day moving average would show your average spending over the last week, smoothing out daily ups and downs.</p>
-            <ul>
-                <li><strong>Short MA (20 days):</strong> Shows recent price trends - reacts quickly to price changes</li>
-                <li><strong>Long MA (50 days):</strong> Shows longer-term trends - slower to react but shows the bigger picture</li>
-                <li><strong>What to look for:</strong> When short MA crosses above long MA = BULLISH (price likely to go up). When short MA crosses below long MA = BEARISH (price likely to go down)</li>
-            </ul>
-            
-            <h4>2. 📊 RSI (Relative Strength Index)</h4>
-            <p><strong>What it is:</strong> Measures how fast and how much a stock's price is changing. It ranges from 0 to 100.</p>
-            <p><strong>Simple Explanation:</strong> Like a speedometer for stock prices. If a car is going too fast (overbought) or too slow (oversold), you know it might need to adjust.</p>
-            <ul>
-                <li><strong>RSI below 30:</strong> Stock is OVERSOLD (like a car going too slow) - might be a good time to BUY as price could bounce back</li>
-                <li><strong>RSI above 70:</strong> Stock is OVERBOUGHT (like a car going too fast) - might be a good time to SELL or wait for a pullback</li>
-                <li><strong>RSI 30-70:</strong> Normal range - stock is moving at a healthy pace</li>
-            </ul>
-            
-            <h4>3. 📉 MACD (Moving Average Convergence Divergence)</h4>
-            <p><strong>What it is:</strong> Shows the relationship between two moving averages and helps identify momentum changes.</p>
-            <p><strong>Simple Explanation:</strong> Like a traffic light for stock momentum. When MACD line crosses above the signal line, it's like a green light (momentum building up). When it crosses below, it's like a red light (momentum slowing down).</p>
-            <ul>
-                <li><strong>MACD Line:</strong> The difference between fast and slow moving averages</li>
-                <li><strong>Signal Line:</strong> A smoothed version of the MACD line</li>
-                <li><strong>Histogram:</strong> The difference between MACD and Signal - shows how strong the momentum is</li>
-                <li><strong>BULLISH Signal:</strong> MACD crosses above Signal + Histogram is increasing = Good time to consider buying</li>
-                <li><strong>BEARISH Signal:</strong> MACD crosses below Signal = Consider selling or waiting</li>
-            </ul>
-            
-            <h4>4. 🎯 Bollinger Bands</h4>
-            <p><strong>What it is:</strong> Three lines that form a "band" around the stock price, showing volatility and potential price boundaries.</p>
-            <p><strong>Simple Explanation:</strong> Like a rubber band around the price. When the price touches the edges, it often bounces back toward the middle - like a rubber band snapping back.</p>
-            <ul>
-                <li><strong>Upper Band:</strong> Like a ceiling - price rarely goes above this</li>
-                <li><strong>Middle Band:</strong> The average price (like the center of the rubber band)</li>
-                <li><strong>Lower Band:</strong> Like a floor - price rarely goes below this</li>
-                <li><strong>Price touches Lower Band:</strong> OVERSOLD - might bounce up (potential BUY signal)</li>
-                <li><strong>Price touches Upper Band:</strong> OVERBOUGHT - might pull back (potential SELL signal)</li>
-                <li><strong>%B:</strong> Shows where price is within the bands (0 = at lower band, 1 = at upper band, 0.5 = at middle)</li>
-            </ul>
-            
-            <h4>5. 🛡️ ATR (Average True Range) - For Stop Loss</h4>
-            <p><strong>What it is:</strong> Measures how much a stock's price typically moves (volatility).</p>
-            <p><strong>Simple Explanation:</strong> Like measuring how bumpy a road is. A bumpy road (high volatility) needs more space, while a smooth road (low volatility) needs less.</p>
-            <ul>
-                <li><strong>High ATR:</strong> Stock moves a lot - set stop loss further away (more room for price swings)</li>
-                <li><strong>Low ATR:</strong> Stock moves little - set stop loss closer (less room needed)</li>
-                <li><strong>Why it matters:</strong> Helps set stop loss at the right distance - not too close (gets hit by normal swings) or too far (loses too much if wrong)</li>
-            </ul>
-            
-            <h4>6. 📍 Support and Resistance Levels</h4>
-            <p><strong>What it is:</strong> Price levels where the stock has historically had trouble moving past.</p>
-            <p><strong>Simple Explanation:</strong> Like floors and ceilings in a building. Support is like a floor - price bounces up from here. Resistance is like a ceiling - price bounces down from here.</p>
-            <ul>
-                <li><strong>Support Level:</strong> A price level where buyers often step in (like a safety net) - good place to set stop loss</li>
-                <li><strong>Resistance Level:</strong> A price level where sellers often step in (like a ceiling) - good place to set target price</li>
-                <li><strong>How to use:</strong> Buy near support, sell near resistance. Set stop loss below support, set target near resistance</li>
-            </ul>
-            
-            <h4>7. 💰 Risk-Reward Ratio</h4>
-            <p><strong>What it is:</strong> Compares how much you could lose vs. how much you could gain.</p>
-            <p><strong>Simple Explanation:</strong> Like betting odds. A 2:1 ratio means you risk $1 to potentially make $2. Only take trades where potential reward is greater than risk.</p>
-            <ul>
-                <li><strong>2:1 Ratio:</strong> Risk $1, potential to make $2 - Good ratio</li>
-                <li><strong>3:1 Ratio:</strong> Risk $1, potential to make $3 - Excellent ratio</li>
-                <li><strong>1:1 Ratio:</strong> Risk $1, potential to make $1 - Not ideal (equal risk/reward)</li>
-                <li><strong>Why it matters:</strong> Even if you're wrong 50% of the time, a 2:1 ratio means you'll still profit overall</li>
-            </ul>
-            
-            <h4>🎓 How to Use These Indicators Together</h4>
-            <p><strong>Think of it like a weather forecast:</strong></p>
-            <ul>
-                <li><strong>One indicator says "rain" (bearish):</strong> Maybe it will rain, maybe not</li>
-                <li><strong>Two indicators say "rain":</strong> More likely to rain - be cautious</li>
-                <li><strong>Three+ indicators agree:</strong> Very likely to rain - strong signal!</li>
-            </ul>
-            <p><strong>Our system counts confirmations:</strong></p>
-            <ul>
-                <li><strong>STRONG Signal:</strong> 2+ indicators agree - Higher confidence trade</li>
-                <li><strong>MODERATE Signal:</strong> Mixed signals - Proceed with caution</li>
-                <li><strong>WEAK Signal:</strong> Indicators disagree - Wait for better setup</li>
-            </ul>
-            
-            <h4>⚠️ Important Reminders</h4>
-            <ul>
-                <li><strong>No indicator is 100% accurate</strong> - They're tools, not crystal balls</li>
-                <li><strong>Always use stop loss</strong> - Protects you from big losses</li>
-                <li><strong>Don't risk more than you can afford to lose</strong> - Only trade with money you can lose</li>
-                <li><strong>Multiple confirmations are better</strong> - Wait for 2+ indicators to agree</li>
-                <li><strong>Practice with paper trading first</strong> - Learn without risking real money</li>
-            </ul>
-        </div>
-        
-        <form id="analysisForm" onsubmit="event.preventDefault(); event.stopPropagation(); handleFormSubmit(event); return false;">
-            <div class="form-group">
-                <label for="ticker">Stock Ticker Symbol:</label>
-                <input type="text" id="ticker" name="ticker" value="AAPL" required>
-            </div>
-            
-            <div class="form-group">
-                <label for="model">AI Model:</label>
-                <select id="model" name="model">
-                    <option value="gemini">Gemini 2.5 Flash (Free)</option>
-                    <option value="openai">OpenAI GPT-4 (Requires Billing)</option>
-                </select>
-            </div>
-            
-            <div class="form-group">
-                <label for="analysisType">Analysis Type:</label>
-                <select id="analysisType" name="analysisType">
-                    <option value="market">Market Analysis (AI-Powered)</option>
-                    <option value="trading">Trading Strategy (Entry/Stop/Target)</option>
-                    <option value="comprehensive">Comprehensive Analysis (Recommended)</option>
-                </select>
-            </div>
-            
-            <div class="form-group" id="queryGroup">
-                <label for="query">Custom Query (Optional):</label>
-                <textarea id="query" name="query" rows="3" placeholder="Leave empty for default analysis"></textarea>
-            </div>
-            
-            <div class="form-group" id="tradingParams" style="display: none;">
-                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 15px;">
-                    <div>
-                        <label for="riskReward">Risk-Reward Ratio:</label>
-                        <input type="number" id="riskReward" name="riskReward" value="2.0" step="0.1" min="1.0" max="5.0">
-                    </div>
-                    <div>
-                        <label for="stopLossMethod">Stop Loss Method:</label>
-                        <select id="stopLossMethod" name="stopLossMethod">
-                            <option value="atr">ATR (Volatility-Based)</option>
-                            <option value="percentage">Percentage</option>
-                            <option value="support">Support Level</option>
-                        </select>
-                    </div>
-                    <div>
-                        <label for="period">Analysis Period:</label>
-                        <select id="period" name="period">
-                            <option value="1mo">1 Month</option>
-                            <option value="3mo">3 Months</option>
-                            <option value="6mo" selected>6 Months</option>
-                            <option value="1y">1 Year</option>
-                            <option value="2y">2 Years</option>
-                        </select>
-                    </div>
-                    <div>
-                        <label for="stopLossPct">Stop Loss % (if using percentage):</label>
-                        <input type="number" id="stopLossPct" name="stopLossPct" value="2.0" step="0.1" min="0.5" max="10.0">
-                    </div>
-                    <div style="grid-column: 1 / -1;">
-                        <label style="display: flex; align-items: center; gap: 10px;">
-                            <input type="checkbox" id="runBacktest" name="runBacktest" style="width: auto;">
-                            <span>Run Backtest (Test strategy on historical data)</span>
-                        </label>
-                    </div>
-                </div>
-            </div>
-            
-            <div class="form-group" id="comprehensiveParams" style="display: none;">
-                <div style="background: #e8f4f8; border-left: 4px solid #3498db; padding: 15px; margin-bottom: 20px; border-radius: 5px;">
-                    <strong>📊 Comprehensive Analysis Parameters Guide</strong>
-                    <p style="margin: 10px 0 0 0; font-size: 14px; color: #555;">
-                        These parameters help customize your analysis. Hover over each field for detailed explanations.
-                    </p>
-                </div>
-                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 15px;">
-                    <div>
-                        <label for="compRiskReward" title="Risk-Reward Ratio: How much you could gain vs. how much you could lose. Recommended: 2.0-3.0. Example: 2.0 means you risk $1 to potentially make $2.">
-                            Risk-Reward Ratio: <span style="color: #3498db; cursor: help;" title="Recommended: 2.0-3.0. This is the ratio of potential profit to potential loss. A 2.0 ratio means you risk $1 to make $2. Higher ratios (3.0+) are better but harder to achieve.">ℹ️</span>
-                        </label>
-                        <input type="number" id="compRiskReward" name="compRiskReward" value="2.0" step="0.1" min="1.0" max="5.0" title="Recommended: 2.0-3.0. Lower values (1.0-1.5) are risky. Higher values (3.0+) are ideal but may be harder to achieve.">
-                        <small style="color: #666; display: block; margin-top: 5px;">Recommended: 2.0-3.0 | Range: 1.0-5.0</small>
-                        <small style="color: #888; display: block; margin-top: 2px;">What to expect: Higher ratios = better risk management. The analysis will calculate target price based on this ratio.</small>
-                    </div>
-                    <div>
-                        <label for="compStopLossMethod" title="Stop Loss Method: How to calculate your safety net (stop loss price). ATR adapts to volatility, Percentage is fixed, Support uses price levels.">
-                            Stop Loss Method: <span style="color: #3498db; cursor: help;" title="ATR adapts to stock volatility (best for most stocks). Percentage is simple but may be too tight/loose. Support uses historical price levels.">ℹ️</span>
-                        </label>
-                        <select id="compStopLossMethod" name="compStopLossMethod" title="ATR is recommended for most stocks as it adapts to volatility. Percentage is simpler but less flexible. Support uses historical price levels.">
-                            <option value="atr">ATR (Volatility-Based) - Recommended</option>
-                            <option value="percentage">Percentage - Simple</option>
-                            <option value="support">Support Level - Advanced</option>
-                        </select>
-                        <small style="color: #666; display: block; margin-top: 5px;">Recommended: ATR (adapts to stock volatility)</small>
-                        <small style="color: #888; display: block; margin-top: 2px;">What to expect: ATR gives tighter stops for stable stocks, wider for volatile ones. More accurate than fixed percentages.</small>
-                    </div>
-                    <div>
-                        <label for="compPeriod" title="Analysis Period: How far back to look at price data. Longer periods show bigger trends but may miss recent changes.">
-                            Analysis Period: <span style="color: #3498db; cursor: help;" title="6 months is recommended for most analysis. Shorter periods (1-3mo) show recent trends. Longer periods (1-2y) show major trends but may miss recent changes.">ℹ️</span>
-                        </label>
-                        <select id="compPeriod" name="compPeriod" title="6 months is recommended - balances recent trends with historical context. Use shorter for day trading, longer for long-term investing.">
-                            <option value="1mo">1 Month - Very Recent</option>
-                            <option value="3mo">3 Months - Short Term</option>
-                            <option value="6mo" selected>6 Months - Recommended</option>
-                            <option value="1y">1 Year - Long Term</option>
-                            <option value="2y">2 Years - Very Long Term</option>
-                        </select>
-                        <small style="color: #666; display: block; margin-top: 5px;">Recommended: 6 Months (balances recent and historical data)</small>
-                        <small style="color: #888; display: block; margin-top: 2px;">What to expect: Shorter = more sensitive to recent changes. Longer = more stable but may miss recent trends.</small>
-                    </div>
-                    <div>
-                        <label for="compStopLossPct" title="Stop Loss Percentage: Only used if 'Percentage' method is selected. This is the % drop from entry price where you'll exit.">
-                            Stop Loss % (if using percentage): <span style="color: #3498db; cursor: help;" title="Only used if Stop Loss Method is 'Percentage'. This is how much % drop from entry price triggers your stop loss. 2% is typical for stable stocks, 3-5% for volatile stocks.">ℹ️</span>
-                        </label>
-                        <input type="number" id="compStopLossPct" name="compStopLossPct" value="2.0" step="0.1" min="0.5" max="10.0" title="Only used if Stop Loss Method is 'Percentage'. 2% for stable stocks, 3-5% for volatile stocks.">
-                        <small style="color: #666; display: block; margin-top: 5px;">Recommended: 2.0% (stable stocks) or 3-5% (volatile stocks) | Range: 0.5-10.0%</small>
-                        <small style="color: #888; display: block; margin-top: 2px;">What to expect: Lower % = tighter stop (exits faster). Higher % = wider stop (more room for price swings). Only used with Percentage method.</small>
-                    </div>
-                    <div>
-                        <label for="accountValue" title="Account Value: Your total trading/investment account balance. Used to calculate how many shares you can safely buy.">
-                            Account Value ($): <span style="color: #3498db; cursor: help;" title="Your total account balance. The analysis will calculate position size based on this. Enter your actual account value for accurate recommendations.">ℹ️</span>
-                        </label>
-                        <input type="number" id="accountValue" name="accountValue" value="10000" step="100" min="100" title="Your total account balance. Used to calculate safe position size. Enter your actual account value.">
-                        <small style="color: #666; display: block; margin-top: 5px;">Recommended: Your actual account balance | Minimum: $100</small>
-                        <small style="color: #888; display: block; margin-top: 2px;">What to expect: The analysis will tell you exactly how many shares to buy based on this value and your risk tolerance.</small>
-                    </div>
-                    <div>
-                        <label for="riskPerTrade" title="Risk per Trade: What % of your account you're willing to risk on this single trade. Lower is safer. Professional traders use 1-2%.">
-                            Risk per Trade (%): <span style="color: #3498db; cursor: help;" title="What percentage of your account you're willing to risk on this trade. 1% is conservative (recommended for beginners), 2% is moderate, 3-5% is aggressive. Never risk more than 5% on a single trade.">ℹ️</span>
-                        </label>
-                        <input type="number" id="riskPerTrade" name="riskPerTrade" value="1.0" step="0.1" min="0.1" max="5.0" title="1% is conservative (recommended), 2% is moderate, 3-5% is aggressive. Never exceed 5%.">
-                        <small style="color: #666; display: block; margin-top: 5px;">Recommended: 1.0% (conservative) or 2.0% (moderate) | Range: 0.1-5.0%</small>
-                        <small style="color: #888; display: block; margin-top: 2px;">What to expect: Lower % = smaller position size = less risk. With 1% risk on $10,000 account, you risk $100 max on this trade.</small>
-                    </div>
-                    <div style="grid-column: 1 / -1;">
-                        <label style="display: flex; align-items: center; gap: 10px;" title="Company Research: AI-powered analysis of why the stock is moving, company health, and key factors. Takes longer but provides valuable insights.">
-                            <input type="checkbox" id="includeResearch" name="includeResearch" checked style="width: auto;">
-                            <span>Include Company Research & Health Analysis (AI-Powered) <span style="color: #3498db; cursor: help;" title="When enabled, the AI will research the company, analyze why the stock is rising/falling, assess company health, and identify key positive/negative factors. This adds 30-60 seconds to analysis time but provides valuable fundamental insights.">ℹ️</span></span>
-                        </label>
-                        <small style="color: #666; display: block; margin-top: 5px; margin-left: 28px;">Recommended: Enabled (provides company health, reasons for price movement, and key factors)</small>
-                        <small style="color: #888; display: block; margin-top: 2px; margin-left: 28px;">What to expect: AI will explain why stock is rising/falling, assess company health, and list 2-3 key positive developments and concerns. Adds 30-60 seconds to analysis.</small>
-                    </div>
-                </div>
-            </div>
-            
-            <button type="submit" id="submitBtn">Analyze Stock</button>
-        </form>
-        
-        <div id="result"></div>
-    </div>
-    </div>
-    
-    <!-- Chat functionality temporarily disabled -->
-    <!-- Chat Toggle Button -->
-    <!-- <button class="chat-toggle-btn" id="chatToggleBtn" onclick="toggleChatPanel()">
-        💬 Chat with Analyst
-    </button> -->
-    
-    <!-- Chat Panel -->
-    <!-- <div class="chat-panel" id="chatPanel">
-        <div class="chat-header">
-            <h3>💬 Trading Analyst Chat</h3>
-            <button class="chat-close-btn" onclick="toggleChatPanel()">×</button>
-        </div>
-        <div class="chat-messages" id="chatMessages">
-            <div class="chat-message assistant">
-                👋 Hello! I'm your Trading Analyst Assistant. After you run an analysis, I can help you understand the results, explain technical indicators, generate charts, and answer any questions you have!
-            </div>
-        </div>
-        <div class="chat-input-area">
-            <input type="text" class="chat-input" id="chatInput" placeholder="Ask me anything about the analysis..." onkeypress="handleChatKeyPress(event)" oninput="validateChatInput()">
-            <button class="chat-send-btn" id="chatSendBtn" onclick="sendChatMessage()" disabled>Send</button>
-        </div>
-    </div> -->
-    
-    <script>
-        let currentSessionId = null;
-        
-        // Form submission handler - defined early to be available for inline handler
-        async function handleFormSubmit(e) {
-            try {
-                if (e) {
-                    e.preventDefault();
-                    e.stopPropagation();
-                }
-                console.log('Form submitted!');
-                
-                const submitBtn = document.getElementById('submitBtn');
-                const resultDiv = document.getElementById('result');
-                const analysisType = document.getElementById('analysisType').value;
-                
-                // Validate form
-                if (!resultDiv) {
-                    console.error('Result div not found!');
-                    alert('Error: Result container not found. Please refresh the page.');
-                    return false;
-                }
-                
-                if (!submitBtn) {
-                    console.error('Submit button not found!');
-                    return false;
-                }
-                
-                submitBtn.disabled = true;
-                resultDiv.style.display = 'block';
-                resultDiv.style.visibility = 'visible';
-                resultDiv.innerHTML = '<div class="loading">⏳ Analyzing... This may take a minute.</div>';
-                
-                console.log('Starting analysis with type:', analysisType);
-                
-                const formData = {
-                    ticker: document.getElementById('ticker').value,
-                    model: document.getElementById('model').value,
-                    analysisType: analysisType
-                };
-                
-                if (analysisType === 'market') {
-                    formData.query = document.getElementById('query').value;
-                } else if (analysisType === 'trading') {
-                    formData.riskReward = parseFloat(document.getElementById('riskReward').value);
-                    formData.stopLossMethod = document.getElementById('stopLossMethod').value;
-                    formData.period = document.getElementById('period').value;
-                    formData.stopLossPct = parseFloat(document.getElementById('stopLossPct').value);
-                    formData.runBacktest = document.getElementById('runBacktest').checked;
-                } else if (analysisType === 'comprehensive') {
-                    formData.riskReward = parseFloat(document.getElementById('compRiskReward').value);
-                    formData.stopLossMethod = document.getElementById('compStopLossMethod').value;
-                    formData.period = document.getElementById('compPeriod').value;
-                    formData.stopLossPct = parseFloat(document.getElementById('compStopLossPct').value);
-                    formData.accountValue = parseFloat(document.getElementById('accountValue').value);
-                    formData.riskPerTrade = parseFloat(document.getElementById('riskPerTrade').value);
-                    formData.includeResearch = document.getElementById('includeResearch').checked;
-                }
-                
-                let endpoint = '/analyze';
-                if (analysisType === 'trading') {
-                    endpoint = '/trading-strategy';
-                } else if (analysisType === 'comprehensive') {
-                    endpoint = '/comprehensive-analysis';
-                }
-                
-                console.log('Sending request to:', endpoint, 'with data:', formData);
-                
-                const response = await fetch(endpoint, {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify(formData)
-                });
-                
-                console.log('Response status:', response.status);
-                
-                if (!response.ok) {
-                    throw new Error(`HTTP error! status: ${response.status}`);
-                }
-                
-                const data = await response.json();
-                console.log('Response data:', data);
-                
-                if (data.success) {
-                    // Ensure result div is visible and display results
-                    resultDiv.style.display = 'block';
-                    resultDiv.style.visibility = 'visible';
-                    resultDiv.innerHTML = '<div class="result">' + escapeHtml(data.result) + '</div>';
-                    
-                    // Scroll to results
-                    resultDiv.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
-                    
-                    // Chat functionality temporarily disabled - focus on getting analysis working first
-                    // if (data.session_id) {
-                    //     currentSessionId = data.session_id;
-                    //     console.log('Session initialized:', currentSessionId);
-                    // }
-                } else {
-                    resultDiv.style.display = 'block';
-                    resultDiv.style.visibility = 'visible';
-                    resultDiv.innerHTML = '<div class="error">Error: ' + escapeHtml(data.error || 'Unknown error') + '</div>';
-                }
-            } catch (error) {
-                const resultDiv = document.getElementById('result');
-                if (resultDiv) {
-                    resultDiv.style.display = 'block';
-                    resultDiv.style.visibility = 'visible';
-                    resultDiv.innerHTML = '<div class="error">Error: ' + escapeHtml(error.message || 'Network error occurred') + '</div>';
-                }
-                console.error('Analysis error:', error);
-            } finally {
-                const submitBtn = document.getElementById('submitBtn');
-                if (submitBtn) {
-                    submitBtn.disabled = false;
-                }
-            }
-            return false;
-        }
-        
-        // Make handleFormSubmit globally accessible immediately
-        window.handleFormSubmit = handleFormSubmit;
-        
-        // Chat functions temporarily disabled - focus on getting analysis working first
-        // function validateChatInput() {
-        //     const input = document.getElementById('chatInput');
-        //     const sendBtn = document.getElementById('chatSendBtn');
-        //     const message = input.value.trim();
-        //     
-        //     // Enable/disable send button based on whether there's content
-        //     if (message.length > 0 && currentSessionId) {
-        //         sendBtn.disabled = false;
-        //     } else {
-        //         sendBtn.disabled = true;
-        //     }
-        // }
-        
-        // Toggle indicator info panel
-        function toggleInfo() {
-            const infoPanel = document.getElementById('indicatorInfo');
-            if (infoPanel) {
-                if (infoPanel.style.display === 'none' || infoPanel.style.display === '') {
-                    infoPanel.style.display = 'block';
-                } else {
-                    infoPanel.style.display = 'none';
-                }
-            }
-        }
-        
-        // Make toggleInfo globally accessible
-        window.toggleInfo = toggleInfo;
-        
-        
-        // Toggle trading parameters based on analysis type
-        function setupEventListeners() {
-            const analysisTypeEl = document.getElementById('analysisType');
-            const analysisFormEl = document.getElementById('analysisForm');
-            
-            if (!analysisTypeEl || !analysisFormEl) {
-                console.error('Required form elements not found!');
-                return;
-            }
-            
-            analysisTypeEl.addEventListener('change', function() {
-                const analysisType = this.value;
-                const queryGroup = document.getElementById('queryGroup');
-                const tradingParams = document.getElementById('tradingParams');
-                const comprehensiveParams = document.getElementById('comprehensiveParams');
-                const resultDiv = document.getElementById('result');
-                
-                // Clear previous results when changing analysis type
-                if (resultDiv) {
-                    resultDiv.innerHTML = '';
-                }
-                
-                if (analysisType === 'trading') {
-                    queryGroup.style.display = 'none';
-                    tradingParams.style.display = 'block';
-                    comprehensiveParams.style.display = 'none';
-                } else if (analysisType === 'comprehensive') {
-                    queryGroup.style.display = 'none';
-                    tradingParams.style.display = 'none';
-                    comprehensiveParams.style.display = 'block';
-                } else {
-                    queryGroup.style.display = 'block';
-                    tradingParams.style.display = 'none';
-                    comprehensiveParams.style.display = 'none';
-                }
-            });
-            
-            // Attach form submit handler (backup, inline handler should work)
-            analysisFormEl.addEventListener('submit', function(e) {
-                e.preventDefault();
-                e.stopPropagation();
-                handleFormSubmit(e);
-            });
-            console.log('Form event listener attached');
-        }
-        
-        // Initialize form state on page load
-        document.addEventListener('DOMContentLoaded', function() {
-            // Setup event listeners
-            setupEventListeners();
-            // Set initial form state based on selected analysis type
-            const analysisType = document.getElementById('analysisType');
-            if (analysisType) {
-                analysisType.dispatchEvent(new Event('change'));
-            }
-            
-            // Ensure result div is visible
-            const resultDiv = document.getElementById('result');
-            if (resultDiv) {
-                resultDiv.style.display = 'block';
-                resultDiv.style.visibility = 'visible';
-            }
-            
-            // Chat functionality temporarily disabled
-            // const chatToggleBtn = document.getElementById('chatToggleBtn');
-        });
-        
-        // Also try to setup listeners immediately (in case DOM is already loaded)
-        if (document.readyState === 'loading') {
-            // DOM is still loading, wait for DOMContentLoaded
-        } else {
-            // DOM is already loaded, setup immediately
-            setupEventListeners();
-        }
-        
-        // Chat Functions - temporarily disabled
-        // All chat-related functions commented out to focus on getting analysis working first
-        
-        function escapeHtml(text) {
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
-        }
-    </script>
-</body>
-</html>
-"""
+# The index page (templates/index.html) has no per-request context: render it once at
+# import. Compiled templates are kept in a bytecode cache so restarts skip recompiling.
+_JINJA_CACHE_DIR = os.path.join(tempfile.gettempdir(), "finrobot_jinja_cache")
+os.makedirs(_JINJA_CACHE_DIR, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=_JINJA_CACHE_DIR)
+app.jinja_env.auto_reload = False
+_INDEX_TEMPLATE_PATH = os.path.join(app.root_path, app.template_folder, "index.html")
+_INDEX_TEMPLATE = app.jinja_env.get_template("index.html")
+_HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+
+def _minify_html(html):
+    """Drop HTML comments, indentation and blank lines (the page has no <pre> blocks)."""
+    html = _HTML_COMMENT_RE.sub('', html)
+    return '\n'.join(line.strip() for line in html.splitlines() if line.strip())
+
+# Numeric and select fields of the comprehensive analysis form, rendered by a loop in index.html
+_COMP_FIELDS = [
+    {
+        "id": "compRiskReward",
+        "label": "Risk-Reward Ratio",
+        "label_title": "Risk-Reward Ratio: How much you could gain vs. how much you could lose. Recommended: 2.0-3.0. Example: 2.0 means you risk $1 to potentially make $2.",
+        "tip": "Recommended: 2.0-3.0. This is the ratio of potential profit to potential loss. A 2.0 ratio means you risk $1 to make $2. Higher ratios (3.0+) are better but harder to achieve.",
+        "default": "2.0", "step": "0.1", "min": "1.0", "max": "5.0",
+        "input_title": "Recommended: 2.0-3.0. Lower values (1.0-1.5) are risky. Higher values (3.0+) are ideal but may be harder to achieve.",
+        "hint": "Recommended: 2.0-3.0 | Range: 1.0-5.0",
+        "detail": "What to expect: Higher ratios = better risk management. The analysis will calculate target price based on this ratio.",
+    },
+    {
+        "id": "compStopLossMethod",
+        "label": "Stop Loss Method",
+        "label_title": "Stop Loss Method: How to calculate your safety net (stop loss price). ATR adapts to volatility, Percentage is fixed, Support uses price levels.",
+        "tip": "ATR adapts to stock volatility (best for most stocks). Percentage is simple but may be too tight/loose. Support uses historical price levels.",
+        "default": "atr",
+        "options": [
+            ("atr", "ATR (Volatility-Based) - Recommended"),
+            ("percentage", "Percentage - Simple"),
+            ("support", "Support Level - Advanced"),
+        ],
+        "input_title": "ATR is recommended for most stocks as it adapts to volatility. Percentage is simpler but less flexible. Support uses historical price levels.",
+        "hint": "Recommended: ATR (adapts to stock volatility)",
+        "detail": "What to expect: ATR gives tighter stops for stable stocks, wider for volatile ones. More accurate than fixed percentages.",
+    },
+    {
+        "id": "compPeriod",
+        "label": "Analysis Period",
+        "label_title": "Analysis Period: How far back to look at price data. Longer periods show bigger trends but may miss recent changes.",
+        "tip": "6 months is recommended for most analysis. Shorter periods (1-3mo) show recent trends. Longer periods (1-2y) show major trends but may miss recent changes.",
+        "default": "6mo",
+        "options": [
+            ("1mo", "1 Month - Very Recent"),
+            ("3mo", "3 Months - Short Term"),
+            ("6mo", "6 Months - Recommended"),
+            ("1y", "1 Year - Long Term"),
+            ("2y", "2 Years - Very Long Term"),
+        ],
+        "input_title": "6 months is recommended - balances recent trends with historical context. Use shorter for day trading, longer for long-term investing.",
+        "hint": "Recommended: 6 Months (balances recent and historical data)",
+        "detail": "What to expect: Shorter = more sensitive to recent changes. Longer = more stable but may miss recent trends.",
+    },
+    {
+        "id": "compStopLossPct",
+        "label": "Stop Loss % (if using percentage)",
+        "label_title": "Stop Loss Percentage: Only used if 'Percentage' method is selected. This is the % drop from entry price where you'll exit.",
+        "tip": "Only used if Stop Loss Method is 'Percentage'. This is how much % drop from entry price triggers your stop loss. 2% is typical for stable stocks, 3-5% for volatile stocks.",
+        "default": "2.0", "step": "0.1", "min": "0.5", "max": "10.0",
+        "input_title": "Only used if Stop Loss Method is 'Percentage'. 2% for stable stocks, 3-5% for volatile stocks.",
+        "hint": "Recommended: 2.0% (stable stocks) or 3-5% (volatile stocks) | Range: 0.5-10.0%",
+        "detail": "What to expect: Lower % = tighter stop (exits faster). Higher % = wider stop (more room for price swings). Only used with Percentage method.",
+    },
+    {
+        "id": "accountValue",
+        "label": "Account Value ($)",
+        "label_title": "Account Value: Your total trading/investment account balance. Used to calculate how many shares you can safely buy.",
+        "tip": "Your total account balance. The analysis will calculate position size based on this. Enter your actual account value for accurate recommendations.",
+        "default": "10000", "step": "100", "min": "100",
+        "input_title": "Your total account balance. Used to calculate safe position size. Enter your actual account value.",
+        "hint": "Recommended: Your actual account balance | Minimum: $100",
+        "detail": "What to expect: The analysis will tell you exactly how many shares to buy based on this value and your risk tolerance.",
+    },
+    {
+        "id": "riskPerTrade",
+        "label": "Risk per Trade (%)",
+        "label_title": "Risk per Trade: What % of your account you're willing to risk on this single trade. Lower is safer. Professional traders use 1-2%.",
+        "tip": "What percentage of your account you're willing to risk on this trade. 1% is conservative (recommended for beginners), 2% is moderate, 3-5% is aggressive. Never risk more than 5% on a single trade.",
+        "default": "1.0", "step": "0.1", "min": "0.1", "max": "5.0",
+        "input_title": "1% is conservative (recommended), 2% is moderate, 3-5% is aggressive. Never exceed 5%.",
+        "hint": "Recommended: 1.0% (conservative) or 2.0% (moderate) | Range: 0.1-5.0%",
+        "detail": "What to expect: Lower % = smaller position size = less risk. With 1% risk on $10,000 account, you risk $100 max on this trade.",
+    },
+]
+
+_INDEX_HTML = _minify_html(_INDEX_TEMPLATE.render(comp_fields=_COMP_FIELDS))
+_INDEX_BYTES = _INDEX_HTML.encode("utf-8")
+# Compressed once here rather than per request; the ETag changes whenever the page does
+_INDEX_GZ = gzip.compress(_INDEX_BYTES, compresslevel=9)
+_INDEX_ETAG = hashlib.sha1(_INDEX_BYTES).hexdigest()
+
+def _index_variant(body, etag, encoding=None):
+    headers = {
+        'ETag': f'"{etag}"',
+        'Vary': 'Accept-Encoding',
+        # Always revalidate so UI changes show up immediately; an unchanged page costs a 304
+        'Cache-Control': 'no-cache',
+    }
+    if encoding:
+        headers['Content-Encoding'] = encoding
+    return body, etag, headers
+
+# (body, etag, headers) served by index(), keyed by whether the client accepts gzip
+_INDEX_VARIANTS = {
+    True: _index_variant(_INDEX_GZ, _INDEX_ETAG + "-gz", encoding='gzip'),
+    False: _index_variant(_INDEX_BYTES, _INDEX_ETAG),
+}
 
 @app.route('/')
 def index():
-    response = make_response(render_template_string(HTML_TEMPLATE))
-    # Disable caching to ensure fresh content
-    response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-    response.headers['Pragma'] = 'no-cache'
-    response.headers['Expires'] = '0'
+    body, etag, headers = _INDEX_VARIANTS["gzip" in request.headers.get("Accept-Encoding", "")]
+    if request.if_none_match.contains(etag):
+        return Response(status=304, headers=headers)
+    return Response(body, mimetype='text/html', headers=headers, direct_passthrough=True)
+
+# Analysis reports are several KB of prose inside JSON; smaller bodies aren't worth compressing
+_GZIP_MIN_SIZE = 500
+
+@app.after_request
+def _gzip_json(response):
+    """Gzip JSON responses for clients that accept it. Event streams and the index page are left alone."""
+    if response.mimetype != 'application/json' or response.direct_passthrough or response.is_streamed:
+        return response
+    response.vary.add('Accept-Encoding')
+    if 'Content-Encoding' in response.headers or "gzip" not in request.headers.get("Accept-Encoding", ""):
+        return response
+    body = response.get_data()
+    if len(body) >= _GZIP_MIN_SIZE:
+        response.set_data(gzip.compress(body, compresslevel=6))
+        response.headers['Content-Encoding'] = 'gzip'
     return response
 
 @app.route('/analyze', methods=['POST'])
 def analyze():
+    return _analyze(request.get_json(silent=True), _wants_event_stream())
+
+@app.route('/analyze/stream')
+def analyze_stream():
+    """/analyze for EventSource clients: parameters in the query string, always streamed."""
+    return _analyze(request.args.to_dict(), True)
+
+def _analyze(data, stream):
+    if not isinstance(data, dict):
+        return _bad_request("Request body must be a JSON object")
     try:
-        data = request.json
-        ticker = data.get('ticker', 'AAPL').upper()
-        model_type = data.get('model', 'gemini')
-        custom_query = data.get('query', '')
-        
-        # Select config file based on model
-        config_file = "GEMINI_CONFIG_LIST" if model_type == "gemini" else "OAI_CONFIG_LIST"
-        model_filter = ["gemini-2.5-flash"] if model_type == "gemini" else ["gpt-4o"]
-        
-        if not os.path.exists(config_file):
-            return jsonify({
-                "success": False,
-                "error": f"Config file {config_file} not found"
-            })
-        
-        # Configure LLM using new API (replaces deprecated config_list_from_json)
-        llm_config_obj = autogen.LLMConfig.from_json(
-            path=config_file,
-            filter_dict={"model": model_filter},
-        )
-        llm_config = {
-            "config_list": llm_config_obj.config_list,
-            "timeout": 120,
-            "temperature": 0,
-        }
-        
-        # Create agent
-        assistant = SingleAssistant(
-            "Market_Analyst",
-            llm_config,
-            human_input_mode="NEVER",
-            max_consecutive_auto_reply=10,
+        ticker = _ticker_field(data)
+        model_type = _choice_field(data, 'model', 'gemini', _MODELS)
+        custom_query = str(data.get('query') or '')
+        if len(custom_query) > _MAX_QUERY_LENGTH:
+            raise ValueError(f"query must be at most {_MAX_QUERY_LENGTH} characters")
+    except ValueError as e:
+        return _bad_request(str(e))
+    
+    try:
+        # ?force_refresh=1 runs the analysis again instead of returning today's stored report
+        refresh = request.args.get('force_refresh') == '1'
+        today = get_current_date()
+        cache_key = _result_key("analyze", [ticker, model_type, custom_query, today])
+        compute = lambda progress: _shared_result(
+            cache_key,
+            lambda: _market_analysis_report(cache_key, today, ticker, model_type, custom_query, refresh, progress),
+            refresh=refresh,
         )
+        if stream:
+            return _event_stream(compute, tokens=True)
+        result_text = compute(_ignore_progress)
         
-        # Build query
-        if custom_query:
-            message = custom_query
-        else:
-            message = (
-                f"Use all the tools provided to retrieve information available for {ticker} "
-                f"upon {get_current_date()}. Analyze the positive developments and potential "
-                f"concerns of {ticker} with 2-4 most important factors respectively and keep "
-                f"them concise. Most factors should be inferred from company related news. "
-                f"Then make a rough prediction (e.g. up/down by 2-3%) of the {ticker} stock "
-                f"price movement for next week. Provide a summary analysis to support your prediction."
-            )
-        
-        # Run analysis using initiate_chat directly so we can access messages before reset
-        from autogen.cache import Cache
-        
-        result_text = "Analysis completed."
-        
+        return jsonify({
+            "success": True,
+            "result": result_text
+        })
+            
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        })
+
+def _market_analysis_report(cache_key, day, ticker, model_type, custom_query, refresh, progress):
+    """Today's stored /analyze report, or a fresh Market_Analyst run (then stored); returns (report, cacheable)."""
+    if not refresh:
+        stored = _load_report(cache_key)
+        if stored is not None:
+            return stored, True
+    result = _run_market_analysis(ticker, model_type, custom_query, progress)
+    # Neither the placeholder for a chat without a reply nor an empty reply is worth remembering
+    if not result or result == "Analysis completed.":
+        return result, False
+    _save_report(cache_key, day, result)
+    return result, True
+
+def _run_market_analysis(ticker, model_type, custom_query, progress=_ignore_progress):
+    """Run the Market_Analyst chat for /analyze and return its final reply."""
+    # Select config file based on model
+    config_file = "GEMINI_CONFIG_LIST" if model_type == "gemini" else "OAI_CONFIG_LIST"
+    model_filter = ["gemini-2.5-flash"] if model_type == "gemini" else ["gpt-4o"]
+    
+    if not os.path.exists(config_file):
+        raise RuntimeError(f"Config file {config_file} not found")
+    
+    # Build query
+    if custom_query:
+        message = custom_query
+    else:
+        message = _MARKET_ANALYSIS_PROMPT.format(ticker=ticker, date=get_current_date())
+    
+    # Run analysis using initiate_chat directly so we can access messages before reset
+    from autogen.cache import Cache
+    
+    result_text = "Analysis completed."
+    
+    # The agent comes from the pool and is reset when it goes back, on success or error
+    with _pooled_assistant("Market_Analyst", config_file, model_filter, 10, progress) as assistant:
         try:
             # Use initiate_chat directly instead of chat() so we can access messages before reset
             with Cache.disk() as cache:
@@ -1044,45 +864,69 @@ def analyze():
                 if result_text == "Analysis completed." and messages:
                     result_text = messages[-1].get("content", "Analysis completed.")
             
-            # Now reset (like chat() does)
-            assistant.reset()
-            
-            return jsonify({
-                "success": True,
-                "result": result_text
-            })
+            return result_text
         except Exception as chat_error:
-            # Reset on error too
-            try:
-                assistant.reset()
-            except:
-                pass
-            return jsonify({
-                "success": False,
-                "error": f"Error during analysis: {str(chat_error)}"
-            })
-            
+            raise RuntimeError(f"Error during analysis: {str(chat_error)}") from chat_error
+
+@app.route('/trading-strategy', methods=['POST'])
+def trading_strategy():
+    """Endpoint for trading strategy analysis (entry, stop loss, target price)"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return _bad_request("Request body must be a JSON object")
+    try:
+        ticker = _ticker_field(data)
+        risk_reward = _number_field(data, 'riskReward', 2.0, 1.0, 5.0)
+        stop_loss_method = _choice_field(data, 'stopLossMethod', 'atr', _STOP_LOSS_METHODS)
+        period = _choice_field(data, 'period', '6mo', _PERIODS)
+        stop_loss_pct = _number_field(data, 'stopLossPct', 2.0, 0.5, 10.0)
+        run_backtest = bool(data.get('runBacktest', False))
+    except ValueError as e:
+        return _bad_request(str(e))
+    
+    try:
+        cache_key = _result_key(
+            "trading-strategy",
+            [ticker, risk_reward, stop_loss_method, period, stop_loss_pct, run_backtest],
+        )
+        compute = lambda progress: _shared_result(
+            cache_key,
+            lambda: _trading_strategy_report(
+                ticker, risk_reward, stop_loss_method, period, stop_loss_pct, run_backtest, progress
+            ),
+        )
+        if _wants_event_stream():
+            return _event_stream(compute)
+        result = compute(_ignore_progress)
+        
+        return jsonify({
+            "success": True,
+            "result": result
+        })
+        
     except Exception as e:
         return jsonify({
             "success": False,
             "error": str(e)
         })
 
-@app.route('/trading-strategy', methods=['POST'])
-def trading_strategy():
-    """Endpoint for trading strategy analysis (entry, stop loss, target price)"""
+def _trading_strategy_report(ticker, risk_reward, stop_loss_method, period, stop_loss_pct, run_backtest,
+                             progress=_ignore_progress):
+    """Build the /trading-strategy report; returns (report, cacheable)."""
+    from finrobot.functional.quantitative import DataFetchError, TradingStrategyAnalyzer
+    
+    # Backtest over the last 6 months; fetch that window while the analysis runs
+    if run_backtest:
+        backtest_end = datetime.now().strftime('%Y-%m-%d')
+        backtest_start = (datetime.now() - timedelta(days=180)).strftime('%Y-%m-%d')
+        backtest_prefetch = _warm_cache(ticker, start=backtest_start, end=backtest_end)
+    
+    # Call the trading strategy analyzer; the backtest reads its price levels from the
+    # structured result instead of parsing them back out of the report
+    progress(f"Computing entry, stop loss and target for {ticker}...")
     try:
-        data = request.json
-        ticker = data.get('ticker', 'AAPL').upper()
-        risk_reward = float(data.get('riskReward', 2.0))
-        stop_loss_method = data.get('stopLossMethod', 'atr')
-        period = data.get('period', '6mo')
-        stop_loss_pct = float(data.get('stopLossPct', 2.0))
-        run_backtest = data.get('runBacktest', False)
-        
-        # Call the trading strategy analyzer
-        result = TradingStrategyAnalyzer.analyze_trading_opportunity(
-            ticker_symbol=ticker,
+        analysis = TradingStrategyAnalyzer.analyze_trading_opportunity_raw(
+            ticker,
             period=period,
             risk_reward_ratio=risk_reward,
             stop_loss_method=stop_loss_method,
@@ -1090,46 +934,85 @@ def trading_strategy():
             atr_multiplier=2.0,
             use_advanced_indicators=True
         )
-        
-        # If backtesting is requested, extract prices and run backtest
-        if run_backtest:
-            try:
-                # Parse entry, stop loss, and target prices from result
-                import re
-                entry_match = re.search(r'Entry Price: \$([\d.]+)', result)
-                stop_match = re.search(r'Stop Loss: \$([\d.]+)', result)
-                target_match = re.search(r'Target Price: \$([\d.]+)', result)
-                
-                if entry_match and stop_match and target_match:
-                    entry_price = float(entry_match.group(1))
-                    stop_loss = float(stop_match.group(1))
-                    target_price = float(target_match.group(1))
-                    
-                    # Calculate backtest period (use last 6 months for backtest)
-                    from datetime import datetime, timedelta
-                    end_date = datetime.now()
-                    start_date = end_date - timedelta(days=180)  # 6 months
-                    
-                    backtest_result = TradingStrategyAnalyzer.backtest_strategy_recommendations(
-                        ticker_symbol=ticker,
-                        start_date=start_date.strftime('%Y-%m-%d'),
-                        end_date=end_date.strftime('%Y-%m-%d'),
-                        entry_price=entry_price,
-                        stop_loss=stop_loss,
-                        target_price=target_price,
-                        use_advanced_indicators=True
-                    )
-                    
-                    result += "\n\n" + "="*60 + "\n"
-                    result += "BACKTESTING RESULTS\n"
-                    result += "="*60 + "\n"
-                    result += backtest_result
-            except Exception as backtest_error:
-                result += f"\n\n⚠️ Backtesting failed: {str(backtest_error)}"
+    except DataFetchError as e:
+        return str(e), False
+    except Exception as e:
+        return f"Error analyzing {ticker}: {str(e)}", False
+    result = analysis.format()
+    
+    # If backtesting is requested, run it with the recommended levels
+    if run_backtest:
+        try:
+            progress(result)
+            progress(f"Backtesting {backtest_start} to {backtest_end}...")
+            backtest_prefetch.result()
+            backtest_result = _backtest_in_worker(
+                ticker, backtest_start, backtest_end,
+                analysis.entry_price, analysis.stop_loss, analysis.target_price
+            )
+            
+            result += "\n\n" + "="*60 + "\n"
+            result += "BACKTESTING RESULTS\n"
+            result += "="*60 + "\n"
+            result += backtest_result
+        except Exception as backtest_error:
+            result += f"\n\n⚠️ Backtesting failed: {str(backtest_error)}"
+    
+    return result, True
+
+@app.route('/comprehensive-analysis', methods=['POST'])
+def comprehensive_analysis():
+    """Endpoint for comprehensive analysis combining technical analysis, company research, and forecasts"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return _bad_request("Request body must be a JSON object")
+    try:
+        ticker = _ticker_field(data)
+        risk_reward = _number_field(data, 'riskReward', 2.0, 1.0, 5.0)
+        stop_loss_method = _choice_field(data, 'stopLossMethod', 'atr', _STOP_LOSS_METHODS)
+        period = _choice_field(data, 'period', '6mo', _PERIODS)
+        stop_loss_pct = _number_field(data, 'stopLossPct', 2.0, 0.5, 10.0)
+        account_value = _number_field(data, 'accountValue', 10000.0, 100.0, 1e12)
+        risk_per_trade = _number_field(data, 'riskPerTrade', 1.0, 0.1, 5.0)
+        include_research = bool(data.get('includeResearch', True))
+        model_type = _choice_field(data, 'model', 'gemini', _MODELS)
+    except ValueError as e:
+        return _bad_request(str(e))
+    
+    try:
+        cache_key = _result_key(
+            "comprehensive-analysis",
+            [ticker, risk_reward, stop_loss_method, period, stop_loss_pct,
+             account_value, risk_per_trade, include_research, model_type],
+        )
+        compute = lambda progress: _shared_result(
+            cache_key,
+            lambda: _comprehensive_report(
+                ticker, risk_reward, stop_loss_method, period, stop_loss_pct,
+                account_value, risk_per_trade, include_research, model_type, progress
+            ),
+        )
+        analysis_params = {
+            "risk_reward": risk_reward,
+            "stop_loss_method": stop_loss_method,
+            "period": period,
+            "stop_loss_pct": stop_loss_pct,
+            "account_value": account_value,
+            "risk_per_trade": risk_per_trade
+        }
+        if _wants_event_stream():
+            return _event_stream(
+                compute,
+                lambda result: {"session_id": _start_session(ticker, analysis_params, result)["session_id"]},
+                tokens=include_research,
+            )
+        result = compute(_ignore_progress)
+        session = _start_session(ticker, analysis_params, result)
         
         return jsonify({
             "success": True,
-            "result": result
+            "result": result,
+            "session_id": session["session_id"]
         })
         
     except Exception as e:
@@ -1138,64 +1021,58 @@ def trading_strategy():
             "error": str(e)
         })
 
-@app.route('/comprehensive-analysis', methods=['POST'])
-def comprehensive_analysis():
-    """Endpoint for comprehensive analysis combining technical analysis, company research, and forecasts"""
-    try:
-        data = request.json
-        ticker = data.get('ticker', 'AAPL').upper()
-        risk_reward = float(data.get('riskReward', 2.0))
-        stop_loss_method = data.get('stopLossMethod', 'atr')
-        period = data.get('period', '6mo')
-        stop_loss_pct = float(data.get('stopLossPct', 2.0))
-        account_value = float(data.get('accountValue', 10000.0))
-        risk_per_trade = float(data.get('riskPerTrade', 1.0))
-        include_research = data.get('includeResearch', True)
-        model_type = data.get('model', 'gemini')
-        
-        # Get company research if requested
-        company_research = None
-        if include_research:
-            try:
-                # Select config file based on model
-                config_file = "GEMINI_CONFIG_LIST" if model_type == "gemini" else "OAI_CONFIG_LIST"
-                model_filter = ["gemini-2.5-flash"] if model_type == "gemini" else ["gpt-4o"]
+def _start_session(ticker, analysis_params, result):
+    """Initialize a chat session around a finished comprehensive analysis."""
+    session = get_or_create_session()
+    session["ticker"] = ticker
+    session["analysis_params"] = analysis_params
+    session["last_analysis"] = result
+    session["last_analysis_head"] = result[:500] + "..."
+    session["conversation_history"] = []
+    return session
+
+def _comprehensive_report(ticker, risk_reward, stop_loss_method, period, stop_loss_pct,
+                          account_value, risk_per_trade, include_research, model_type,
+                          progress=_ignore_progress):
+    """Build the /comprehensive-analysis report (with optional AI research); returns (report, cacheable)."""
+    from finrobot.functional.quantitative import TradingStrategyAnalyzer
+    
+    analysis_kwargs = dict(
+        ticker_symbol=ticker,
+        period=period,
+        risk_reward_ratio=risk_reward,
+        stop_loss_method=stop_loss_method,
+        stop_loss_percentage=stop_loss_pct,
+        account_value=account_value,
+        risk_per_trade_pct=risk_per_trade,
+    )
+    
+    # The technical analysis doesn't depend on the research: run it while the (slow) research
+    # chat runs, which also leaves the price history and indicators cached for the final report
+    technical_report = None
+    if include_research:
+        progress(f"Computing technical analysis for {ticker}...")
+        technical_report = _PREFETCH_POOL.submit(TradingStrategyAnalyzer.comprehensive_analysis, **analysis_kwargs)
+    
+    # Get company research if requested
+    company_research = None
+    if include_research:
+        try:
+            # Select config file based on model
+            config_file = "GEMINI_CONFIG_LIST" if model_type == "gemini" else "OAI_CONFIG_LIST"
+            model_filter = ["gemini-2.5-flash"] if model_type == "gemini" else ["gpt-4o"]
+            
+            if os.path.exists(config_file):
+                progress(f"Researching {ticker}...")
+                
+                # Build research query
+                research_message = _RESEARCH_PROMPT.format(ticker=ticker, date=get_current_date())
+                
+                # Run research with a pooled agent for company research
+                from autogen.cache import Cache
+                research_text = "Company research completed."
                 
-                if os.path.exists(config_file):
-                    # Configure LLM
-                    llm_config_obj = autogen.LLMConfig.from_json(
-                        path=config_file,
-                        filter_dict={"model": model_filter},
-                    )
-                    llm_config = {
-                        "config_list": llm_config_obj.config_list,
-                        "timeout": 120,
-                        "temperature": 0,
-                    }
-                    
-                    # Create agent for company research
-                    assistant = SingleAssistant(
-                        "Company_Researcher",
-                        llm_config,
-                        human_input_mode="NEVER",
-                        max_consecutive_auto_reply=5,
-                    )
-                    
-                    # Build research query
-                    research_message = (
-                        f"Use all the tools provided to retrieve information available for {ticker} "
-                        f"upon {get_current_date()}. Analyze and explain:\n"
-                        f"1. Why is the stock price rising or falling? (Based on recent news, earnings, and market conditions)\n"
-                        f"2. Is the company healthy? (Analyze financial health, growth prospects, competitive position)\n"
-                        f"3. What are the main positive developments? (2-3 key factors)\n"
-                        f"4. What are the main concerns or risks? (2-3 key factors)\n"
-                        f"Keep the analysis concise and focused on actionable insights. Most factors should be inferred from company-related news and financial data."
-                    )
-                    
-                    # Run research
-                    from autogen.cache import Cache
-                    research_text = "Company research completed."
-                    
+                with _pooled_assistant("Company_Researcher", config_file, model_filter, 5, progress) as assistant:
                     try:
                         with Cache.disk() as cache:
                             assistant.user_proxy.initiate_chat(
@@ -1214,56 +1091,27 @@ def comprehensive_analysis():
                             if research_text == "Company research completed." and messages:
                                 research_text = messages[-1].get("content", "Company research completed.")
                         
-                        assistant.reset()
                         company_research = research_text
                     except Exception as research_error:
                         # If research fails, continue without it
                         company_research = f"⚠️ Company research unavailable: {str(research_error)}"
-                        try:
-                            assistant.reset()
-                        except:
-                            pass
-            except Exception as e:
-                # If research setup fails, continue without it
-                company_research = f"⚠️ Company research unavailable: {str(e)}"
-        
-        # Call comprehensive analysis
-        result = TradingStrategyAnalyzer.comprehensive_analysis(
-            ticker_symbol=ticker,
-            period=period,
-            risk_reward_ratio=risk_reward,
-            stop_loss_method=stop_loss_method,
-            stop_loss_percentage=stop_loss_pct,
-            account_value=account_value,
-            risk_per_trade_pct=risk_per_trade,
-            company_research=company_research
-        )
-        
-        # Initialize or update session
-        session = get_or_create_session()
-        session["ticker"] = ticker
-        session["analysis_params"] = {
-            "risk_reward": risk_reward,
-            "stop_loss_method": stop_loss_method,
-            "period": period,
-            "stop_loss_pct": stop_loss_pct,
-            "account_value": account_value,
-            "risk_per_trade": risk_per_trade
-        }
-        session["last_analysis"] = result
-        session["conversation_history"] = []
-        
-        return jsonify({
-            "success": True,
-            "result": result,
-            "session_id": session["session_id"]
-        })
-        
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        })
+        except Exception as e:
+            # If research setup fails, continue without it
+            company_research = f"⚠️ Company research unavailable: {str(e)}"
+    
+    # Call comprehensive analysis
+    if technical_report is None:
+        progress(f"Computing technical analysis for {ticker}...")
+        result = TradingStrategyAnalyzer.comprehensive_analysis(**analysis_kwargs)
+    else:
+        result = technical_report.result()
+        if company_research and not result.startswith("Error"):
+            # Same analysis with the research section added; only formatting work is left
+            result = TradingStrategyAnalyzer.comprehensive_analysis(
+                **analysis_kwargs, company_research=company_research
+            )
+    # Don't pin error reports or a report whose research step failed
+    return result, not result.startswith("Error") and not (company_research or "").startswith("⚠️")
 
 @app.route('/static/charts/<path:filename>')
 def serve_chart(filename):
@@ -1281,6 +1129,8 @@ def serve_chart(filename):
 @app.route('/chat', methods=['POST'])
 def chat():
     """Handle chat messages from the trading agent."""
+    from finrobot.agents.trading_chat_agent import create_trading_chat_agent, process_chat_message
+    
     try:
         cleanup_old_sessions()  # Clean up old sessions periodically
         
@@ -1316,16 +1166,8 @@ def chat():
                 "error": f"Config file {config_file} not found"
             })
         
-        # Configure LLM
-        llm_config_obj = autogen.LLMConfig.from_json(
-            path=config_file,
-            filter_dict={"model": model_filter},
-        )
-        llm_config = {
-            "config_list": llm_config_obj.config_list,
-            "timeout": 120,
-            "temperature": 0.7,  # Slightly higher for more conversational responses
-        }
+        # Configure LLM (slightly higher temperature for more conversational responses)
+        llm_config = _build_llm_config(config_file, model_filter, temperature=0.7)
         
         # Initialize agent_context if not exists
         if "agent_context" not in session:
@@ -1337,8 +1179,9 @@ def chat():
                 llm_config=llm_config,
                 ticker=session["ticker"],
                 analysis_params=session["analysis_params"],
-                last_analysis=session["last_analysis"][:1000],  # First 1000 chars for context
-                conversation_history=session["conversation_history"][-10:]  # Last 10 messages
+                last_analysis_head=session["last_analysis_head"],
+                # The 10 messages before the current one, which process_chat_message sends itself
+                conversation_history=session["conversation_history"][-11:-1]
             )
             session["agent_context"]["agent"] = agent
         else:
@@ -1414,6 +1257,8 @@ def chat():
 @app.route('/chat/confirm-params', methods=['POST'])
 def confirm_params():
     """Handle parameter change confirmations."""
+    from finrobot.functional.quantitative import TradingStrategyAnalyzer
+    
     try:
         data = request.json
         session_id = data.get('session_id')
@@ -1449,6 +1294,7 @@ def confirm_params():
                 )
                 
                 session["last_analysis"] = result
+                session["last_analysis_head"] = result[:500] + "..."
                 
                 # Remove confirmation
                 if confirmation_id in session["agent_context"].get("pending_confirmations", {}):
@@ -1474,17 +1320,45 @@ def confirm_params():
         })
 
 if __name__ == '__main__':
+    import shutil
     import sys
     
     # Allow port to be specified as command line argument
     port = int(sys.argv[1]) if len(sys.argv) > 1 else 8250
+    production = os.environ.get("WEB_PRODUCTION") == "1"
     
     print("=" * 60)
     print("FinRobot Web Interface")
     print("=" * 60)
+    
+    if production:
+        gunicorn = shutil.which("gunicorn")
+        if gunicorn:
+            workers = os.environ.get("WEB_WORKERS", "1")
+            threads = os.environ.get("WEB_THREADS", "32")
+            print(f"\n🌐 Starting gunicorn on port {port} ({workers} worker(s) x {threads} threads)...")
+            print(f"📱 Open your browser and go to: http://localhost:{port}\n")
+            sys.stdout.flush()
+            # Replaces this process; gunicorn imports the module again in its worker.
+            # gthread workers keep heartbeating while their threads wait on the LLM, so
+            # the default worker timeout doesn't cut long analyses short.
+            os.execv(gunicorn, [
+                "gunicorn", "--workers", workers, "--worker-class", "gthread", "--threads", threads,
+                "--bind", f"0.0.0.0:{port}", "web_interface:production_app()",
+            ])
+        print("\n⚠ WEB_PRODUCTION=1 but gunicorn is not installed (pip install gunicorn);")
+        print("  falling back to the threaded development server without debug mode")
+    
     print(f"\n🌐 Starting web server on port {port}...")
     print(f"📱 Open your browser and go to: http://localhost:{port}")
     print("🛑 Press Ctrl+C to stop the server")
     print("💡 TIP: If you see old UI, do a hard refresh: Ctrl+Shift+R (Windows/Linux) or Cmd+Shift+R (Mac)\n")
-    app.run(host='0.0.0.0', port=port, debug=True)  # Enable debug mode for auto-reload
+    # With debug on, this process only runs the reloader; the server runs in its child
+    if production or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        _start_llm_warmup()
+        _start_agent_prewarm()
+    # Threaded so a long analysis doesn't block other requests
+    # The index page is rendered at import, so also restart when its template changes
+    app.run(host='0.0.0.0', port=port, debug=not production, threaded=True,  # Debug mode for auto-reload
+            extra_files=[_INDEX_TEMPLATE_PATH])
 